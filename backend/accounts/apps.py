@@ -1,6 +1,16 @@
 from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete
 
 
 class AccountsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "accounts"
+
+    def ready(self):
+        from . import favorites
+        from .models import User
+
+        m2m_changed.connect(
+            favorites.favorite_teams_changed, sender=User.favorite_teams.through
+        )
+        post_delete.connect(favorites.user_deleted, sender=User)
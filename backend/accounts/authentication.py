@@ -0,0 +1,76 @@
+"""
+JWT 인증 - 요청마다 User 행을 조회하지 않는 버전
+- 토큰의 user_id 클레임만으로 request.user 를 만들고, 다른 속성이 필요할 때만 1번 조회
+- 응원 팀 ID 는 accounts.favorites 캐시에서 조회
+- 토큰 자체를 믿으므로 비활성화/삭제된 사용자의 토큰도 만료(ACCESS_TOKEN_LIFETIME) 전까지 통과
+"""
+
+from django.contrib.auth import get_user_model
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from . import favorites
+
+User = get_user_model()
+
+
+class StatelessUser:
+    """
+    토큰 사용자 (pk / is_authenticated 는 DB 조회 없음)
+    그 밖의 속성 읽기/쓰기는 실제 User 인스턴스로 전달
+    """
+
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, user_id):
+        # 토큰 클레임은 문자열일 수 있음 → User.pk 와 같은 타입으로 (캐시 키 일치)
+        user_id = User._meta.get_field(api_settings.USER_ID_FIELD).to_python(user_id)
+        object.__setattr__(self, "pk", user_id)
+        object.__setattr__(self, "id", user_id)
+        object.__setattr__(self, "_user", None)
+
+    def get_user(self):
+        """실제 User 인스턴스 (처음 호출 시 조회)"""
+        if self._user is None:
+            try:
+                user = User.objects.get(**{api_settings.USER_ID_FIELD: self.pk})
+            except User.DoesNotExist as e:
+                raise AuthenticationFailed(
+                    "사용자를 찾을 수 없습니다.", code="user_not_found"
+                ) from e
+            object.__setattr__(self, "_user", user)
+        return self._user
+
+    def __getattr__(self, name):
+        return getattr(self.get_user(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.get_user(), name, value)
+
+    def __eq__(self, other):
+        return isinstance(other, (StatelessUser, User)) and other.pk == self.pk
+
+    def __hash__(self):
+        return hash(self.pk)
+
+    def __str__(self):
+        return str(self.get_user())
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication 과 같은 토큰 검증, 사용자 조회만 생략"""
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken("토큰에 사용자 정보가 없습니다.") from e
+        return StatelessUser(user_id)
+
+
+def favorite_team_ids(user, fresh=False):
+    """request.user(StatelessUser 또는 세션 인증 User)의 응원 팀 ID 목록"""
+    return favorites.get_team_ids(user.pk, fresh=fresh)
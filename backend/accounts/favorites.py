@@ -0,0 +1,60 @@
+"""
+응원 팀 ID 캐시 (프로세스 내, 짧은 TTL)
+- 읽기 전용 응원 팀/대시보드 API 가 요청마다 사용자 테이블을 조회하지 않도록 사용
+- 응원 팀 추가/제거(m2m_changed), 사용자 삭제 시 해당 사용자 항목을 바로 무효화
+- 다른 프로세스의 변경은 TTL(FAVORITE_TEAMS_CACHE_TTL) 안에 반영
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+
+User = get_user_model()
+
+_cache = {}  # user_id → (만료 시각, 응원 팀 team_id 튜플)
+_lock = threading.Lock()
+
+
+def get_team_ids(user_id, fresh=False):
+    """사용자의 응원 팀 team_id 목록 (추가한 순서, fresh=True 면 DB 에서 다시 읽음)"""
+    now = time.monotonic()
+    entry = _cache.get(user_id)
+    if not fresh and entry is not None and entry[0] > now:
+        return list(entry[1])
+
+    team_ids = tuple(
+        User.favorite_teams.through.objects.filter(user_id=user_id)
+        .order_by("pk")
+        .values_list("team__team_id", flat=True)
+    )
+    with _lock:
+        _cache[user_id] = (now + settings.FAVORITE_TEAMS_CACHE_TTL, team_ids)
+    return list(team_ids)
+
+
+def invalidate(user_ids=None):
+    """캐시 무효화 (user_ids=None 이면 전체)"""
+    with _lock:
+        if user_ids is None:
+            _cache.clear()
+        else:
+            for user_id in user_ids:
+                _cache.pop(user_id, None)
+
+
+def favorite_teams_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """m2m_changed (User.favorite_teams) 수신"""
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        invalidate([instance.pk])
+    else:
+        # team.fans.add/remove/clear → pk_set 은 사용자 pk (clear 는 None)
+        invalidate(pk_set if action != "post_clear" else None)
+
+
+def user_deleted(sender, instance, **kwargs):
+    """post_delete (User) 수신"""
+    invalidate([instance.pk])
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0002_user_favorite_teams"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("teams", "0003_updated_at_indexes"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("social_provider", ""), _negated=True),
+                fields=("social_provider", "social_id"),
+                name="unique_social_account",
+            ),
+        ),
+    ]
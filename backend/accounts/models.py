@@ -35,6 +35,14 @@ class User(AbstractUser):
     class Meta:
         verbose_name = "사용자"
         verbose_name_plural = "사용자들"
+        constraints = [
+            # 소셜 로그인 upsert (accounts/oauth.py) 의 ON CONFLICT 대상
+            models.UniqueConstraint(
+                fields=["social_provider", "social_id"],
+                condition=~models.Q(social_provider=""),
+                name="unique_social_account",
+            ),
+        ]
 
     def __str__(self):
         return self.username
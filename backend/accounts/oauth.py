@@ -0,0 +1,103 @@
+"""
+소셜 로그인 (OAuth) 공통 처리
+- 이벤트 루프별로 공유하는 httpx.AsyncClient (연결 풀 + connect/read 타임아웃)
+- 소셜 계정 사용자 조회/생성을 INSERT ... ON CONFLICT ... RETURNING 쿼리 1번으로 처리
+"""
+
+import asyncio
+import weakref
+
+import httpx
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+
+User = get_user_model()
+
+_clients = weakref.WeakKeyDictionary()
+
+
+class OAuthError(Exception):
+    """제공자 응답 오류 (status: 클라이언트에 돌려줄 HTTP 상태)"""
+
+    def __init__(self, message, status=502):
+        super().__init__(message)
+        self.status = status
+
+
+def get_client():
+    """현재 이벤트 루프의 공유 클라이언트 (연결은 루프에 묶이므로 루프별로 생성)"""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                settings.OAUTH_READ_TIMEOUT, connect=settings.OAUTH_CONNECT_TIMEOUT
+            ),
+            limits=httpx.Limits(
+                max_connections=settings.OAUTH_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.OAUTH_MAX_CONNECTIONS,
+            ),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def _request(method, url, **kwargs):
+    try:
+        response = await get_client().request(method, url, **kwargs)
+        response.raise_for_status()
+        return response.json()
+    except httpx.TimeoutException as e:
+        raise OAuthError("소셜 로그인 서버 응답 시간이 초과되었습니다.", 504) from e
+    except (httpx.HTTPError, ValueError) as e:
+        raise OAuthError("소셜 로그인 서버 요청에 실패했습니다.") from e
+
+
+async def fetch_user_info(provider, token_data):
+    """인가 코드 → 액세스 토큰 → 사용자 정보 (JSON)"""
+    urls = settings.OAUTH_PROVIDERS[provider]
+
+    token_json = await _request("POST", urls["token_url"], data=token_data)
+    access_token = token_json.get("access_token")
+    if not access_token:
+        raise OAuthError("액세스 토큰을 받지 못했습니다.", 400)
+
+    headers = {"Authorization": f"Bearer {access_token}"}
+    return await _request("GET", urls["user_info_url"], headers=headers)
+
+
+def upsert_social_user(provider, social_id, defaults):
+    """
+    (provider, social_id) 사용자를 가져오거나 생성 - DB 왕복 1번
+    기존 사용자는 그대로 두고(get_or_create 와 동일) 행만 반환
+    """
+    user = User(social_provider=provider, social_id=social_id, **defaults)
+    user.set_unusable_password()
+
+    fields = [
+        field
+        for field in User._meta.concrete_fields
+        if not field.primary_key and not field.many_to_many
+    ]
+    values = [
+        field.get_db_prep_save(field.pre_save(user, add=True), connection)
+        for field in fields
+    ]
+
+    quote = connection.ops.quote_name
+    columns = ", ".join(quote(field.column) for field in fields)
+    placeholders = ", ".join(["%s"] * len(fields))
+    provider_column = quote("social_provider")
+    social_id_column = quote("social_id")
+
+    # 조건은 accounts.User 의 unique_social_account 부분 인덱스와 같아야 함
+    sql = (
+        f"INSERT INTO {quote(User._meta.db_table)} ({columns}) "
+        f"VALUES ({placeholders}) "
+        f"ON CONFLICT ({provider_column}, {social_id_column}) "
+        f"WHERE NOT ({provider_column} = '') "
+        f"DO UPDATE SET {social_id_column} = EXCLUDED.{social_id_column} "
+        f"RETURNING *"
+    )
+    return next(iter(User.objects.raw(sql, values)))
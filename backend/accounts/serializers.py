@@ -21,7 +21,7 @@ class UserSerializer(serializers.ModelSerializer):
     """사용자 정보 시리얼라이저"""
 
     favorite_teams = FavoriteTeamSerializer(many=True, read_only=True)
-    favorite_teams_count = serializers.IntegerField(read_only=True)
+    favorite_teams_count = serializers.SerializerMethodField()
 
     class Meta:
         model = User
@@ -38,6 +38,10 @@ class UserSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "created_at", "social_provider"]
 
+    def get_favorite_teams_count(self, obj):
+        # prefetch_related("favorite_teams") 결과 재사용 (COUNT 쿼리 없음)
+        return len(obj.favorite_teams.all())
+
 
 class UserRegisterSerializer(serializers.ModelSerializer):
     """회원가입 시리얼라이저"""
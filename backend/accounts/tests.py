@@ -1 +1,186 @@
-# Create your tests here.
+import asyncio
+from unittest import mock
+
+import httpx
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.test import SimpleTestCase, TestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from teams.models import Team
+
+from . import favorites, oauth
+from .authentication import StatelessUser
+
+User = get_user_model()
+
+NAVER_PROFILE = {
+    "response": {"id": "42", "email": "fan@example.com", "nickname": "fan"}
+}
+
+
+class UpsertSocialUserTests(TestCase):
+    """(provider, social_id) 사용자 조회/생성 - INSERT ... ON CONFLICT 1번"""
+
+    def defaults(self, **fields):
+        return {"username": "naver_42", "email": "fan@example.com", **fields}
+
+    def test_creates_then_returns_existing(self):
+        user = oauth.upsert_social_user("naver", "42", self.defaults(nickname="fan"))
+        self.assertEqual(user.social_provider, "naver")
+        self.assertFalse(user.has_usable_password())
+
+        again = oauth.upsert_social_user("naver", "42", self.defaults(nickname="new"))
+        self.assertEqual(again.pk, user.pk)
+        self.assertEqual(again.nickname, "fan")  # 기존 사용자는 그대로
+        self.assertEqual(User.objects.count(), 1)
+
+    def test_same_social_id_on_other_provider_is_another_user(self):
+        oauth.upsert_social_user("naver", "42", self.defaults())
+        other = oauth.upsert_social_user(
+            "google", "42", {"username": "google_42", "email": "g@example.com"}
+        )
+        self.assertEqual(other.social_provider, "google")
+        self.assertEqual(User.objects.count(), 2)
+
+    def test_email_taken_by_normal_account(self):
+        User.objects.create_user("someone", "fan@example.com", "pw")
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            oauth.upsert_social_user("naver", "42", self.defaults())
+
+
+class FetchUserInfoTests(SimpleTestCase):
+    """제공자 API 호출 (httpx.MockTransport)"""
+
+    def run_fetch(self, handler):
+        async def fetch():
+            loop = asyncio.get_running_loop()
+            oauth._clients[loop] = httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+            try:
+                return await oauth.fetch_user_info("naver", {"code": "abc"})
+            finally:
+                await oauth._clients.pop(loop).aclose()
+
+        return asyncio.run(fetch())
+
+    def test_token_then_profile(self):
+        def handler(request):
+            if request.method == "POST":
+                return httpx.Response(200, json={"access_token": "token"})
+            self.assertEqual(request.headers["Authorization"], "Bearer token")
+            return httpx.Response(200, json=NAVER_PROFILE)
+
+        self.assertEqual(self.run_fetch(handler), NAVER_PROFILE)
+
+    def test_missing_access_token(self):
+        with self.assertRaises(oauth.OAuthError) as error:
+            self.run_fetch(lambda request: httpx.Response(200, json={}))
+        self.assertEqual(error.exception.status, 400)
+
+    def test_provider_error(self):
+        with self.assertRaises(oauth.OAuthError) as error:
+            self.run_fetch(lambda request: httpx.Response(500))
+        self.assertEqual(error.exception.status, 502)
+
+    def test_timeout(self):
+        def handler(request):
+            raise httpx.ReadTimeout("slow", request=request)
+
+        with self.assertRaises(oauth.OAuthError) as error:
+            self.run_fetch(handler)
+        self.assertEqual(error.exception.status, 504)
+
+
+class SocialCallbackTests(TestCase):
+    """/api/accounts/naver/callback/"""
+
+    def get(self, **params):
+        return self.client.get(
+            "/api/accounts/naver/callback/", params, HTTP_HOST="localhost"
+        )
+
+    def test_missing_code(self):
+        self.assertEqual(self.get().status_code, 400)
+
+    @mock.patch("accounts.views.fetch_user_info", new_callable=mock.AsyncMock)
+    def test_login_creates_user_once(self, fetch_user_info):
+        fetch_user_info.return_value = NAVER_PROFILE
+        first = self.get(code="abc").json()
+        second = self.get(code="abc").json()
+        self.assertEqual(first["user"]["id"], second["user"]["id"])
+        self.assertIn("access", first["tokens"])
+        self.assertEqual(User.objects.get().username, "naver_42")
+
+    @mock.patch("accounts.views.fetch_user_info", new_callable=mock.AsyncMock)
+    def test_provider_failure_status(self, fetch_user_info):
+        fetch_user_info.side_effect = oauth.OAuthError("timeout", 504)
+        self.assertEqual(self.get(code="abc").status_code, 504)
+
+    @mock.patch("accounts.views.fetch_user_info", new_callable=mock.AsyncMock)
+    def test_conflicting_account(self, fetch_user_info):
+        fetch_user_info.return_value = NAVER_PROFILE
+        User.objects.create_user("someone", "fan@example.com", "pw")
+        self.assertEqual(self.get(code="abc").status_code, 409)
+
+
+class StatelessJWTTests(TestCase):
+    """JWT 인증 - 요청마다 User 행을 읽지 않음"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("fan", "fan@example.com", "pw")
+        cls.arsenal = Team.objects.create(team_id="359", team_name="Arsenal")
+        Team.objects.create(team_id="363", team_name="Chelsea")
+
+    def setUp(self):
+        favorites.invalidate()
+        self.auth = f"Bearer {AccessToken.for_user(self.user)}"
+
+    def request(self, method, path, data=None, auth=None):
+        return getattr(self.client, method)(
+            path,
+            data,
+            content_type="application/json",
+            HTTP_HOST="localhost",
+            HTTP_AUTHORIZATION=auth or self.auth,
+        )
+
+    def test_favorite_teams_without_user_query(self):
+        self.user.favorite_teams.add(self.arsenal)
+        self.request("get", "/api/accounts/favorite-teams/")
+        # 응원 팀 ID 캐시 적중 → Team 조회 1번만
+        with self.assertNumQueries(1):
+            response = self.request("get", "/api/accounts/favorite-teams/")
+        self.assertEqual(response.json()["teams"][0]["team_id"], "359")
+
+    def test_add_invalidates_cached_team_ids(self):
+        self.assertEqual(
+            self.request("get", "/api/accounts/favorite-teams/").json()["count"], 0
+        )
+        response = self.request(
+            "post", "/api/accounts/favorite-teams/add/", {"team_id": "363"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.request("get", "/api/accounts/favorite-teams/").json()["count"], 1
+        )
+
+    def test_user_attributes_are_loaded_lazily(self):
+        user = StatelessUser(str(self.user.pk))
+        self.assertEqual(user.pk, self.user.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(user.username, "fan")
+            self.assertEqual(user.email, "fan@example.com")
+        self.assertEqual(user, self.user)
+
+    def test_invalid_token(self):
+        response = self.request("get", "/api/accounts/user/", auth="Bearer broken")
+        self.assertEqual(response.status_code, 401)
+
+    def test_deleted_user_token(self):
+        self.user.delete()
+        for path in ("/api/accounts/user/", "/api/accounts/profile/"):
+            with self.subTest(path=path):
+                self.assertEqual(self.request("get", path).status_code, 401)
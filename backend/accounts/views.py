@@ -1,5 +1,6 @@
 from rest_framework import status, generics
 from rest_framework.decorators import api_view, permission_classes, action
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework import viewsets
@@ -7,8 +8,13 @@ from django.contrib.auth import get_user_model
 from django.shortcuts import redirect
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.core.exceptions import ValidationError
-import requests
+from django.db import IntegrityError
+from django.db.models import prefetch_related_objects
+from django.http import JsonResponse
+from asgiref.sync import sync_to_async
 import os
+from .authentication import favorite_team_ids
+from .oauth import OAuthError, fetch_user_info, upsert_social_user
 from .serializers import UserSerializer, UserRegisterSerializer, FavoriteTeamSerializer
 from teams.models import Team, TeamStanding
 from matches.models import Match
@@ -24,6 +30,16 @@ class RegisterView(generics.CreateAPIView):
     permission_classes = [AllowAny]
 
 
+def get_current_user(request):
+    """토큰 사용자의 User 행 (응원 팀 포함) - 삭제된 사용자의 토큰이면 401"""
+    try:
+        return User.objects.prefetch_related("favorite_teams").get(pk=request.user.pk)
+    except User.DoesNotExist as e:
+        raise AuthenticationFailed(
+            "사용자를 찾을 수 없습니다.", code="user_not_found"
+        ) from e
+
+
 class UserProfileView(generics.RetrieveUpdateAPIView):
     """사용자 프로필 조회/수정 API"""
 
@@ -31,14 +47,15 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
     permission_classes = [IsAuthenticated]
 
     def get_object(self):
-        return self.request.user
+        return get_current_user(self.request)
 
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def user_info(request):
     """현재 로그인한 사용자 정보"""
-    serializer = UserSerializer(request.user)
+    user = get_current_user(request)
+    serializer = UserSerializer(user)
     return Response(serializer.data)
 
 
@@ -56,6 +73,29 @@ def get_tokens_for_user(user):
     }
 
 
+@sync_to_async
+def _social_login_payload(provider, social_id, defaults, message):
+    user = upsert_social_user(provider, social_id, defaults)
+    prefetch_related_objects([user], "favorite_teams")
+    return {
+        "message": message,
+        "tokens": get_tokens_for_user(user),
+        "user": UserSerializer(user).data,
+    }
+
+
+async def social_login_response(provider, social_id, defaults, message):
+    """소셜 계정 사용자 조회/생성 후 로그인 응답"""
+    try:
+        payload = await _social_login_payload(provider, social_id, defaults, message)
+    except IntegrityError:
+        # 같은 이메일/아이디의 일반 계정이 이미 있는 경우
+        return JsonResponse(
+            {"error": "이미 사용 중인 이메일 또는 아이디입니다."}, status=409
+        )
+    return JsonResponse(payload, json_dumps_params={"ensure_ascii": False})
+
+
 # @api_view(["GET"])
 # @permission_classes([AllowAny])
 # def kakao_login(request):
@@ -147,15 +187,14 @@ def naver_login(request):
     return redirect(naver_auth_url)
 
 
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def naver_callback(request):
-    """네이버 로그인 콜백"""
+async def naver_callback(request):
+    """네이버 로그인 콜백 (비동기 - 제공자 응답을 기다리는 동안 워커를 점유하지 않음)"""
     code = request.GET.get("code")
     state = request.GET.get("state")
+    if not code:
+        return JsonResponse({"error": "code 파라미터가 필요합니다."}, status=400)
 
-    # 1. 액세스 토큰 받기
-    token_url = "https://nid.naver.com/oauth2.0/token"
+    # 1~2. 액세스 토큰 → 사용자 정보
     token_data = {
         "grant_type": "authorization_code",
         "client_id": os.getenv("NAVER_CLIENT_ID"),
@@ -163,44 +202,27 @@ def naver_callback(request):
         "code": code,
         "state": state,
     }
-
-    token_response = requests.post(token_url, data=token_data)
-    token_json = token_response.json()
-    access_token = token_json.get("access_token")
-
-    # 2. 사용자 정보 받기
-    user_info_url = "https://openapi.naver.com/v1/nid/me"
-    headers = {"Authorization": f"Bearer {access_token}"}
-    user_response = requests.get(user_info_url, headers=headers)
-    user_json = user_response.json()
+    try:
+        user_json = await fetch_user_info("naver", token_data)
+    except OAuthError as e:
+        return JsonResponse({"error": str(e)}, status=e.status)
 
     naver_account = user_json.get("response", {})
     naver_id = naver_account.get("id")
-    email = naver_account.get("email", f"naver_{naver_id}@naver.com")
-    nickname = naver_account.get("nickname", f"naver_user_{naver_id}")
-    profile_image = naver_account.get("profile_image", "")
-
-    # 3. 사용자 생성 또는 가져오기
-    user, created = User.objects.get_or_create(
-        social_provider="naver",
-        social_id=str(naver_id),
-        defaults={
-            "username": f"naver_{naver_id}",
-            "email": email,
-            "nickname": nickname,
-            "profile_image": profile_image,
-        },
-    )
+    if not naver_id:
+        return JsonResponse({"error": "사용자 정보를 받지 못했습니다."}, status=502)
 
-    # 4. JWT 토큰 발급
-    tokens = get_tokens_for_user(user)
-
-    return Response(
+    # 3~4. 사용자 생성 또는 가져오기 + JWT 토큰 발급
+    return await social_login_response(
+        "naver",
+        str(naver_id),
         {
-            "message": "네이버 로그인 성공",
-            "tokens": tokens,
-            "user": UserSerializer(user).data,
-        }
+            "username": f"naver_{naver_id}",
+            "email": naver_account.get("email", f"naver_{naver_id}@naver.com"),
+            "nickname": naver_account.get("nickname", f"naver_user_{naver_id}"),
+            "profile_image": naver_account.get("profile_image", ""),
+        },
+        "네이버 로그인 성공",
     )
 
 
@@ -221,14 +243,13 @@ def google_login(request):
     return redirect(google_auth_url)
 
 
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def google_callback(request):
-    """구글 로그인 콜백"""
+async def google_callback(request):
+    """구글 로그인 콜백 (비동기)"""
     code = request.GET.get("code")
+    if not code:
+        return JsonResponse({"error": "code 파라미터가 필요합니다."}, status=400)
 
-    # 1. 액세스 토큰 받기
-    token_url = "https://oauth2.googleapis.com/token"
+    # 1~2. 액세스 토큰 → 사용자 정보
     token_data = {
         "grant_type": "authorization_code",
         "client_id": os.getenv("GOOGLE_CLIENT_ID"),
@@ -236,43 +257,26 @@ def google_callback(request):
         "redirect_uri": os.getenv("GOOGLE_REDIRECT_URI"),
         "code": code,
     }
-
-    token_response = requests.post(token_url, data=token_data)
-    token_json = token_response.json()
-    access_token = token_json.get("access_token")
-
-    # 2. 사용자 정보 받기
-    user_info_url = "https://www.googleapis.com/oauth2/v2/userinfo"
-    headers = {"Authorization": f"Bearer {access_token}"}
-    user_response = requests.get(user_info_url, headers=headers)
-    user_json = user_response.json()
+    try:
+        user_json = await fetch_user_info("google", token_data)
+    except OAuthError as e:
+        return JsonResponse({"error": str(e)}, status=e.status)
 
     google_id = user_json.get("id")
-    email = user_json.get("email", f"google_{google_id}@gmail.com")
-    name = user_json.get("name", f"google_user_{google_id}")
-    picture = user_json.get("picture", "")
-
-    # 3. 사용자 생성 또는 가져오기
-    user, created = User.objects.get_or_create(
-        social_provider="google",
-        social_id=str(google_id),
-        defaults={
-            "username": f"google_{google_id}",
-            "email": email,
-            "nickname": name,
-            "profile_image": picture,
-        },
-    )
-
-    # 4. JWT 토큰 발급
-    tokens = get_tokens_for_user(user)
+    if not google_id:
+        return JsonResponse({"error": "사용자 정보를 받지 못했습니다."}, status=502)
 
-    return Response(
+    # 3~4. 사용자 생성 또는 가져오기 + JWT 토큰 발급
+    return await social_login_response(
+        "google",
+        str(google_id),
         {
-            "message": "구글 로그인 성공",
-            "tokens": tokens,
-            "user": UserSerializer(user).data,
-        }
+            "username": f"google_{google_id}",
+            "email": user_json.get("email", f"google_{google_id}@gmail.com"),
+            "nickname": user_json.get("name", f"google_user_{google_id}"),
+            "profile_image": user_json.get("picture", ""),
+        },
+        "구글 로그인 성공",
     )
 
 
@@ -281,14 +285,20 @@ def google_callback(request):
 # ========================================
 
 
+def get_favorite_teams(team_ids):
+    """team_id 목록 → Team 목록 (기존 user.favorite_teams.all() 과 같은 팀 이름순)"""
+    if not team_ids:
+        return []
+    return list(Team.objects.filter(team_id__in=team_ids))
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def my_favorite_teams(request):
     """내 응원 팀 목록"""
-    user = request.user
-    teams = user.favorite_teams.all()
+    teams = get_favorite_teams(favorite_team_ids(request.user))
     serializer = FavoriteTeamSerializer(teams, many=True)
-    return Response({"count": teams.count(), "max_count": 3, "teams": serializer.data})
+    return Response({"count": len(teams), "max_count": 3, "teams": serializer.data})
 
 
 @api_view(["POST"])
@@ -310,16 +320,18 @@ def add_favorite_team(request):
         )
 
     user = request.user
+    # 변경 요청은 다른 프로세스의 변경까지 반영하도록 캐시 대신 DB 에서 확인
+    team_ids = favorite_team_ids(user, fresh=True)
 
     # 이미 응원 팀인지 확인
-    if user.favorite_teams.filter(team_id=team_id).exists():
+    if team_id in team_ids:
         return Response(
             {"error": "이미 응원 팀으로 등록되어 있습니다."},
             status=status.HTTP_400_BAD_REQUEST,
         )
 
     # 최대 3개 제한 확인
-    if user.favorite_teams.count() >= 3:
+    if len(team_ids) >= 3:
         return Response(
             {"error": "응원 팀은 최대 3개까지만 선택할 수 있습니다."},
             status=status.HTTP_400_BAD_REQUEST,
@@ -331,7 +343,7 @@ def add_favorite_team(request):
         {
             "message": f"{team.team_name}을(를) 응원 팀으로 추가했습니다.",
             "team": FavoriteTeamSerializer(team).data,
-            "current_count": user.favorite_teams.count(),
+            "current_count": len(team_ids) + 1,
         }
     )
 
@@ -348,9 +360,11 @@ def remove_favorite_team(request, team_id):
         )
 
     user = request.user
+    # 변경 요청은 다른 프로세스의 변경까지 반영하도록 캐시 대신 DB 에서 확인
+    team_ids = favorite_team_ids(user, fresh=True)
 
     # 응원 팀인지 확인
-    if not user.favorite_teams.filter(team_id=team_id).exists():
+    if team_id not in team_ids:
         return Response(
             {"error": "응원 팀이 아닙니다."}, status=status.HTTP_400_BAD_REQUEST
         )
@@ -360,7 +374,7 @@ def remove_favorite_team(request, team_id):
     return Response(
         {
             "message": f"{team.team_name}을(를) 응원 팀에서 제거했습니다.",
-            "current_count": user.favorite_teams.count(),
+            "current_count": len(team_ids) - 1,
         }
     )
 
@@ -369,10 +383,9 @@ def remove_favorite_team(request, team_id):
 @permission_classes([IsAuthenticated])
 def all_favorite_matches(request):
     """내 모든 응원 팀의 경기 일정 (예정+지난 모두)"""
-    user = request.user
-    favorite_teams = user.favorite_teams.all()
+    team_ids = favorite_team_ids(request.user)
 
-    if not favorite_teams.exists():
+    if not team_ids:
         return Response(
             {
                 "message": "응원 팀이 없습니다.",
@@ -386,8 +399,6 @@ def all_favorite_matches(request):
     from django.utils import timezone
 
     # 모든 응원 팀의 경기 조회
-    team_ids = [team.team_id for team in favorite_teams]
-
     q_objects = Q()
     for team_id in team_ids:
         q_objects |= Q(home_team_id=team_id) | Q(away_team_id=team_id)
@@ -408,7 +419,9 @@ def all_favorite_matches(request):
 
     return Response(
         {
-            "teams": FavoriteTeamSerializer(favorite_teams, many=True).data,
+            "teams": FavoriteTeamSerializer(
+                get_favorite_teams(team_ids), many=True
+            ).data,
             "upcoming_count": upcoming_matches.count(),
             "past_count": past_matches.count(),
             "upcoming_matches": MatchListSerializer(upcoming_matches, many=True).data,
@@ -421,10 +434,8 @@ def all_favorite_matches(request):
 @permission_classes([IsAuthenticated])
 def favorite_team_matches(request, team_id):
     """특정 응원 팀의 경기 일정"""
-    user = request.user
-
     # 응원 팀인지 확인
-    if not user.favorite_teams.filter(team_id=team_id).exists():
+    if team_id not in favorite_team_ids(request.user):
         return Response(
             {"error": "응원 팀이 아닙니다."}, status=status.HTTP_400_BAD_REQUEST
         )
@@ -460,17 +471,14 @@ def favorite_team_matches(request, team_id):
 @permission_classes([IsAuthenticated])
 def upcoming_favorite_matches(request):
     """내 응원 팀의 예정된 경기"""
-    user = request.user
-    favorite_teams = user.favorite_teams.all()
+    team_ids = favorite_team_ids(request.user)
 
-    if not favorite_teams.exists():
+    if not team_ids:
         return Response({"message": "응원 팀이 없습니다.", "teams": [], "matches": []})
 
     from django.db.models import Q
     from django.utils import timezone
 
-    team_ids = [team.team_id for team in favorite_teams]
-
     q_objects = Q()
     for team_id in team_ids:
         q_objects |= Q(home_team_id=team_id) | Q(away_team_id=team_id)
@@ -486,7 +494,9 @@ def upcoming_favorite_matches(request):
 
     return Response(
         {
-            "teams": FavoriteTeamSerializer(favorite_teams, many=True).data,
+            "teams": FavoriteTeamSerializer(
+                get_favorite_teams(team_ids), many=True
+            ).data,
             "count": matches.count(),
             "matches": MatchListSerializer(matches, many=True).data,
         }
@@ -497,17 +507,14 @@ def upcoming_favorite_matches(request):
 @permission_classes([IsAuthenticated])
 def past_favorite_matches(request):
     """내 응원 팀의 지난 경기"""
-    user = request.user
-    favorite_teams = user.favorite_teams.all()
+    team_ids = favorite_team_ids(request.user)
 
-    if not favorite_teams.exists():
+    if not team_ids:
         return Response({"message": "응원 팀이 없습니다.", "teams": [], "matches": []})
 
     from django.db.models import Q
     from django.utils import timezone
 
-    team_ids = [team.team_id for team in favorite_teams]
-
     q_objects = Q()
     for team_id in team_ids:
         q_objects |= Q(home_team_id=team_id) | Q(away_team_id=team_id)
@@ -523,7 +530,9 @@ def past_favorite_matches(request):
 
     return Response(
         {
-            "teams": FavoriteTeamSerializer(favorite_teams, many=True).data,
+            "teams": FavoriteTeamSerializer(
+                get_favorite_teams(team_ids), many=True
+            ).data,
             "count": matches.count(),
             "matches": MatchListSerializer(matches, many=True).data,
         }
@@ -534,11 +543,10 @@ def past_favorite_matches(request):
 @permission_classes([IsAuthenticated])
 def main_dashboard(request):
     """메인 대시보드 - 응원 팀별 통합 정보"""
-    user = request.user
-    favorite_teams = user.favorite_teams.all()
+    favorite_teams = get_favorite_teams(favorite_team_ids(request.user))
 
     # 응원 팀이 없는 경우
-    if not favorite_teams.exists():
+    if not favorite_teams:
         return Response({"favorite_teams": [], "latest_news": [], "ai_analysis": None})
 
     dashboard_data = []
@@ -550,12 +558,41 @@ def main_dashboard(request):
     response_data = {
         "favorite_teams": dashboard_data,
         "latest_news": [],
-        "ai_analysis": None,
+        "ai_analysis": get_dashboard_predictions(dashboard_data),
     }
 
     return Response(response_data)
 
 
+def get_dashboard_predictions(dashboard_data):
+    """응원 팀별 다음 경기 예측 (저장된 예측을 쿼리 1번으로 조회)"""
+    from ai_analysis import store
+    from ai_analysis.predictions import MODEL_VERSION
+
+    next_matches = [
+        (team_data, team_data["next_match"])
+        for team_data in dashboard_data
+        if team_data["next_match"]
+    ]
+    predictions = store.fetch(match["match_id"] for _, match in next_matches)
+
+    return {
+        "model_version": MODEL_VERSION,
+        "next_matches": [
+            {
+                "team_id": team_data["team_id"],
+                "team_name": team_data["team_name"],
+                "match_id": match["match_id"],
+                "opponent_name": match["opponent_name"],
+                "is_home": match["is_home"],
+                **store.for_team(predictions[match["match_id"]], match["is_home"]),
+            }
+            for team_data, match in next_matches
+            if match["match_id"] in predictions
+        ],
+    }
+
+
 def get_team_dashboard_data(team):
     """팀별 대시보드 데이터 생성"""
     from django.db.models import Q
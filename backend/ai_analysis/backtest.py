@@ -0,0 +1,108 @@
+"""
+예측 모델 워크포워드 평가 - DB ↔ evaluation.py
+- 특성 저장소(features.py)의 종료 경기로 라운드별 학습/예측 (BACKTEST_START_MATCHDAY 라운드부터)
+- BACKTEST_WORKERS > 1 이면 라운드를 프로세스 풀(spawn)에 나눠 실행
+- 결과는 모델마다 BacktestRun 1행으로 저장 → 이전 실행과 비교
+"""
+
+import multiprocessing
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from django.conf import settings
+
+from . import evaluation, features
+from .models import BacktestRun
+
+COLUMNS = ["match_date", "matchday", "home", "away", "home_goals", "away_goals"]
+
+
+def parameters():
+    """모델 설정 (predictions.py 와 같은 값)"""
+    return {
+        "time_decay": settings.PREDICTION_TIME_DECAY,
+        "prior": settings.PREDICTION_PRIOR_MATCHES,
+        "max_goals": settings.PREDICTION_MAX_GOALS,
+    }
+
+
+def load_columns(store):
+    """특성 저장소 → 종료 경기 컬럼 dict (워커에 넘기므로 memmap 대신 일반 배열)"""
+    finished = np.asarray(store.matches["finished"])
+    return {name: np.asarray(store.matches[name])[finished] for name in COLUMNS}
+
+
+def run(names=None, start_matchday=None, workers=None):
+    """모델별 워크포워드 평가 후 저장 → BacktestRun 목록 (names 순서)"""
+    start = time.perf_counter()
+    names = names or list(evaluation.MODELS)
+    start_matchday = start_matchday or settings.BACKTEST_START_MATCHDAY
+    workers = workers or settings.BACKTEST_WORKERS
+
+    store = features.load()
+    columns = load_columns(store)
+    matchdays = sorted(
+        int(matchday)
+        for matchday in np.unique(columns["matchday"])
+        if matchday >= start_matchday
+    )
+    params = parameters()
+
+    if workers > 1 and len(matchdays) > 1:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(min(workers, len(matchdays)), context) as executor:
+            results = evaluation.run(
+                columns,
+                len(store.teams),
+                matchdays,
+                names,
+                params,
+                executor=executor,
+                bins=settings.BACKTEST_CALIBRATION_BINS,
+            )
+    else:
+        results = evaluation.run(
+            columns,
+            len(store.teams),
+            matchdays,
+            names,
+            params,
+            bins=settings.BACKTEST_CALIBRATION_BINS,
+        )
+
+    seconds = round(time.perf_counter() - start, 3)
+    run_id = uuid.uuid4().hex
+    return BacktestRun.objects.bulk_create(
+        [
+            BacktestRun(
+                run_id=run_id,
+                model_name=name,
+                data_version=store.version,
+                parameters=params if name != "base-rate" else {},
+                start_matchday=matchdays[0] if matchdays else start_matchday,
+                end_matchday=matchdays[-1] if matchdays else start_matchday,
+                matches=results[name]["matches"],
+                log_loss=results[name]["log_loss"],
+                brier=results[name]["brier"],
+                accuracy=results[name]["accuracy"],
+                calibration=results[name]["calibration"],
+                workers=workers,
+                seconds=seconds,
+            )
+            for name in names
+        ]
+    )
+
+
+def previous(backtest):
+    """같은 모델의 직전 실행 (없으면 None)"""
+    return (
+        BacktestRun.objects.filter(
+            model_name=backtest.model_name, created_at__lt=backtest.created_at
+        )
+        .exclude(run_id=backtest.run_id)
+        .order_by("-created_at")
+        .first()
+    )
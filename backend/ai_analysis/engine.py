@@ -0,0 +1,182 @@
+"""
+Dixon-Coles 경기 예측 엔진 (NumPy 만 사용, Django 와 무관)
+- 팀별 공격력 a, 수비력 d, 홈 이점 h 로 득점 기대값 계산
+    홈 λ = a[홈] * d[원정] * h,   원정 μ = a[원정] * d[홈]
+  (a 는 평균 1 로 정규화, d 는 클수록 많이 실점)
+- 종료 경기 결과로 포아송 최대우도 고정점 반복 (팀별 합계는 np.bincount)
+  prior: 팀마다 리그 평균 경기 prior 개를 더해 경기 수가 적을 때 극단값 방지
+- 저득점(0-0, 1-0, 0-1, 1-1) 보정 ρ 는 격자 탐색
+- 예측은 모든 경기의 점수 행렬을 (경기 수, G+1, G+1) 배열 하나로 계산
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+# 결과가 없을 때 쓰는 팀당 경기 평균 득점
+DEFAULT_GOALS = 1.35
+
+RHO_GRID = np.linspace(-0.25, 0.25, 101)
+
+EPSILON = 1e-12
+
+
+@dataclass(frozen=True)
+class Strengths:
+    """fit() 결과 (attack / defence 는 팀 번호 순서 배열)"""
+
+    attack: np.ndarray
+    defence: np.ndarray
+    home_advantage: float
+    rho: float
+    iterations: int = 0
+
+
+def fit(
+    home,
+    away,
+    home_goals,
+    away_goals,
+    n_teams,
+    weights=None,
+    prior=2.0,
+    max_iterations=200,
+    tolerance=1e-8,
+):
+    """
+    종료 경기 배열 → Strengths
+    home / away: 팀 번호(0 ~ n_teams-1), weights: 경기별 가중치 (시간 감쇠 등)
+    """
+    home = np.asarray(home, dtype=np.intp)
+    away = np.asarray(away, dtype=np.intp)
+    home_goals = np.asarray(home_goals, dtype=float)
+    away_goals = np.asarray(away_goals, dtype=float)
+    weights = np.ones(len(home)) if weights is None else np.asarray(weights, float)
+
+    weighted_home = weights * home_goals
+    weighted_away = weights * away_goals
+    total_weight = weights.sum()
+    league_rate = (
+        (weighted_home.sum() + weighted_away.sum()) / (2 * total_weight)
+        if total_weight > 0
+        else DEFAULT_GOALS
+    )
+
+    def per_team(home_values, away_values):
+        return np.bincount(home, home_values, n_teams) + np.bincount(
+            away, away_values, n_teams
+        )
+
+    scored = per_team(weighted_home, weighted_away) + prior * league_rate
+    conceded = per_team(weighted_away, weighted_home) + prior * league_rate
+
+    attack = np.ones(n_teams)
+    defence = np.full(n_teams, league_rate)
+    home_advantage = 1.0
+
+    iterations = 0
+    for _ in range(max_iterations if n_teams else 0):
+        iterations += 1
+        exposure = per_team(
+            weights * defence[away] * home_advantage, weights * defence[home]
+        )
+        new_attack = scored / (exposure + prior * league_rate)
+
+        exposure = per_team(
+            weights * new_attack[away], weights * new_attack[home] * home_advantage
+        )
+        new_defence = conceded / (exposure + prior)
+
+        # 공격력 평균 1 (λ, μ 는 그대로)
+        scale = new_attack.mean()
+        new_attack /= scale
+        new_defence *= scale
+
+        expected_home = (weights * new_attack[home] * new_defence[away]).sum()
+        new_home_advantage = (
+            weighted_home.sum() / expected_home if expected_home > EPSILON else 1.0
+        )
+
+        change = max(
+            np.abs(new_attack - attack).max(initial=0.0),
+            np.abs(new_defence - defence).max(initial=0.0),
+            abs(new_home_advantage - home_advantage),
+        )
+        attack, defence, home_advantage = new_attack, new_defence, new_home_advantage
+        if change < tolerance:
+            break
+
+    lam, mu = expected_goals(attack, defence, home_advantage, home, away)
+    rho = fit_rho(lam, mu, home_goals, away_goals, weights)
+    return Strengths(attack, defence, float(home_advantage), rho, iterations)
+
+
+def expected_goals(attack, defence, home_advantage, home, away):
+    """(홈 λ 배열, 원정 μ 배열)"""
+    lam = attack[home] * defence[away] * home_advantage
+    mu = attack[away] * defence[home]
+    return lam, mu
+
+
+def low_score_factor(lam, mu, rho, home_goals, away_goals):
+    """Dixon-Coles τ - 0-0, 1-0, 0-1, 1-1 이외에는 1 (rho 는 스칼라 또는 열 벡터)"""
+    factor = np.ones(np.broadcast_shapes(np.shape(rho), np.shape(lam)))
+    factor = np.where((home_goals == 0) & (away_goals == 0), 1 - lam * mu * rho, factor)
+    factor = np.where((home_goals == 0) & (away_goals == 1), 1 + lam * rho, factor)
+    factor = np.where((home_goals == 1) & (away_goals == 0), 1 + mu * rho, factor)
+    factor = np.where((home_goals == 1) & (away_goals == 1), 1 - rho, factor)
+    return factor
+
+
+def fit_rho(lam, mu, home_goals, away_goals, weights):
+    """ρ 격자(RHO_GRID) × 경기 행렬에서 가중 로그우도가 가장 큰 ρ"""
+    if len(lam) == 0:
+        return 0.0
+    factor = low_score_factor(lam, mu, RHO_GRID[:, None], home_goals, away_goals)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_likelihood = np.where(
+            factor > 0, weights * np.log(np.maximum(factor, EPSILON)), -np.inf
+        ).sum(axis=1)
+    return float(RHO_GRID[np.argmax(log_likelihood)])
+
+
+def score_matrix(strengths, home, away, max_goals=10):
+    """
+    경기들의 점수 확률 행렬 → (λ, μ, 행렬)
+    행렬[k, i, j] = k 번째 경기가 홈 i : 원정 j 로 끝날 확률 (합계 1로 정규화)
+    """
+    home = np.asarray(home, dtype=np.intp)
+    away = np.asarray(away, dtype=np.intp)
+    lam, mu = expected_goals(
+        strengths.attack, strengths.defence, strengths.home_advantage, home, away
+    )
+
+    goals = np.arange(max_goals + 1)
+    log_factorial = np.concatenate(([0.0], np.cumsum(np.log(goals[1:]))))
+    home_pmf = np.exp(goals * np.log(lam)[:, None] - lam[:, None] - log_factorial)
+    away_pmf = np.exp(goals * np.log(mu)[:, None] - mu[:, None] - log_factorial)
+    matrix = home_pmf[:, :, None] * away_pmf[:, None, :]
+
+    rho = strengths.rho
+    matrix[:, 0, 0] *= 1 - lam * mu * rho
+    matrix[:, 0, 1] *= 1 + lam * rho
+    matrix[:, 1, 0] *= 1 + mu * rho
+    matrix[:, 1, 1] *= 1 - rho
+    np.clip(matrix, 0, None, out=matrix)
+    matrix /= matrix.sum(axis=(1, 2), keepdims=True)
+    return lam, mu, matrix
+
+
+def outcome_probabilities(matrix):
+    """점수 행렬 → (홈 승, 무, 원정 승) 배열"""
+    home_win = np.tril(matrix, -1).sum(axis=(1, 2))
+    draw = np.trace(matrix, axis1=1, axis2=2)
+    away_win = np.triu(matrix, 1).sum(axis=(1, 2))
+    return home_win, draw, away_win
+
+
+def most_likely_scores(matrix):
+    """가장 가능성 높은 점수 → (홈 득점 배열, 원정 득점 배열)"""
+    size = matrix.shape[-1]
+    flat = matrix.reshape(len(matrix), -1).argmax(axis=1)
+    return flat // size, flat % size
@@ -0,0 +1,146 @@
+"""
+예측 모델 워크포워드 평가 (NumPy 만 사용, Django 와 무관 - 워커 프로세스에서 import)
+- 라운드(matchday) d 마다: d 이전 라운드 종료 경기로 학습 → d 라운드 경기 예측
+  라운드끼리는 서로 독립이라 프로세스 풀에서 나눠 실행
+- 모델 (MODELS): 승/무/패 확률 (경기 수, 3) 을 돌려주는 함수
+- 지표: log-loss, Brier (3결과 합), 정확도, 확률 구간별 calibration
+"""
+
+from dataclasses import replace
+
+import numpy as np
+
+from . import engine
+
+# 결과 번호 (확률 열 순서와 같음)
+HOME, DRAW, AWAY = 0, 1, 2
+
+EPSILON = 1e-15
+
+
+def outcomes(home_goals, away_goals):
+    """득점 → 결과 번호 배열"""
+    return np.where(
+        home_goals > away_goals, HOME, np.where(home_goals == away_goals, DRAW, AWAY)
+    )
+
+
+def dixon_coles(train, test, n_teams, params, rho=True):
+    """Dixon-Coles (engine.py 와 같은 설정, 시간 감쇠 기준은 예측 라운드 첫 경기)"""
+    days = (test["match_date"].min() - train["match_date"]) / (24 * 60 * 60)
+    weights = np.exp(-params["time_decay"] * np.maximum(days, 0))
+    strengths = engine.fit(
+        train["home"],
+        train["away"],
+        train["home_goals"],
+        train["away_goals"],
+        n_teams,
+        weights=weights,
+        prior=params["prior"],
+    )
+    if not rho:
+        strengths = replace(strengths, rho=0.0)
+    _, _, matrix = engine.score_matrix(
+        strengths, test["home"], test["away"], params["max_goals"]
+    )
+    return np.column_stack(engine.outcome_probabilities(matrix))
+
+
+def poisson(train, test, n_teams, params):
+    """저득점 보정(ρ) 없는 독립 포아송"""
+    return dixon_coles(train, test, n_teams, params, rho=False)
+
+
+def base_rate(train, test, n_teams, params):
+    """학습 경기의 홈 승/무/원정 승 비율 (모든 경기 같은 확률) - 비교 기준선"""
+    counts = np.bincount(
+        outcomes(train["home_goals"], train["away_goals"]), minlength=3
+    ).astype(float)
+    rates = (counts + 1) / (counts.sum() + 3)
+    return np.tile(rates, (len(test["home"]), 1))
+
+
+MODELS = {
+    "dixon-coles": dixon_coles,
+    "poisson": poisson,
+    "base-rate": base_rate,
+}
+
+
+def evaluate_step(args):
+    """
+    라운드 1개 → {모델 이름: (확률 (n, 3), 실제 결과 (n,))}
+    args: (경기 컬럼 dict, 팀 수, 라운드, 모델 이름 목록, 모델 설정)
+    """
+    columns, n_teams, matchday, names, params = args
+    train_mask = columns["matchday"] < matchday
+    test_mask = columns["matchday"] == matchday
+    train = {name: array[train_mask] for name, array in columns.items()}
+    test = {name: array[test_mask] for name, array in columns.items()}
+    actual = outcomes(test["home_goals"], test["away_goals"])
+    return {
+        name: (MODELS[name](train, test, n_teams, params), actual) for name in names
+    }
+
+
+def calibration(probabilities, actual, bins=10):
+    """
+    예측 확률 구간별 실제 빈도 (승/무/패 확률을 모두 한 목록으로)
+    → [{"bin", "predicted", "observed", "count"}] (경기가 없는 구간은 제외)
+    """
+    predicted = probabilities.ravel()
+    observed = (actual[:, None] == np.arange(3)).ravel().astype(float)
+    index = np.minimum((predicted * bins).astype(int), bins - 1)
+    counts = np.bincount(index, minlength=bins)
+    predicted_sum = np.bincount(index, predicted, bins)
+    observed_sum = np.bincount(index, observed, bins)
+    return [
+        {
+            "bin": f"{i / bins:.1f}-{(i + 1) / bins:.1f}",
+            "predicted": round(predicted_sum[i] / counts[i], 4),
+            "observed": round(observed_sum[i] / counts[i], 4),
+            "count": int(counts[i]),
+        }
+        for i in np.flatnonzero(counts)
+    ]
+
+
+def scores(probabilities, actual, bins=10):
+    """확률 (n, 3) + 실제 결과 → 지표 dict"""
+    if len(actual) == 0:
+        return {
+            "matches": 0,
+            "log_loss": None,
+            "brier": None,
+            "accuracy": None,
+            "calibration": [],
+        }
+    target = np.eye(3)[actual]
+    chosen = probabilities[np.arange(len(actual)), actual]
+    return {
+        "matches": len(actual),
+        "log_loss": float(-np.log(np.maximum(chosen, EPSILON)).mean()),
+        "brier": float(((probabilities - target) ** 2).sum(axis=1).mean()),
+        "accuracy": float((probabilities.argmax(axis=1) == actual).mean()),
+        "calibration": calibration(probabilities, actual, bins),
+    }
+
+
+def run(columns, n_teams, matchdays, names, params, executor=None, bins=10):
+    """라운드별 평가를 (executor 가 있으면 프로세스 풀에서) 실행 → {모델 이름: 지표}"""
+    args = [(columns, n_teams, matchday, names, params) for matchday in matchdays]
+    if executor is None:
+        steps = [evaluate_step(arg) for arg in args]
+    else:
+        steps = list(executor.map(evaluate_step, args))
+
+    results = {}
+    for name in names:
+        probabilities = np.concatenate(
+            [step[name][0] for step in steps] or [np.empty((0, 3))]
+        )
+        actual = np.concatenate(
+            [step[name][1] for step in steps] or [np.empty(0, dtype=int)]
+        )
+        results[name] = scores(probabilities, actual, bins)
+    return results
@@ -0,0 +1,359 @@
+"""
+경기 특성 저장소 (컬럼별 .npy 파일, 메모리 매핑으로 읽음)
+- data/features/<version>/{matches,rows}/<컬럼>.npy + meta.json
+  data/features/current.json ← 현재 버전 포인터
+- 경기 컬럼 (경기당 1행, 날짜순): match_pk, match_date(epoch 초), home, away,
+  home_goals, away_goals (경기 전이면 NaN), status, matchday (없으면 0), finished
+- 팀-경기 컬럼 (경기당 2행, 팀 > 날짜순, team_offsets 로 팀별 구간):
+  최근 FORM_WINDOW 경기 승점/득점/실점 합계, 홈/원정별 평균 득실점, 휴식일 등
+  모두 "이 경기 전까지" 값 → 예측/분석 입력으로 바로 사용
+- update(): 마지막 빌드 이후 수정된 경기만 다시 읽어 합친 뒤 특성 계산 (삭제가 있으면 전체)
+  update_matches 적재 후 호출, load() 도 DB 가 바뀌었으면 먼저 update()
+- 특성 계산은 전체 팀-경기 배열에 대한 누적합 한 번 (팀별 반복 없음)
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+
+from config.conditional import dataset_validators
+from matches.models import Match
+
+STATUSES = [status for status, _ in Match.STATUS_CHOICES]
+
+MATCH_FIELDS = [
+    "pk",
+    "match_date",
+    "home_team_id",
+    "home_team_name",
+    "away_team_id",
+    "away_team_name",
+    "home_score",
+    "away_score",
+    "status",
+    "matchday",
+    "updated_at",
+]
+
+# 저장하는 경기 컬럼 (나머지 경기/팀-경기 컬럼은 여기서 계산)
+BASE_COLUMNS = [
+    "match_pk",
+    "match_date",
+    "home",
+    "away",
+    "home_goals",
+    "away_goals",
+    "status",
+    "matchday",
+]
+
+FORM_WINDOW = 5
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# 보관할 이전 버전 수
+KEEP_VERSIONS = 2
+
+_lock = threading.Lock()
+_loaded = {}
+
+
+@dataclass(frozen=True)
+class FeatureStore:
+    """load() 결과 - matches / rows 는 컬럼 이름 → 배열 (읽기 전용 memmap)"""
+
+    version: str
+    source: str
+    teams: list
+    matches: dict
+    rows: dict
+
+    def team_index(self):
+        """팀 ID → 팀 번호"""
+        return {team["team_id"]: i for i, team in enumerate(self.teams)}
+
+    def team_rows(self, team):
+        """팀 번호의 팀-경기 행 구간 (날짜순)"""
+        offsets = self.rows["team_offsets"]
+        return slice(int(offsets[team]), int(offsets[team + 1]))
+
+
+def store_dir():
+    return Path(settings.FEATURE_STORE_DIR)
+
+
+def read_matches(queryset):
+    """Match values → 경기 행 목록 (dict)"""
+    return list(queryset.order_by("match_date", "pk").values(*MATCH_FIELDS))
+
+
+def base_columns(matches, teams):
+    """경기 행 목록 → 경기 컬럼 dict (teams 에 없는 팀은 뒤에 추가)"""
+    index = {team["team_id"]: i for i, team in enumerate(teams)}
+    for match in matches:
+        for side in ("home", "away"):
+            team_id = match[f"{side}_team_id"]
+            if team_id not in index:
+                index[team_id] = len(teams)
+                teams.append({"team_id": team_id, "team_name": ""})
+            teams[index[team_id]]["team_name"] = match[f"{side}_team_name"]
+
+    def goals(field):
+        return np.array(
+            [np.nan if m[field] is None else m[field] for m in matches], dtype=float
+        )
+
+    return {
+        "match_pk": np.array([m["pk"] for m in matches], dtype=np.int64),
+        "match_date": np.array([m["match_date"].timestamp() for m in matches]),
+        "home": np.array([index[m["home_team_id"]] for m in matches], dtype=np.int32),
+        "away": np.array([index[m["away_team_id"]] for m in matches], dtype=np.int32),
+        "home_goals": goals("home_score"),
+        "away_goals": goals("away_score"),
+        "status": np.array([STATUSES.index(m["status"]) for m in matches], np.int8),
+        "matchday": np.array([m["matchday"] or 0 for m in matches], dtype=np.int16),
+    }
+
+
+def exclusive_sums(values, starts):
+    """팀 구간별로 "이 행 전까지" 누적합 (values 는 팀 > 날짜순)"""
+    total = np.concatenate(([0.0], np.cumsum(values)))
+    return total[:-1] - total[starts]
+
+
+def window_sums(values, played, starts, window):
+    """팀 구간별로 이 행 전까지 치른 경기 중 최근 window 경기 합계"""
+    # 치른 경기만 이어 붙인 누적합에서 (이전 치른 경기 수 - window, 이전 치른 경기 수]
+    before = np.concatenate(([0], np.cumsum(played)))[:-1]
+    total = np.concatenate(([0.0], np.cumsum(values[played])))
+    first = np.maximum(before - window, before[starts])
+    return total[before] - total[first]
+
+
+def compute(columns, n_teams):
+    """경기 컬럼 → (경기 컬럼 + finished, 팀-경기 컬럼)"""
+    finished = (
+        (columns["status"] == STATUSES.index("finished"))
+        & ~np.isnan(columns["home_goals"])
+        & ~np.isnan(columns["away_goals"])
+    )
+    matches = {**columns, "finished": finished}
+    n_matches = len(finished)
+
+    # 경기당 홈/원정 2행 → 팀 > 날짜 > 경기 순 정렬
+    match_index = np.tile(np.arange(n_matches, dtype=np.int32), 2)
+    is_home = np.repeat([True, False], n_matches)
+    team = np.concatenate([columns["home"], columns["away"]])
+    opponent = np.concatenate([columns["away"], columns["home"]])
+    goals_for = np.concatenate([columns["home_goals"], columns["away_goals"]])
+    goals_against = np.concatenate([columns["away_goals"], columns["home_goals"]])
+    order = np.lexsort(
+        (match_index, team)
+    )  # 경기 컬럼이 날짜순이므로 경기 번호순 = 날짜순
+    match_index, is_home, team, opponent, goals_for, goals_against = (
+        array[order]
+        for array in (match_index, is_home, team, opponent, goals_for, goals_against)
+    )
+
+    played = finished[match_index]
+    points = np.where(
+        goals_for > goals_against, 3.0, np.where(goals_for == goals_against, 1.0, 0.0)
+    )
+    points[~played] = np.nan
+    date = columns["match_date"][match_index]
+
+    team_offsets = np.searchsorted(team, np.arange(n_teams + 1))
+    starts = team_offsets[team]
+
+    rows = {
+        "match_index": match_index,
+        "team": team,
+        "opponent": opponent,
+        "is_home": is_home,
+        "match_date": date,
+        "goals_for": goals_for,
+        "goals_against": goals_against,
+        "points": points,
+        "played_before": exclusive_sums(played.astype(float), starts),
+        "form_points": window_sums(points, played, starts, FORM_WINDOW),
+        "form_goals_for": window_sums(goals_for, played, starts, FORM_WINDOW),
+        "form_goals_against": window_sums(goals_against, played, starts, FORM_WINDOW),
+    }
+
+    # 홈/원정 경기별 평균 득실점 (이 경기와 같은 장소 기준)
+    venue_for = np.empty(len(team))
+    venue_against = np.empty(len(team))
+    for home in (True, False):
+        mask = played & (is_home == home)
+        count = exclusive_sums(mask.astype(float), starts)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scored = exclusive_sums(np.where(mask, goals_for, 0.0), starts) / count
+            conceded = (
+                exclusive_sums(np.where(mask, goals_against, 0.0), starts) / count
+            )
+        same = is_home == home
+        venue_for[same] = scored[same]
+        venue_against[same] = conceded[same]
+    rows["venue_goals_for"] = venue_for
+    rows["venue_goals_against"] = venue_against
+
+    # 휴식일 (같은 팀 직전 경기와의 간격, 첫 경기는 NaN)
+    rest = np.full(len(team), np.nan)
+    rest[1:] = np.diff(date) / SECONDS_PER_DAY
+    rest[team_offsets[:-1][np.diff(team_offsets) > 0]] = np.nan
+    rows["rest_days"] = rest
+    rows["team_offsets"] = team_offsets.astype(np.int64)
+    return matches, rows
+
+
+def write(columns, teams, source, last_updated):
+    """컬럼 저장 후 현재 버전으로 지정 → meta"""
+    matches, rows = compute(columns, len(teams))
+    digest = hashlib.sha256(json.dumps(teams).encode())
+    for name in BASE_COLUMNS:
+        digest.update(columns[name].tobytes())
+    version = digest.hexdigest()[:16]
+
+    root = store_dir()
+    directory = root / version
+    meta = {
+        "version": version,
+        "source": source,
+        "last_updated": last_updated,
+        "teams": teams,
+        "matches": len(matches["match_pk"]),
+        "match_columns": list(matches),
+        "row_columns": list(rows),
+    }
+    if not directory.exists():
+        # 다른 프로세스와 겹치지 않는 임시 디렉터리에 쓰고 이름 변경
+        tmp = root / f".{version}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+        for group, arrays in (("matches", matches), ("rows", rows)):
+            (tmp / group).mkdir()
+            for name, array in arrays.items():
+                np.save(tmp / group / f"{name}.npy", array)
+        try:
+            os.replace(tmp, directory)
+        except OSError:  # 같은 버전을 다른 프로세스가 먼저 만든 경우
+            shutil.rmtree(tmp, ignore_errors=True)
+    _write_atomic(directory / "meta.json", json.dumps(meta))
+    _write_atomic(root / "current.json", json.dumps({"version": version}))
+    _prune(root, version)
+    return meta
+
+
+def _write_atomic(path, content):
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(content)
+    os.replace(tmp, path)
+
+
+def _prune(root, current):
+    """오래된 버전 디렉터리 정리"""
+    versions = sorted(
+        (
+            path
+            for path in root.iterdir()
+            if path.is_dir() and path.name != current and not path.name.startswith(".")
+        ),
+        key=lambda path: path.stat().st_mtime,
+    )
+    for path in versions[: max(0, len(versions) - (KEEP_VERSIONS - 1))]:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def current_meta():
+    """현재 버전 meta (없으면 None)"""
+    try:
+        pointer = json.loads((store_dir() / "current.json").read_text())
+        return json.loads((store_dir() / pointer["version"] / "meta.json").read_text())
+    except (FileNotFoundError, KeyError, ValueError):
+        return None
+
+
+def last_updated(matches):
+    times = [match["updated_at"] for match in matches]
+    return max(times).isoformat() if times else None
+
+
+def rebuild():
+    """Match 전체로 다시 만듦 → meta"""
+    source = dataset_validators(Match)[0]
+    matches = read_matches(Match.objects.all())
+    teams = []
+    return write(base_columns(matches, teams), teams, source, last_updated(matches))
+
+
+def update():
+    """
+    마지막 빌드 이후 수정된 경기만 반영 → (meta, 전체 재빌드 여부)
+    DB 가 그대로면 쓰지 않음
+    """
+    source = dataset_validators(Match)[0]
+    meta = current_meta()
+    if (
+        meta is None
+        or meta["last_updated"] is None
+        or not set(BASE_COLUMNS) <= set(meta["match_columns"])
+    ):
+        return rebuild(), True
+    if meta["source"] == source:
+        return meta, False
+
+    # 같은 시각에 저장된 행이 있을 수 있어 경계 포함 (경기 ID 로 중복 제거)
+    since = datetime.fromisoformat(meta["last_updated"])
+    changed = read_matches(Match.objects.filter(updated_at__gte=since))
+    teams = meta["teams"]
+    existing = open_columns(meta, "matches", BASE_COLUMNS)
+    keep = ~np.isin(existing["match_pk"], [match["pk"] for match in changed])
+    fresh = base_columns(changed, teams)
+
+    columns = {
+        name: np.concatenate([existing[name][keep], fresh[name]])
+        for name in BASE_COLUMNS
+    }
+    # 삭제된 경기가 있으면 (개수 불일치) 전체 재빌드
+    if len(columns["match_pk"]) != Match.objects.count():
+        return rebuild(), True
+
+    order = np.lexsort((columns["match_pk"], columns["match_date"]))
+    columns = {name: array[order] for name, array in columns.items()}
+    updated = last_updated(changed) or meta["last_updated"]
+    return write(columns, teams, source, max(updated, meta["last_updated"])), False
+
+
+def open_columns(meta, group, names):
+    """버전 디렉터리의 컬럼들을 메모리 매핑으로 열기 (group: matches / rows)"""
+    directory = store_dir() / meta["version"] / group
+    return {name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in names}
+
+
+def load():
+    """
+    현재 특성 저장소 (DB 가 바뀌었으면 먼저 update())
+    같은 버전은 프로세스 안에서 memmap 을 재사용
+    """
+    with _lock:
+        meta, _ = update()
+        store = _loaded.get(meta["version"])
+        if store is None:
+            store = FeatureStore(
+                version=meta["version"],
+                source=meta["source"],
+                teams=meta["teams"],
+                matches=open_columns(meta, "matches", meta["match_columns"]),
+                rows=open_columns(meta, "rows", meta["row_columns"]),
+            )
+            _loaded.clear()
+            _loaded[meta["version"]] = store
+        return store
@@ -0,0 +1,60 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ai_analysis import backtest, evaluation
+
+
+class Command(BaseCommand):
+    help = "종료 경기를 라운드별로 다시 학습/예측해 모델 평가 (log-loss, Brier, calibration)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--models",
+            default=",".join(evaluation.MODELS),
+            help=f"평가할 모델 (쉼표 구분, 기본: {', '.join(evaluation.MODELS)})",
+        )
+        parser.add_argument(
+            "--start",
+            type=int,
+            help="이 라운드부터 예측 (기본 BACKTEST_START_MATCHDAY)",
+        )
+        parser.add_argument(
+            "--workers", type=int, help="프로세스 수 (기본 BACKTEST_WORKERS)"
+        )
+        parser.add_argument(
+            "--calibration", action="store_true", help="확률 구간별 calibration 출력"
+        )
+
+    def handle(self, *args, **options):
+        names = [name.strip() for name in options["models"].split(",") if name.strip()]
+        unknown = [name for name in names if name not in evaluation.MODELS]
+        if unknown:
+            raise CommandError(f"알 수 없는 모델: {', '.join(unknown)}")
+
+        runs = backtest.run(names, options["start"], options["workers"])
+        first = runs[0]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"평가 완료: {first.start_matchday}~{first.end_matchday}라운드 "
+                f"{first.matches}경기, 워커 {first.workers}개, {first.seconds}초"
+            )
+        )
+
+        for run in runs:
+            if run.log_loss is None:
+                self.stdout.write(f"  {run.model_name:<12} 평가할 경기 없음")
+                continue
+            line = (
+                f"  {run.model_name:<12} log-loss {run.log_loss:.4f}  "
+                f"Brier {run.brier:.4f}  정확도 {run.accuracy:.1%}"
+            )
+            last = backtest.previous(run)
+            if last and last.log_loss is not None:
+                line += f"  (직전 대비 log-loss {run.log_loss - last.log_loss:+.4f})"
+            self.stdout.write(line)
+
+            if options["calibration"]:
+                for row in run.calibration:
+                    self.stdout.write(
+                        f"      {row['bin']}: 예측 {row['predicted']:.3f} / "
+                        f"실제 {row['observed']:.3f} ({row['count']})"
+                    )
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from ai_analysis import predictions, previews
+
+
+class Command(BaseCommand):
+    help = "종료 경기로 팀 전력을 다시 추정하고 예정 경기 예측 저장"
+
+    def handle(self, *args, **options):
+        result = predictions.refit()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"예측 완료 ({result['model_version']}): "
+                f"팀 {result['teams']}개, 예정 경기 {result['predictions']}개, "
+                f"이전 버전 {result['evicted']}개 삭제, "
+                f"{result['seconds']}초"
+            )
+        )
+        self.stdout.write(
+            f"  홈 이점 {result['home_advantage']}, ρ {result['rho']}, "
+            f"반복 {result['iterations']}회"
+        )
+        self.stdout.write(f"  경기 프리뷰 갱신: {previews.refresh()}개")
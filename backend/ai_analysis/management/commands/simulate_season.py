@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from ai_analysis import season
+
+
+class Command(BaseCommand):
+    help = "시즌 최종 순위 시뮬레이션 실행 후 결과 저장 (/api/predictions/season/)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, help="시뮬레이션 수")
+        parser.add_argument("--seed", type=int, help="난수 시드")
+
+    def handle(self, *args, **options):
+        result = season.refresh(options["count"], options["seed"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"시뮬레이션 {result['simulations']}회, "
+                f"남은 경기 {result['remaining_fixtures']}개, "
+                f"{result['seconds']}초 (버전 {result['version']})"
+            )
+        )
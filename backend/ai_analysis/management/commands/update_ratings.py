@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from ai_analysis import ratings
+
+
+class Command(BaseCommand):
+    help = "새로 끝난 경기를 팀 Elo 레이팅에 반영 (--rebuild: 전체 다시 계산)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="모든 종료 경기로 처음부터 다시 계산",
+        )
+
+    def handle(self, *args, **options):
+        if options["rebuild"]:
+            count, rebuilt = ratings.rebuild(), True
+        else:
+            count, rebuilt = ratings.update()
+        suffix = " (전체 재계산)" if rebuilt else ""
+        self.stdout.write(self.style.SUCCESS(f"레이팅 반영: {count}경기{suffix}"))
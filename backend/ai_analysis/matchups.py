@@ -0,0 +1,260 @@
+"""
+팀 맞대결 집계 (HeadToHead)
+- 순서 없는 팀 쌍당 1행: 경기 수, 팀별 승/무, 득점, 최근 HEAD_TO_HEAD_RECENT 경기 결과
+- update(): 마지막 반영 이후 수정된 경기의 팀 쌍만 다시 집계 (update_matches 적재 후 호출)
+  집계된 경기 수가 종료 경기 수와 다르면 rebuild()
+- rebuild(): 전체 종료 경기로 처음부터 다시 집계
+- 읽는 쪽(맞대결 API, 경기 프리뷰)은 팀 쌍으로 집계 행만 조회 (경기 테이블을 훑지 않음)
+"""
+
+from datetime import datetime
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max, Q, Sum
+
+from matches.models import Match
+from teams.models import Team
+
+from .models import HeadToHead
+
+MATCH_FIELDS = [
+    "match_id",
+    "match_date",
+    "home_team_id",
+    "home_team_name",
+    "away_team_id",
+    "away_team_name",
+    "home_score",
+    "away_score",
+]
+
+UPDATE_FIELDS = [
+    "team_a_name",
+    "team_b_name",
+    "played",
+    "team_a_wins",
+    "draws",
+    "team_b_wins",
+    "team_a_goals",
+    "team_b_goals",
+    "recent",
+    "last_match_date",
+    "source_updated_at",
+    "updated_at",
+]
+
+RESULT_FIELDS = {"W": "wins", "D": "draws", "L": "losses"}
+
+
+def pair_key(team_id, other_id):
+    """두 팀 ID → 저장 순서 (team_a_id, team_b_id)"""
+    return (team_id, other_id) if team_id < other_id else (other_id, team_id)
+
+
+def finished_matches():
+    """집계에 반영할 종료 경기 (날짜순)"""
+    return Match.objects.filter(
+        status="finished", home_score__isnull=False, away_score__isnull=False
+    ).order_by("match_date", "pk")
+
+
+def latest_update():
+    """경기 테이블의 마지막 수정 시각 (읽기 전에 기록 → 다음 증분 갱신 기준)"""
+    return Match.objects.aggregate(last=Max("updated_at"))["last"]
+
+
+def aggregate(matches, source_updated_at):
+    """경기 목록(values dict, 날짜순) → 팀 쌍별 HeadToHead 객체 목록"""
+    records = {}
+    for match in matches:
+        home_id, away_id = match["home_team_id"], match["away_team_id"]
+        key = pair_key(home_id, away_id)
+        record = records.get(key)
+        if record is None:
+            names = {
+                home_id: match["home_team_name"],
+                away_id: match["away_team_name"],
+            }
+            record = records[key] = HeadToHead(
+                team_a_id=key[0],
+                team_a_name=names[key[0]],
+                team_b_id=key[1],
+                team_b_name=names[key[1]],
+                source_updated_at=source_updated_at,
+            )
+
+        a_goals, b_goals = match["home_score"], match["away_score"]
+        if home_id != key[0]:
+            a_goals, b_goals = b_goals, a_goals
+        record.played += 1
+        record.team_a_goals += a_goals
+        record.team_b_goals += b_goals
+        if a_goals > b_goals:
+            record.team_a_wins += 1
+        elif a_goals < b_goals:
+            record.team_b_wins += 1
+        else:
+            record.draws += 1
+        record.recent.insert(
+            0,
+            {
+                "match_id": match["match_id"],
+                "match_date": match["match_date"].isoformat(),
+                "home_team_id": home_id,
+                "home_score": match["home_score"],
+                "away_score": match["away_score"],
+            },
+        )
+        del record.recent[settings.HEAD_TO_HEAD_RECENT :]
+        record.last_match_date = match["match_date"]
+    return list(records.values())
+
+
+@transaction.atomic
+def rebuild():
+    """전체 종료 경기로 다시 집계 → 팀 쌍 수"""
+    source = latest_update()
+    records = aggregate(list(finished_matches().values(*MATCH_FIELDS)), source)
+    HeadToHead.objects.all().delete()
+    HeadToHead.objects.bulk_create(records, batch_size=500)
+    return len(records)
+
+
+def pairs_filter(pairs):
+    """팀 쌍 목록 → HeadToHead 조건 (OR)"""
+    condition = Q(pk__in=[])
+    for team_a_id, team_b_id in pairs:
+        condition |= Q(team_a_id=team_a_id, team_b_id=team_b_id)
+    return condition
+
+
+@transaction.atomic
+def update():
+    """바뀐 경기의 팀 쌍만 다시 집계 → (갱신한 팀 쌍 수, 전체 재집계 여부)"""
+    watermark = HeadToHead.objects.aggregate(last=Max("source_updated_at"))["last"]
+    if watermark is None:
+        return rebuild(), True
+
+    source = latest_update()
+    pairs = {
+        pair_key(home_id, away_id)
+        for home_id, away_id in Match.objects.filter(
+            updated_at__gte=watermark
+        ).values_list("home_team_id", "away_team_id")
+    }
+    if pairs:
+        team_ids = {team_id for pair in pairs for team_id in pair}
+        matches = [
+            match
+            for match in finished_matches()
+            .filter(home_team_id__in=team_ids, away_team_id__in=team_ids)
+            .values(*MATCH_FIELDS)
+            if pair_key(match["home_team_id"], match["away_team_id"]) in pairs
+        ]
+        records = aggregate(matches, source)
+
+        # 종료 경기가 없어진 팀 쌍 (종료 취소 등) 은 삭제
+        emptied = pairs - {(record.team_a_id, record.team_b_id) for record in records}
+        if emptied:
+            HeadToHead.objects.filter(pairs_filter(emptied)).delete()
+        HeadToHead.objects.bulk_create(
+            records,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=["team_a_id", "team_b_id"],
+            update_fields=UPDATE_FIELDS,
+        )
+
+    # 삭제된 경기 등으로 집계가 맞지 않으면 전체 재집계
+    played = HeadToHead.objects.aggregate(total=Sum("played"))["total"] or 0
+    if played != finished_matches().count():
+        return rebuild(), True
+    return len(pairs), False
+
+
+def result_letter(goals_for, goals_against):
+    """득실점 → W / D / L"""
+    if goals_for > goals_against:
+        return "W"
+    return "D" if goals_for == goals_against else "L"
+
+
+def lookup(pairs):
+    """(팀 ID, 팀 ID) 목록 → {pair_key: HeadToHead} (쿼리 1번, 맞대결이 없는 쌍은 빠짐)"""
+    keys = {pair_key(team_id, other_id) for team_id, other_id in pairs}
+    if not keys:
+        return {}
+    team_ids = {team_id for key in keys for team_id in key}
+    rows = HeadToHead.objects.filter(
+        team_a_id__in=team_ids, team_b_id__in=team_ids
+    ).order_by()
+    return {
+        (row.team_a_id, row.team_b_id): row
+        for row in rows
+        if (row.team_a_id, row.team_b_id) in keys
+    }
+
+
+def team_names(record, *team_ids):
+    """집계 행 → {팀 ID: 팀 이름} (맞대결이 없으면 Team 테이블에서 조회)"""
+    if record is not None:
+        return {
+            record.team_a_id: record.team_a_name,
+            record.team_b_id: record.team_b_name,
+        }
+    return dict(
+        Team.objects.filter(team_id__in=team_ids).values_list("team_id", "team_name")
+    )
+
+
+def for_team(record, team_id, before=None):
+    """
+    집계 행 → team_id 팀 기준 맞대결 dict (record 가 None 이면 0경기)
+    before 가 있으면 그 시각 이후 경기는 뺌 (최근 목록에 있는 경기만 뺄 수 있음)
+    """
+    result = {
+        "played": 0,
+        "wins": 0,
+        "draws": 0,
+        "losses": 0,
+        "goals_for": 0,
+        "goals_against": 0,
+        "recent": [],
+    }
+    if record is None:
+        return result
+
+    is_a = record.team_a_id == team_id
+    result.update(
+        {
+            "played": record.played,
+            "wins": record.team_a_wins if is_a else record.team_b_wins,
+            "draws": record.draws,
+            "losses": record.team_b_wins if is_a else record.team_a_wins,
+            "goals_for": record.team_a_goals if is_a else record.team_b_goals,
+            "goals_against": record.team_b_goals if is_a else record.team_a_goals,
+        }
+    )
+    for game in record.recent:
+        is_home = game["home_team_id"] == team_id
+        goals_for = game["home_score"] if is_home else game["away_score"]
+        goals_against = game["away_score"] if is_home else game["home_score"]
+        outcome = result_letter(goals_for, goals_against)
+        if before and datetime.fromisoformat(game["match_date"]) >= before:
+            result["played"] -= 1
+            result[RESULT_FIELDS[outcome]] -= 1
+            result["goals_for"] -= goals_for
+            result["goals_against"] -= goals_against
+            continue
+        result["recent"].append(
+            {
+                "match_id": game["match_id"],
+                "match_date": game["match_date"],
+                "is_home": is_home,
+                "goals_for": goals_for,
+                "goals_against": goals_against,
+                "result": outcome,
+            }
+        )
+    return result
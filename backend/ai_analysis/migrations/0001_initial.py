@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("matches", "0002_updated_at_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MatchPrediction",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("model_version", models.CharField(max_length=50)),
+                ("home_win", models.FloatField()),
+                ("draw", models.FloatField()),
+                ("away_win", models.FloatField()),
+                ("home_expected_goals", models.FloatField()),
+                ("away_expected_goals", models.FloatField()),
+                ("likely_home_score", models.PositiveSmallIntegerField()),
+                ("likely_away_score", models.PositiveSmallIntegerField()),
+                ("scorelines", models.JSONField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "match",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="prediction",
+                        to="matches.match",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "경기 예측",
+                "verbose_name_plural": "경기 예측",
+                "indexes": [
+                    models.Index(
+                        fields=["updated_at"], name="ai_analysis_updated_62a4b1_idx"
+                    )
+                ],
+            },
+        ),
+    ]
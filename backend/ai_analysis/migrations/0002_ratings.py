@@ -0,0 +1,99 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ai_analysis", "0001_initial"),
+        ("matches", "0002_updated_at_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TeamRating",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("team_id", models.CharField(max_length=100, unique=True)),
+                ("team_name", models.CharField(max_length=200)),
+                ("rating", models.FloatField()),
+                ("matches_played", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "팀 레이팅",
+                "verbose_name_plural": "팀 레이팅",
+                "ordering": ["-rating"],
+                "indexes": [
+                    models.Index(
+                        fields=["-rating"], name="ai_analysis_rating_478390_idx"
+                    ),
+                    models.Index(
+                        fields=["updated_at"], name="ai_analysis_updated_324855_idx"
+                    ),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="RatingHistory",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("team_id", models.CharField(max_length=100)),
+                ("team_name", models.CharField(max_length=200)),
+                ("opponent_name", models.CharField(max_length=200)),
+                ("is_home", models.BooleanField()),
+                ("match_date", models.DateTimeField()),
+                ("goals_for", models.PositiveSmallIntegerField()),
+                ("goals_against", models.PositiveSmallIntegerField()),
+                ("expected", models.FloatField()),
+                ("rating_before", models.FloatField()),
+                ("rating_after", models.FloatField()),
+                (
+                    "match",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rating_history",
+                        to="matches.match",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "레이팅 기록",
+                "verbose_name_plural": "레이팅 기록",
+                "ordering": ["match_date"],
+                "indexes": [
+                    models.Index(
+                        fields=["team_id", "match_date"],
+                        name="ai_analysis_team_id_d1b0c6_idx",
+                    ),
+                    models.Index(
+                        fields=["match_date"], name="ai_analysis_match_d_497c06_idx"
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("match", "team_id"),
+                        name="unique_rating_history_match_team",
+                    )
+                ],
+            },
+        ),
+    ]
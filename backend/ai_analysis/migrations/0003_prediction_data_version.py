@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ai_analysis", "0002_ratings"),
+        ("matches", "0002_updated_at_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="matchprediction",
+            name="data_version",
+            field=models.CharField(default="", max_length=32),
+        ),
+        migrations.AddIndex(
+            model_name="matchprediction",
+            index=models.Index(
+                fields=["model_version", "data_version"],
+                name="ai_analysis_model_v_302b69_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ai_analysis", "0003_prediction_data_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BacktestRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("run_id", models.CharField(max_length=32)),
+                ("model_name", models.CharField(max_length=50)),
+                ("data_version", models.CharField(max_length=32)),
+                ("parameters", models.JSONField(default=dict)),
+                ("start_matchday", models.PositiveSmallIntegerField()),
+                ("end_matchday", models.PositiveSmallIntegerField()),
+                ("matches", models.PositiveIntegerField(default=0)),
+                ("log_loss", models.FloatField(null=True)),
+                ("brier", models.FloatField(null=True)),
+                ("accuracy", models.FloatField(null=True)),
+                ("calibration", models.JSONField(default=list)),
+                ("workers", models.PositiveSmallIntegerField(default=1)),
+                ("seconds", models.FloatField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "예측 모델 평가",
+                "verbose_name_plural": "예측 모델 평가",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["model_name", "-created_at"],
+                        name="ai_analysis_model_n_b99994_idx",
+                    ),
+                    models.Index(
+                        fields=["run_id"], name="ai_analysis_run_id_7f7f2f_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ai_analysis", "0004_backtest_runs"),
+        ("matches", "0002_updated_at_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MatchPreview",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("data_version", models.CharField(max_length=32)),
+                ("content", models.JSONField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "match",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="preview",
+                        to="matches.match",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "경기 프리뷰",
+                "verbose_name_plural": "경기 프리뷰",
+                "indexes": [
+                    models.Index(
+                        fields=["data_version"], name="ai_analysis_data_ve_3b4722_idx"
+                    ),
+                    models.Index(
+                        fields=["updated_at"], name="ai_analysis_updated_d604e8_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ai_analysis", "0005_match_previews"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="HeadToHead",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("team_a_id", models.CharField(max_length=100)),
+                ("team_a_name", models.CharField(max_length=200)),
+                ("team_b_id", models.CharField(max_length=100)),
+                ("team_b_name", models.CharField(max_length=200)),
+                ("played", models.PositiveIntegerField(default=0)),
+                ("team_a_wins", models.PositiveIntegerField(default=0)),
+                ("draws", models.PositiveIntegerField(default=0)),
+                ("team_b_wins", models.PositiveIntegerField(default=0)),
+                ("team_a_goals", models.PositiveIntegerField(default=0)),
+                ("team_b_goals", models.PositiveIntegerField(default=0)),
+                ("recent", models.JSONField(default=list)),
+                ("last_match_date", models.DateTimeField(null=True)),
+                ("source_updated_at", models.DateTimeField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "맞대결 기록",
+                "verbose_name_plural": "맞대결 기록",
+                "indexes": [
+                    models.Index(
+                        fields=["team_b_id"], name="ai_analysis_team_b__427eaa_idx"
+                    ),
+                    models.Index(
+                        fields=["updated_at"], name="ai_analysis_updated_86d142_idx"
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("team_a_id", "team_b_id"),
+                        name="unique_head_to_head_pair",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -1 +1,226 @@
-# Create your models here.
+from django.db import models
+
+from matches.models import Match
+
+
+class MatchPrediction(models.Model):
+    """
+    경기 예측 결과 (ai_analysis/predictions.py 의 refit() 이 채움)
+    (경기, 모델 버전, 입력 데이터 버전) 으로 구분 - 경기당 최신 1행만 유지
+    """
+
+    match = models.OneToOneField(
+        Match, on_delete=models.CASCADE, related_name="prediction"
+    )
+    model_version = models.CharField(max_length=50)
+    # 예측에 쓴 종료 경기 결과의 버전 (predictions.data_version())
+    data_version = models.CharField(max_length=32, default="")
+
+    # 승/무/패 확률
+    home_win = models.FloatField()
+    draw = models.FloatField()
+    away_win = models.FloatField()
+
+    # 기대 득점, 가장 가능성 높은 점수
+    home_expected_goals = models.FloatField()
+    away_expected_goals = models.FloatField()
+    likely_home_score = models.PositiveSmallIntegerField()
+    likely_away_score = models.PositiveSmallIntegerField()
+
+    # 점수 확률 행렬 [홈 득점][원정 득점]
+    scorelines = models.JSONField()
+
+    # 타임스탬프
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "경기 예측"
+        verbose_name_plural = "경기 예측"
+        indexes = [
+            models.Index(fields=["model_version", "data_version"]),
+            models.Index(fields=["updated_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.match} ({self.home_win:.0%} / {self.draw:.0%} / {self.away_win:.0%})"
+
+
+class MatchPreview(models.Model):
+    """
+    경기 프리뷰 (ai_analysis/previews.py 가 라운드 단위로 한 번에 만듦)
+    data_version 이 현재 입력(특성 저장소/예측/순위표) 버전과 다르면 다시 만듦
+    """
+
+    match = models.OneToOneField(
+        Match, on_delete=models.CASCADE, related_name="preview"
+    )
+    data_version = models.CharField(max_length=32)
+
+    # 승/무/패 확률, 예상 스코어, 폼, 맞대결, 핵심 포인트 (previews.build 형식)
+    content = models.JSONField()
+
+    # 타임스탬프
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "경기 프리뷰"
+        verbose_name_plural = "경기 프리뷰"
+        indexes = [
+            models.Index(fields=["data_version"]),
+            models.Index(fields=["updated_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.match} 프리뷰"
+
+
+class TeamRating(models.Model):
+    """팀 현재 Elo 레이팅 (ai_analysis/ratings.py)"""
+
+    team_id = models.CharField(max_length=100, unique=True)
+    team_name = models.CharField(max_length=200)
+    rating = models.FloatField()
+    matches_played = models.PositiveIntegerField(default=0)
+
+    # 타임스탬프
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "팀 레이팅"
+        verbose_name_plural = "팀 레이팅"
+        ordering = ["-rating"]
+        indexes = [
+            models.Index(fields=["-rating"]),
+            models.Index(fields=["updated_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.team_name} ({self.rating:.0f})"
+
+
+class RatingHistory(models.Model):
+    """경기 1개가 팀 1개의 레이팅에 준 변화 (경기당 홈/원정 2행)"""
+
+    match = models.ForeignKey(
+        Match, on_delete=models.CASCADE, related_name="rating_history"
+    )
+    team_id = models.CharField(max_length=100)
+    team_name = models.CharField(max_length=200)
+    opponent_name = models.CharField(max_length=200)
+    is_home = models.BooleanField()
+    match_date = models.DateTimeField()
+
+    goals_for = models.PositiveSmallIntegerField()
+    goals_against = models.PositiveSmallIntegerField()
+    expected = models.FloatField()  # 경기 전 기대 승점 (0~1)
+    rating_before = models.FloatField()
+    rating_after = models.FloatField()
+
+    class Meta:
+        verbose_name = "레이팅 기록"
+        verbose_name_plural = "레이팅 기록"
+        ordering = ["match_date"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["match", "team_id"], name="unique_rating_history_match_team"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["team_id", "match_date"]),
+            models.Index(fields=["match_date"]),
+        ]
+
+    def __str__(self):
+        return f"{self.team_name} {self.rating_before:.0f} → {self.rating_after:.0f}"
+
+
+class HeadToHead(models.Model):
+    """
+    두 팀의 종료 경기 맞대결 집계 (ai_analysis/matchups.py)
+    순서 없는 팀 쌍당 1행 - team_a_id < team_b_id 로 저장, 승/득점은 각 팀 기준
+    """
+
+    team_a_id = models.CharField(max_length=100)
+    team_a_name = models.CharField(max_length=200)
+    team_b_id = models.CharField(max_length=100)
+    team_b_name = models.CharField(max_length=200)
+
+    played = models.PositiveIntegerField(default=0)
+    team_a_wins = models.PositiveIntegerField(default=0)
+    draws = models.PositiveIntegerField(default=0)
+    team_b_wins = models.PositiveIntegerField(default=0)
+    team_a_goals = models.PositiveIntegerField(default=0)
+    team_b_goals = models.PositiveIntegerField(default=0)
+
+    # 최근 맞대결 (최신순, HEAD_TO_HEAD_RECENT 개)
+    # [{"match_id", "match_date", "home_team_id", "home_score", "away_score"}]
+    recent = models.JSONField(default=list)
+    last_match_date = models.DateTimeField(null=True)
+
+    # 집계에 반영한 경기의 마지막 수정 시각 (다음 증분 갱신 기준)
+    source_updated_at = models.DateTimeField()
+
+    # 타임스탬프
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "맞대결 기록"
+        verbose_name_plural = "맞대결 기록"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["team_a_id", "team_b_id"], name="unique_head_to_head_pair"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["team_b_id"]),
+            models.Index(fields=["updated_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.team_a_name} vs {self.team_b_name} ({self.played}경기)"
+
+
+class BacktestRun(models.Model):
+    """
+    예측 모델 워크포워드 평가 결과 (ai_analysis/backtest.py, backtest_models 커맨드)
+    한 번 실행에 모델마다 1행 (run_id 로 묶음)
+    """
+
+    run_id = models.CharField(max_length=32)
+    model_name = models.CharField(max_length=50)
+    data_version = models.CharField(max_length=32)  # 특성 저장소 버전
+    parameters = models.JSONField(default=dict)
+
+    # 평가 범위
+    start_matchday = models.PositiveSmallIntegerField()
+    end_matchday = models.PositiveSmallIntegerField()
+    matches = models.PositiveIntegerField(default=0)
+
+    # 지표 (낮을수록 좋음: log_loss, brier)
+    log_loss = models.FloatField(null=True)
+    brier = models.FloatField(null=True)
+    accuracy = models.FloatField(null=True)
+    calibration = models.JSONField(default=list)
+
+    workers = models.PositiveSmallIntegerField(default=1)
+    seconds = models.FloatField(default=0)
+
+    # 타임스탬프
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "예측 모델 평가"
+        verbose_name_plural = "예측 모델 평가"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["model_name", "-created_at"]),
+            models.Index(fields=["run_id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.model_name} ({self.created_at:%Y-%m-%d %H:%M}) log-loss {self.log_loss}"
@@ -0,0 +1,133 @@
+"""
+시즌 몬테카를로 시뮬레이션 (NumPy 만 사용, Django 와 무관 - 워커 프로세스에서 import)
+- 남은 경기마다 점수 확률 행렬(MatchPrediction.scorelines)에서 점수를 뽑아
+  현재 승점/득실차/득점에 더하고 최종 순위를 매김
+- 시뮬레이션 × 경기 배열을 chunk 개씩 한 번에 계산
+  점수 추출: 경기별 누적확률에 경기 번호를 더해 한 줄로 이어 붙이면
+  (경기 번호 + 난수) 를 searchsorted 한 번으로 모든 경기의 점수 칸을 찾을 수 있음
+- 순위: 승점 > 득실차 > 득점 > 무작위
+- 결과: 팀 × 최종 순위 횟수 행렬 (샤드별 결과를 더하면 전체 결과)
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+def team_totals(home_slots, away_slots, home_values, away_values, shape):
+    """(시뮬레이션, 팀) 칸 번호별 합계 → shape 배열"""
+    length = shape[0] * shape[1]
+    total = np.bincount(home_slots, home_values.ravel(), length)
+    total += np.bincount(away_slots, away_values.ravel(), length)
+    return total.reshape(shape)
+
+
+def simulate(
+    points, goal_difference, goals_for, home, away, scorelines, count, seed, chunk=10000
+):
+    """
+    count 번 시즌 시뮬레이션 → (팀 × 순위 횟수, 팀별 최종 승점 합계)
+    scorelines: (경기 수, G+1, G+1) 점수 확률 행렬
+    """
+    rng = np.random.default_rng(seed)
+    n_teams = len(points)
+    n_fixtures = len(home)
+    size = scorelines.shape[-1]
+    cells = size * size
+
+    cumulative = scorelines.reshape(n_fixtures, cells).cumsum(axis=1)
+    cumulative /= cumulative[:, -1:]  # 반올림 오차 보정 (마지막 값 1)
+    offsets = np.arange(n_fixtures)
+    flat = (cumulative + offsets[:, None]).ravel()
+
+    counts = np.zeros((n_teams, n_teams), dtype=np.int64)
+    total_points = np.zeros(n_teams)
+    done = 0
+    while done < count:
+        sims = min(chunk, count - done)
+        done += sims
+
+        draws = rng.random((sims, n_fixtures)) + offsets
+        cell = np.searchsorted(flat, draws, side="right") - offsets * cells
+        np.clip(cell, 0, cells - 1, out=cell)
+        home_goals, away_goals = np.divmod(cell, size)
+
+        home_points = np.where(
+            home_goals > away_goals, 3, np.where(home_goals == away_goals, 1, 0)
+        )
+        away_points = np.where(
+            away_goals > home_goals, 3, np.where(home_goals == away_goals, 1, 0)
+        )
+
+        # (시뮬레이션, 팀) 칸 번호로 펼쳐서 bincount 로 팀별 합계
+        base = np.arange(sims)[:, None] * n_teams
+        slots = (base + home).ravel(), (base + away).ravel()
+        shape = (sims, n_teams)
+        final_points = points + team_totals(*slots, home_points, away_points, shape)
+        final_difference = goal_difference + team_totals(
+            *slots, home_goals - away_goals, away_goals - home_goals, shape
+        )
+        final_goals = goals_for + team_totals(*slots, home_goals, away_goals, shape)
+
+        # 승점 > 득실차 > 득점 > 무작위 를 하나의 점수로
+        score = (
+            final_points * 1e7
+            + (final_difference + 5000) * 1e3
+            + np.minimum(final_goals, 999)
+            + rng.random((sims, n_teams))
+        )
+        order = np.argsort(-score, axis=1)
+        positions = np.empty_like(order)
+        np.put_along_axis(positions, order, np.arange(n_teams), axis=1)
+
+        counts += np.bincount(
+            (np.arange(n_teams) * n_teams + positions).ravel(),
+            minlength=n_teams * n_teams,
+        ).reshape(n_teams, n_teams)
+        total_points += final_points.sum(axis=0)
+
+    return counts, total_points
+
+
+def run(
+    points,
+    goal_difference,
+    goals_for,
+    home,
+    away,
+    scorelines,
+    count,
+    seed=None,
+    shards=1,
+    executor=None,
+):
+    """
+    count 번을 shards 개로 나눠 실행 (executor 가 있으면 프로세스 풀에서)
+    → (팀 × 순위 확률, 팀별 기대 승점)
+    """
+    seeds = np.random.SeedSequence(seed).spawn(shards)
+    sizes = [count // shards + (i < count % shards) for i in range(shards)]
+    args = [
+        (points, goal_difference, goals_for, home, away, scorelines, size, shard_seed)
+        for size, shard_seed in zip(sizes, seeds, strict=True)
+        if size
+    ]
+
+    if executor is None:
+        results = [simulate(*arg) for arg in args]
+    else:
+        results = list(executor.map(_simulate, args))
+
+    counts = sum(result[0] for result in results)
+    total_points = sum(result[1] for result in results)
+    return counts / count, total_points / count
+
+
+def _simulate(args):
+    return simulate(*args)
+
+
+def create_executor(workers):
+    """시뮬레이션용 프로세스 풀 (spawn - 스레드가 있는 서버 프로세스에서도 안전)"""
+    return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
@@ -0,0 +1,180 @@
+"""
+경기 예측 갱신 - DB ↔ engine.py
+- 종료 경기로 팀 전력을 다시 추정하고 예정 경기 전체를 한 번에 예측해 MatchPrediction 저장
+  (경기 배열은 특성 저장소 features.py 에서 읽음)
+- update_matches 적재 후, predict_matches 커맨드에서 호출
+- 이미 끝난 경기의 예측은 지우지 않음 (경기 전 마지막 예측 기록)
+- 예측 행은 (모델 버전, 입력 데이터 버전) 을 함께 저장
+  저장 후 버전이 다른 예정/연기/취소 경기 예측은 삭제 (진행/종료 경기는 경기 전 값 유지)
+  → 읽는 쪽(store.py)은 다시 계산하지 않고 쿼리 1번으로 조회
+"""
+
+import hashlib
+import time
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max, Sum
+from django.utils import timezone
+
+from matches.models import Match
+
+from . import engine, features
+from .models import MatchPrediction
+
+MODEL_VERSION = "dixon-coles-1"
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# 버전이 달라도 지우지 않는 경기 상태 (경기 전 마지막 예측 기록)
+KEPT_STATUSES = ["live", "finished"]
+
+UPDATE_FIELDS = [
+    "model_version",
+    "data_version",
+    "home_win",
+    "draw",
+    "away_win",
+    "home_expected_goals",
+    "away_expected_goals",
+    "likely_home_score",
+    "likely_away_score",
+    "scorelines",
+    "updated_at",
+]
+
+
+def finished_results():
+    """전력 추정에 쓰는 종료 경기"""
+    return Match.objects.filter(
+        status="finished", home_score__isnull=False, away_score__isnull=False
+    )
+
+
+def data_version():
+    """종료 경기 결과의 버전 (개수, 마지막 수정 시각, 득점 합계의 해시)"""
+    stats = finished_results().aggregate(
+        count=Count("pk"),
+        last=Max("updated_at"),
+        home=Sum("home_score"),
+        away=Sum("away_score"),
+    )
+    key = f"{stats['count']}:{stats['last']}:{stats['home']}:{stats['away']}"
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+def load_results(store):
+    """종료 경기 → (팀 ID → 번호, 홈 번호, 원정 번호, 홈 득점, 원정 득점, 경과 일수)"""
+    matches = store.matches
+    finished = np.asarray(matches["finished"])
+
+    now = timezone.now().timestamp()
+    home = matches["home"][finished].astype(np.intp)
+    away = matches["away"][finished].astype(np.intp)
+    days = (now - matches["match_date"][finished]) / SECONDS_PER_DAY
+    return (
+        store.team_index(),
+        home,
+        away,
+        matches["home_goals"][finished],
+        matches["away_goals"][finished],
+        days,
+    )
+
+
+def fit_strengths(store=None):
+    """종료 경기로 팀 전력 추정 → (팀 ID → 번호, Strengths)"""
+    store = store or features.load()
+    index, home, away, home_goals, away_goals, days = load_results(store)
+    weights = np.exp(-settings.PREDICTION_TIME_DECAY * np.maximum(days, 0))
+    strengths = engine.fit(
+        home,
+        away,
+        home_goals,
+        away_goals,
+        len(index),
+        weights=weights,
+        prior=settings.PREDICTION_PRIOR_MATCHES,
+    )
+    return index, strengths
+
+
+def refit():
+    """팀 전력 재추정 + 예정 경기 전체 예측 저장 → 요약 dict"""
+    start = time.perf_counter()
+    version = data_version()
+    store = features.load()
+    index, strengths = fit_strengths(store)
+
+    matches = store.matches
+    scheduled = np.asarray(matches["status"]) == features.STATUSES.index("scheduled")
+    match_ids = matches["match_pk"][scheduled].tolist()
+    if match_ids:
+        home = matches["home"][scheduled].astype(np.intp)
+        away = matches["away"][scheduled].astype(np.intp)
+        lam, mu, matrix = engine.score_matrix(
+            strengths, home, away, settings.PREDICTION_MAX_GOALS
+        )
+        save(match_ids, lam, mu, matrix, version)
+    evicted = evict(MODEL_VERSION, version)
+
+    return {
+        "model_version": MODEL_VERSION,
+        "data_version": version,
+        "teams": len(index),
+        "predictions": len(match_ids),
+        "evicted": evicted,
+        "home_advantage": round(strengths.home_advantage, 3),
+        "rho": round(strengths.rho, 3),
+        "iterations": strengths.iterations,
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+@transaction.atomic
+def save(match_ids, lam, mu, matrix, version):
+    """예측 행 upsert (경기당 1행) - 배열 계산 결과를 행 단위로 풀어서 저장"""
+    home_win, draw, away_win = engine.outcome_probabilities(matrix)
+    home_score, away_score = engine.most_likely_scores(matrix)
+    columns = np.column_stack([home_win, draw, away_win, lam, mu]).round(4).tolist()
+    scores = np.column_stack([home_score, away_score]).tolist()
+    scorelines = matrix.round(4).tolist()
+
+    now = timezone.now()
+    predictions = [
+        MatchPrediction(
+            match_id=match_id,
+            model_version=MODEL_VERSION,
+            data_version=version,
+            home_win=values[0],
+            draw=values[1],
+            away_win=values[2],
+            home_expected_goals=values[3],
+            away_expected_goals=values[4],
+            likely_home_score=score[0],
+            likely_away_score=score[1],
+            scorelines=grid,
+            updated_at=now,
+        )
+        for match_id, values, score, grid in zip(
+            match_ids, columns, scores, scorelines, strict=True
+        )
+    ]
+    MatchPrediction.objects.bulk_create(
+        predictions,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=["match"],
+        update_fields=UPDATE_FIELDS,
+    )
+
+
+def evict(model_version, version):
+    """버전이 다른 예정/연기/취소 경기 예측 삭제 → 삭제한 행 수"""
+    deleted, _ = (
+        MatchPrediction.objects.exclude(match__status__in=KEPT_STATUSES)
+        .exclude(model_version=model_version, data_version=version)
+        .delete()
+    )
+    return deleted
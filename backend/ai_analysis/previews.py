@@ -0,0 +1,318 @@
+"""
+경기 프리뷰 - 라운드(matchday) 단위 일괄 생성
+- 승/무/패 확률, 가장 가능성 높은 스코어, 최근 폼, 순위, 맞대결을 모아 핵심 포인트 5개로 정리
+- 입력은 한 번에 읽음: 경기/예측/순위표/맞대결 쿼리 각 1번 + 특성 저장소(features.py) 배열
+  → 경기 수와 상관없이 쿼리 수가 같음 (경기별 쿼리 없음)
+- 결과는 MatchPreview 에 입력 데이터 버전(특성 저장소/예측/순위표/맞대결)과 함께 저장
+  생성은 데이터 적재 커맨드에서만 (refresh), 읽는 쪽(fetch)은 저장된 프리뷰만 조회 (없으면 None)
+"""
+
+import hashlib
+
+import numpy as np
+from django.db import transaction
+from django.utils import timezone
+
+from config.conditional import dataset_validators
+from matches.models import Match
+from teams.models import TeamStanding
+
+from . import features, matchups
+from .models import HeadToHead, MatchPrediction, MatchPreview
+from .predictions import MODEL_VERSION
+
+# 예상 스코어 후보 수
+LIKELY_SCORES = 3
+
+PREDICTION_FIELDS = [
+    "match_id",
+    "home_win",
+    "draw",
+    "away_win",
+    "home_expected_goals",
+    "away_expected_goals",
+    "scorelines",
+]
+
+MATCH_FIELDS = [
+    "pk",
+    "match_id",
+    "matchday",
+    "match_date",
+    "home_team_id",
+    "home_team_name",
+    "away_team_id",
+    "away_team_name",
+]
+
+RESULT_LETTERS = {3.0: "W", 1.0: "D", 0.0: "L"}
+
+
+def input_version(store=None):
+    """프리뷰 입력 데이터 버전 (특성 저장소 버전 + 예측/순위표/맞대결 테이블 검증값)"""
+    store = store or features.load()
+    tables, _ = dataset_validators(MatchPrediction, TeamStanding, HeadToHead)
+    key = f"{store.version}|{MODEL_VERSION}|{tables}"
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+def likely_scores(scorelines, count=LIKELY_SCORES):
+    """점수 행렬 → 확률 높은 스코어 count 개 [{"score", "probability"}]"""
+    matrix = np.asarray(scorelines, dtype=float)
+    top = np.argsort(matrix, axis=None)[::-1][:count]
+    return [
+        {
+            "score": f"{home}-{away}",
+            "probability": round(float(matrix[home, away]), 4),
+        }
+        for home, away in zip(*np.unravel_index(top, matrix.shape), strict=True)
+    ]
+
+
+def team_form(store, position):
+    """팀-경기 행 → 이 경기 전 최근 폼 dict"""
+    rows = store.rows
+    team = int(rows["team"][position])
+    start = store.team_rows(team).start
+    points = np.asarray(rows["points"][start:position])
+    recent = points[~np.isnan(points)][-features.FORM_WINDOW :]
+    rest_days = float(rows["rest_days"][position])
+    return {
+        "results": "".join(RESULT_LETTERS[value] for value in recent),
+        "points": int(rows["form_points"][position]),
+        "goals_for": int(rows["form_goals_for"][position]),
+        "goals_against": int(rows["form_goals_against"][position]),
+        "rest_days": None if np.isnan(rest_days) else round(rest_days, 1),
+    }
+
+
+def key_points(home_name, away_name, content):
+    """프리뷰 내용 → 핵심 포인트 목록 [{"type", "text", ...}] (최대 5개)"""
+    points = []
+
+    probabilities = content["probabilities"]
+    if probabilities:
+        outcomes = [
+            (probabilities["home_win"], f"{home_name} 승리", home_name),
+            (probabilities["draw"], "무승부", None),
+            (probabilities["away_win"], f"{away_name} 승리", away_name),
+        ]
+        value, label, team = max(outcomes, key=lambda outcome: outcome[0])
+        points.append(
+            {
+                "type": "prediction",
+                "team": team,
+                "value": value,
+                "text": f"AI 예측: {label} 확률 {value:.0%}",
+            }
+        )
+
+    if content["likely_scores"]:
+        likely = content["likely_scores"][0]
+        points.append(
+            {
+                "type": "scoreline",
+                "value": likely["score"],
+                "probability": likely["probability"],
+                "text": (
+                    f"가장 유력한 스코어 {likely['score']} "
+                    f"({likely['probability']:.0%})"
+                ),
+            }
+        )
+
+    form = content["form"]
+    if form["home"]["results"] or form["away"]["results"]:
+        points.append(
+            {
+                "type": "form",
+                "value": {
+                    "home": form["home"]["points"],
+                    "away": form["away"]["points"],
+                },
+                "text": (
+                    f"최근 {features.FORM_WINDOW}경기 승점 {home_name} "
+                    f"{form['home']['points']} ({form['home']['results'] or '-'}) vs "
+                    f"{away_name} {form['away']['points']} "
+                    f"({form['away']['results'] or '-'})"
+                ),
+            }
+        )
+
+    standings = content["standings"]
+    if standings["home"] and standings["away"]:
+        points.append(
+            {
+                "type": "standings",
+                "value": {
+                    "home": standings["home"]["rank"],
+                    "away": standings["away"]["rank"],
+                },
+                "text": (
+                    f"순위 {home_name} {standings['home']['rank']}위 "
+                    f"(승점 {standings['home']['points']}) vs {away_name} "
+                    f"{standings['away']['rank']}위 "
+                    f"(승점 {standings['away']['points']})"
+                ),
+            }
+        )
+
+    meetings = content["head_to_head"]
+    if meetings["played"]:
+        text = (
+            f"맞대결 {meetings['played']}경기 {home_name} 기준 "
+            f"{meetings['wins']}승 {meetings['draws']}무 {meetings['losses']}패"
+        )
+        last = meetings["recent"][0] if meetings["recent"] else None
+        if last:
+            venue = "홈" if last["is_home"] else "원정"
+            text += f", 직전 {venue} {last['goals_for']}-{last['goals_against']}"
+    else:
+        text = "이번 시즌 첫 맞대결"
+    points.append(
+        {
+            "type": "head_to_head",
+            "value": {
+                "wins": meetings["wins"],
+                "draws": meetings["draws"],
+                "losses": meetings["losses"],
+            },
+            "text": text,
+        }
+    )
+    return points[:5]
+
+
+@transaction.atomic
+def build(matchdays, store=None, version=None):
+    """라운드 목록의 경기 프리뷰를 한 번에 생성/저장 → 저장한 프리뷰 수"""
+    store = store or features.load()
+    version = version or input_version(store)
+
+    matches = list(Match.objects.filter(matchday__in=matchdays).values(*MATCH_FIELDS))
+    if not matches:
+        return 0
+    pks = [match["pk"] for match in matches]
+    predictions = {
+        row["match_id"]: row
+        for row in MatchPrediction.objects.filter(
+            match_id__in=pks, model_version=MODEL_VERSION
+        ).values(*PREDICTION_FIELDS)
+    }
+    standings = {
+        row["team_name"]: row
+        for row in TeamStanding.objects.values("team_name", "rank", "points")
+    }
+    meetings = matchups.lookup(
+        (match["home_team_id"], match["away_team_id"]) for match in matches
+    )
+
+    # 경기 pk → 특성 저장소 경기 번호, (경기 번호, 홈 여부) → 팀-경기 행 번호
+    match_pk = np.asarray(store.matches["match_pk"])
+    indices = np.flatnonzero(np.isin(match_pk, pks))
+    index_of = dict(zip(match_pk[indices].tolist(), indices.tolist(), strict=True))
+    positions = np.flatnonzero(np.isin(store.rows["match_index"], indices))
+    row_of = {
+        (int(store.rows["match_index"][p]), bool(store.rows["is_home"][p])): int(p)
+        for p in positions
+    }
+
+    now = timezone.now()
+    previews = []
+    for match in matches:
+        index = index_of.get(match["pk"])
+        if index is None:
+            continue
+        prediction = predictions.get(match["pk"])
+        content = {
+            "model_version": MODEL_VERSION if prediction else None,
+            "probabilities": None,
+            "expected_goals": None,
+            "likely_scores": [],
+            "form": {
+                "home": team_form(store, row_of[(index, True)]),
+                "away": team_form(store, row_of[(index, False)]),
+            },
+            "standings": {
+                side: (
+                    {
+                        "rank": standings[name]["rank"],
+                        "points": standings[name]["points"],
+                    }
+                    if name in standings
+                    else None
+                )
+                for side, name in (
+                    ("home", match["home_team_name"]),
+                    ("away", match["away_team_name"]),
+                )
+            },
+            # 이 경기 전까지의 맞대결 (홈 팀 기준)
+            "head_to_head": matchups.for_team(
+                meetings.get(
+                    matchups.pair_key(match["home_team_id"], match["away_team_id"])
+                ),
+                match["home_team_id"],
+                before=match["match_date"],
+            ),
+        }
+        if prediction:
+            content["probabilities"] = {
+                "home_win": prediction["home_win"],
+                "draw": prediction["draw"],
+                "away_win": prediction["away_win"],
+            }
+            content["expected_goals"] = {
+                "home": prediction["home_expected_goals"],
+                "away": prediction["away_expected_goals"],
+            }
+            content["likely_scores"] = likely_scores(prediction["scorelines"])
+        content["key_points"] = key_points(
+            match["home_team_name"], match["away_team_name"], content
+        )
+        previews.append(
+            MatchPreview(
+                match_id=match["pk"],
+                data_version=version,
+                content=content,
+                updated_at=now,
+            )
+        )
+
+    MatchPreview.objects.bulk_create(
+        previews,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=["match"],
+        update_fields=["data_version", "content", "updated_at"],
+    )
+    return len(previews)
+
+
+def refresh():
+    """예정 경기가 있는 라운드의 프리뷰를 한 번에 다시 생성 → 저장한 프리뷰 수"""
+    matchdays = (
+        Match.objects.filter(status="scheduled", matchday__isnull=False)
+        .values_list("matchday", flat=True)
+        .distinct()
+    )
+    return build(list(matchdays))
+
+
+def fetch(matchday):
+    """라운드의 저장된 프리뷰 → {경기 ID: 프리뷰 dict} (쿼리 1번, 요청 중에 생성하지 않음)"""
+    rows = MatchPreview.objects.filter(match__matchday=matchday).values_list(
+        "match__match_id", "data_version", "content"
+    )
+    return {
+        match_id: {"data_version": version, **content}
+        for match_id, version, content in rows
+    }
+
+
+def attach(rows, matchday, key="preview"):
+    """라운드 응답 행(dict, match_id 포함) 마다 프리뷰 추가 (없으면 None)"""
+    previews = fetch(matchday)
+    for row in rows:
+        row[key] = previews.get(row["match_id"])
+    return rows
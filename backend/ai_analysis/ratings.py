@@ -0,0 +1,241 @@
+"""
+팀 Elo 레이팅
+- 경기마다 기대 승점 E = 1 / (1 + 10^(-(홈 + 홈 이점 - 원정) / 400))
+  변화량 = K × 골득실 배수 × (실제 승점 - E)  (승 1, 무 0.5, 패 0)
+- 경기 배열(팀 번호, 득점, 날짜)은 특성 저장소(features.py)에서 읽음 (경기 행 반복 없음)
+- update(): 레이팅 기록이 없는 종료 경기만 이어서 반영 (update_matches 적재 후 호출)
+  이미 반영한 경기보다 이른 경기, 점수가 바뀐 경기가 있으면 rebuild()
+- rebuild(): 전체 종료 경기로 처음부터 다시 계산
+  같은 팀이 두 번 나오지 않는 경기 묶음(wave) 단위로 NumPy 배열 연산
+  (Elo 는 앞 경기 결과에 의존하므로 팀별 순서만 지키면 묶음 안은 동시에 계산 가능)
+"""
+
+from datetime import UTC, datetime
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+
+from . import features
+from .models import RatingHistory, TeamRating
+
+
+def finished_matches(store, pending=None):
+    """특성 저장소의 종료 경기 번호 (날짜순, pending 이 있으면 그 경기만)"""
+    finished = np.asarray(store.matches["finished"])
+    if pending is not None:
+        finished = finished & pending
+    return np.flatnonzero(finished)
+
+
+def goal_multiplier(goal_difference):
+    """골득실 배수 (1골 차 이하 1, 2골 1.5, 3골 이상 (11 + 차이) / 8)"""
+    difference = np.abs(goal_difference)
+    return np.where(
+        difference <= 1, 1.0, np.where(difference == 2, 1.5, (11 + difference) / 8)
+    )
+
+
+def assign_waves(home, away, n_teams):
+    """경기별 묶음 번호 - 각 팀의 직전 경기보다 뒤, 한 묶음에 같은 팀은 한 번만"""
+    last = [-1] * n_teams
+    waves = np.empty(len(home), dtype=np.intp)
+    for i, (h, a) in enumerate(zip(home.tolist(), away.tolist(), strict=True)):
+        wave = max(last[h], last[a]) + 1
+        waves[i] = last[h] = last[a] = wave
+    return waves
+
+
+def compute(home, away, home_goals, away_goals, ratings):
+    """
+    경기 배열(날짜순) + 시작 레이팅 → (홈 경기 전, 원정 경기 전, 홈 기대 승점, 변화량)
+    ratings 는 최종 레이팅으로 바뀜
+    """
+    k = settings.ELO_K
+    advantage = settings.ELO_HOME_ADVANTAGE
+    result = np.where(
+        home_goals > away_goals, 1.0, np.where(home_goals == away_goals, 0.5, 0.0)
+    )
+    multiplier = goal_multiplier(home_goals - away_goals)
+
+    home_before = np.empty(len(home))
+    away_before = np.empty(len(home))
+    expected = np.empty(len(home))
+    change = np.empty(len(home))
+
+    waves = assign_waves(home, away, len(ratings))
+    order = np.argsort(waves, kind="stable")
+    bounds = np.searchsorted(waves[order], np.arange(waves.max(initial=-1) + 2))
+    for start, end in zip(bounds[:-1], bounds[1:], strict=True):
+        games = order[start:end]
+        h, a = home[games], away[games]
+        home_before[games] = ratings[h]
+        away_before[games] = ratings[a]
+        expected[games] = 1 / (1 + 10 ** (-(ratings[h] + advantage - ratings[a]) / 400))
+        change[games] = k * multiplier[games] * (result[games] - expected[games])
+        ratings[h] += change[games]
+        ratings[a] -= change[games]
+    return home_before, away_before, expected, change
+
+
+def history_rows(store, indices, home_before, away_before, expected, change):
+    """계산 결과 → RatingHistory 객체 (경기당 2개)"""
+    matches = store.matches
+    teams = store.teams
+    rows = []
+    values = zip(
+        matches["match_pk"][indices].tolist(),
+        matches["match_date"][indices].tolist(),
+        matches["home"][indices].tolist(),
+        matches["away"][indices].tolist(),
+        matches["home_goals"][indices].astype(int).tolist(),
+        matches["away_goals"][indices].astype(int).tolist(),
+        home_before.tolist(),
+        away_before.tolist(),
+        expected.tolist(),
+        change.tolist(),
+        strict=True,
+    )
+    for (
+        match_pk,
+        timestamp,
+        home,
+        away,
+        home_score,
+        away_score,
+        home_rating,
+        away_rating,
+        home_expected,
+        delta,
+    ) in values:
+        common = {
+            "match_id": match_pk,
+            "match_date": datetime.fromtimestamp(timestamp, tz=UTC),
+        }
+        rows.append(
+            RatingHistory(
+                **common,
+                team_id=teams[home]["team_id"],
+                team_name=teams[home]["team_name"],
+                opponent_name=teams[away]["team_name"],
+                is_home=True,
+                goals_for=home_score,
+                goals_against=away_score,
+                expected=home_expected,
+                rating_before=home_rating,
+                rating_after=home_rating + delta,
+            )
+        )
+        rows.append(
+            RatingHistory(
+                **common,
+                team_id=teams[away]["team_id"],
+                team_name=teams[away]["team_name"],
+                opponent_name=teams[home]["team_name"],
+                is_home=False,
+                goals_for=away_score,
+                goals_against=home_score,
+                expected=1 - home_expected,
+                rating_before=away_rating,
+                rating_after=away_rating - delta,
+            )
+        )
+    return rows
+
+
+def apply(store, indices, current):
+    """
+    특성 저장소 경기 번호(날짜순)를 current {team_id: (rating, 경기 수)} 에
+    이어서 반영하고 기록/레이팅 저장 → 반영한 경기 수
+    """
+    matches = store.matches
+    team_ids = [team["team_id"] for team in store.teams]
+    start = [current.get(team_id, (settings.ELO_INITIAL, 0)) for team_id in team_ids]
+    ratings = np.array([rating for rating, _ in start], dtype=float)
+    played = np.array([count for _, count in start], dtype=np.intp)
+
+    home = matches["home"][indices].astype(np.intp)
+    away = matches["away"][indices].astype(np.intp)
+    results = compute(
+        home,
+        away,
+        matches["home_goals"][indices],
+        matches["away_goals"][indices],
+        ratings,
+    )
+    played += np.bincount(home, minlength=len(team_ids)) + np.bincount(
+        away, minlength=len(team_ids)
+    )
+
+    RatingHistory.objects.bulk_create(
+        history_rows(store, indices, *results), batch_size=1000
+    )
+    # 경기를 치렀거나 이미 레이팅이 있는 팀만 저장
+    TeamRating.objects.bulk_create(
+        [
+            TeamRating(
+                team_id=team["team_id"],
+                team_name=team["team_name"],
+                rating=rating,
+                matches_played=count,
+            )
+            for team, rating, count in zip(
+                store.teams, ratings.tolist(), played.tolist(), strict=True
+            )
+            if count or team["team_id"] in current
+        ],
+        update_conflicts=True,
+        unique_fields=["team_id"],
+        update_fields=["team_name", "rating", "matches_played", "updated_at"],
+    )
+    return len(indices)
+
+
+@transaction.atomic
+def rebuild(store=None):
+    """전체 종료 경기로 레이팅 다시 계산 → 반영한 경기 수"""
+    store = store or features.load()
+    RatingHistory.objects.all().delete()
+    TeamRating.objects.all().delete()
+    return apply(store, finished_matches(store), {})
+
+
+def needs_rebuild(store, pending):
+    """반영된 기록과 맞지 않는 경우 (점수 수정, 종료 취소, 이른 경기 추가)"""
+    stale = RatingHistory.objects.filter(is_home=True).filter(
+        ~Q(match__status="finished")
+        | ~Q(goals_for=F("match__home_score"))
+        | ~Q(goals_against=F("match__away_score"))
+    )
+    if stale.exists():
+        return True
+    last = RatingHistory.objects.order_by("-match_date").first()
+    return bool(
+        len(pending)
+        and last
+        and store.matches["match_date"][pending[0]] < last.match_date.timestamp()
+    )
+
+
+@transaction.atomic
+def update():
+    """새로 종료된 경기만 이어서 반영 → (반영한 경기 수, 전체 재계산 여부)"""
+    store = features.load()
+    rated = np.fromiter(
+        RatingHistory.objects.filter(is_home=True).values_list("match_id", flat=True),
+        dtype=np.int64,
+    )
+    pending = finished_matches(store, ~np.isin(store.matches["match_pk"], rated))
+    if needs_rebuild(store, pending):
+        return rebuild(store), True
+    if not len(pending):
+        return 0, False
+
+    current = {
+        team_id: (rating, played)
+        for team_id, rating, played in TeamRating.objects.values_list(
+            "team_id", "rating", "matches_played"
+        )
+    }
+    return apply(store, pending, current), False
@@ -0,0 +1,199 @@
+"""
+시즌 최종 순위 확률 (우승 / 4위 이내 / 강등) - 몬테카를로 (montecarlo.py)
+- 특성 저장소(features.py)의 종료 경기로 현재 승점/득실차/득점 집계 + 남은 예정 경기의
+  예측 점수 행렬(MatchPrediction) - 이미 치른 경기와 남은 경기가 같은 경기 배열에서 나옴
+- SIMULATION_WORKERS > 1 이면 프로세스 풀에서 샤드별로 나눠 실행 (풀은 프로세스당 1개 재사용)
+- refresh(): 데이터 적재 커맨드(update_matches, simulate_season)에서
+  예측을 채운 뒤 실행하고 결과를 파일(SIMULATION_RESULT_PATH)에 저장
+- get_result(): 저장된 결과만 읽음 (데이터 버전이 다르면 None, 요청 중에 계산하지 않음)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+
+from config.conditional import dataset_validators
+from matches.models import Match
+
+from . import features, montecarlo, predictions
+from .models import MatchPrediction
+
+CACHE_PREFIX = "season-simulation"
+
+TOP = 4
+RELEGATED = 3
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """프로세스 풀 (워커 1개 이하면 None - 현재 프로세스에서 실행)"""
+    global _executor
+    if settings.SIMULATION_WORKERS <= 1:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            _executor = montecarlo.create_executor(settings.SIMULATION_WORKERS)
+        return _executor
+
+
+def ensure_predictions():
+    """예측이 없는 예정 경기가 있으면 예측 먼저 갱신"""
+    if Match.objects.filter(status="scheduled", prediction__isnull=True).exists():
+        predictions.refit()
+
+
+def load_inputs(store=None):
+    """
+    (팀 이름 목록, 순위, 승점, 득실차, 득점, 홈 번호, 원정 번호, 점수 행렬)
+    팀 번호는 현재 순위순 (승점 > 득실차 > 득점), 예측이 있는 예정 경기만 포함
+    """
+    store = store or features.load()
+    matches = store.matches
+    n_teams = len(store.teams)
+
+    finished = np.asarray(matches["finished"])
+    home = matches["home"][finished].astype(np.intp)
+    away = matches["away"][finished].astype(np.intp)
+    home_goals = matches["home_goals"][finished]
+    away_goals = matches["away_goals"][finished]
+    home_points = np.where(
+        home_goals > away_goals, 3.0, np.where(home_goals == away_goals, 1.0, 0.0)
+    )
+    away_points = np.where(home_points == 1.0, 1.0, 3.0 - home_points)
+
+    def total(home_values, away_values):
+        return np.bincount(home, home_values, n_teams) + np.bincount(
+            away, away_values, n_teams
+        )
+
+    points = total(home_points, away_points)
+    goals_for = total(home_goals, away_goals)
+    goal_difference = goals_for - total(away_goals, home_goals)
+    order = np.lexsort((-goals_for, -goal_difference, -points))
+    position = np.empty(n_teams, dtype=np.intp)
+    position[order] = np.arange(n_teams)
+
+    # 예측이 있는 예정 경기 (예측 쿼리 1번)
+    grids = dict(
+        MatchPrediction.objects.filter(match__status="scheduled").values_list(
+            "match_id", "scorelines"
+        )
+    )
+    scheduled = np.flatnonzero(
+        np.asarray(matches["status"]) == features.STATUSES.index("scheduled")
+    )
+    fixtures = scheduled[np.isin(matches["match_pk"][scheduled], list(grids))]
+    size = settings.PREDICTION_MAX_GOALS + 1
+    scorelines = np.array(
+        [grids[pk] for pk in matches["match_pk"][fixtures].tolist()], dtype=float
+    ).reshape(len(fixtures), size, size)
+
+    teams = [store.teams[i]["team_name"] for i in order]
+    ranks = np.arange(1, n_teams + 1, dtype=float)
+    return (
+        teams,
+        ranks,
+        points[order],
+        goal_difference[order],
+        goals_for[order],
+        position[matches["home"][fixtures]],
+        position[matches["away"][fixtures]],
+        scorelines,
+    )
+
+
+def simulate(count=None, seed=None):
+    """시뮬레이션 실행 → 응답 dict (팀은 현재 순위순)"""
+    start = time.perf_counter()
+    count = count or settings.SIMULATION_COUNT
+    teams, ranks, points, difference, goals, home, away, scorelines = load_inputs()
+
+    shards = max(settings.SIMULATION_WORKERS, 1)
+    positions, expected_points = montecarlo.run(
+        points,
+        difference,
+        goals,
+        home,
+        away,
+        scorelines,
+        count,
+        seed=seed,
+        shards=shards,
+        executor=get_executor(),
+    )
+
+    n_teams = len(teams)
+    places = np.arange(1, n_teams + 1)
+    return {
+        "simulations": count,
+        "remaining_fixtures": len(home),
+        "seconds": round(time.perf_counter() - start, 3),
+        "teams": [
+            {
+                "team_name": name,
+                "rank": int(rank) or None,
+                "points": int(points[i]),
+                "expected_points": round(float(expected_points[i]), 2),
+                "expected_position": round(float(positions[i] @ places), 2),
+                "title": round(float(positions[i, 0]), 4),
+                "top4": round(float(positions[i, :TOP].sum()), 4),
+                "relegation": round(
+                    float(positions[i, n_teams - RELEGATED :].sum()), 4
+                ),
+                "positions": positions[i].round(4).tolist(),
+            }
+            for i, (name, rank) in enumerate(zip(teams, ranks, strict=True))
+        ],
+    }
+
+
+def data_version():
+    """시뮬레이션 입력 데이터 버전 (경기/예측)"""
+    tables, _ = dataset_validators(Match, MatchPrediction)
+    return hashlib.md5(tables.encode()).hexdigest()
+
+
+def result_path():
+    return Path(settings.SIMULATION_RESULT_PATH)
+
+
+def refresh(count=None, seed=None):
+    """예측이 없는 경기를 채우고 시뮬레이션 실행 → 파일/캐시에 저장한 결과"""
+    ensure_predictions()
+    version = data_version()
+    result = {"version": version, **simulate(count, seed)}
+
+    path = result_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(result))
+    os.replace(tmp, path)
+    cache.set(f"{CACHE_PREFIX}:{version}", result, settings.SIMULATION_CACHE_TIMEOUT)
+    return result
+
+
+def get_result():
+    """현재 데이터 버전의 저장된 결과 (없거나 버전이 다르면 None)"""
+    version = data_version()
+    key = f"{CACHE_PREFIX}:{version}"
+    result = cache.get(key)
+    if result is not None:
+        return result
+
+    try:
+        result = json.loads(result_path().read_text())
+    except (FileNotFoundError, ValueError):
+        return None
+    if result.get("version") != version:
+        return None
+    cache.set(key, result, settings.SIMULATION_CACHE_TIMEOUT)
+    return result
@@ -0,0 +1,79 @@
+from rest_framework import serializers
+
+from .models import MatchPrediction, RatingHistory, TeamRating
+
+
+class MatchPredictionSerializer(serializers.ModelSerializer):
+    """경기 예측 (경기 정보 일부 + 승/무/패 확률, 기대 득점)"""
+
+    match_id = serializers.CharField(source="match.match_id", read_only=True)
+    matchday = serializers.IntegerField(source="match.matchday", read_only=True)
+    match_date = serializers.DateTimeField(source="match.match_date", read_only=True)
+    home_team_name = serializers.CharField(
+        source="match.home_team_name", read_only=True
+    )
+    away_team_name = serializers.CharField(
+        source="match.away_team_name", read_only=True
+    )
+    status = serializers.CharField(source="match.status", read_only=True)
+
+    class Meta:
+        model = MatchPrediction
+        fields = [
+            "match_id",
+            "matchday",
+            "match_date",
+            "home_team_name",
+            "away_team_name",
+            "status",
+            "model_version",
+            "data_version",
+            "home_win",
+            "draw",
+            "away_win",
+            "home_expected_goals",
+            "away_expected_goals",
+            "likely_home_score",
+            "likely_away_score",
+            "updated_at",
+        ]
+
+
+class MatchPredictionDetailSerializer(MatchPredictionSerializer):
+    """경기 예측 상세 (점수 확률 행렬 포함)"""
+
+    class Meta(MatchPredictionSerializer.Meta):
+        fields = [*MatchPredictionSerializer.Meta.fields, "scorelines"]
+
+
+class TeamRatingSerializer(serializers.ModelSerializer):
+    """팀 현재 레이팅"""
+
+    class Meta:
+        model = TeamRating
+        fields = ["team_id", "team_name", "rating", "matches_played", "updated_at"]
+
+
+class RatingHistorySerializer(serializers.ModelSerializer):
+    """경기별 레이팅 변화"""
+
+    match_id = serializers.CharField(source="match.match_id", read_only=True)
+    change = serializers.SerializerMethodField()
+
+    class Meta:
+        model = RatingHistory
+        fields = [
+            "match_id",
+            "match_date",
+            "opponent_name",
+            "is_home",
+            "goals_for",
+            "goals_against",
+            "expected",
+            "rating_before",
+            "rating_after",
+            "change",
+        ]
+
+    def get_change(self, obj):
+        return obj.rating_after - obj.rating_before
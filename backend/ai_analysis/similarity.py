@@ -0,0 +1,263 @@
+"""
+비슷한 선수 찾기 - 선수 벡터 인덱스 (.npz)
+- 선수 1명 = 벡터 1행: 숫자 속성(나이/키/몸무게, 표준화) + 포지션/국적 원-핫 + 소개글 TF-IDF
+  블록마다 L2 정규화 후 가중치를 곱해 이어 붙이고 다시 L2 정규화 → 내적 = 코사인 유사도
+- TF-IDF 는 NumPy 로 직접 계산 (단어 빈도 로그 보정, 문서 빈도 상위 PLAYER_SIMILARITY_MAX_TERMS 단어)
+- load_players 가 끝날 때 rebuild() 로 다시 만들고, 읽을 때 선수/소개글 테이블 버전이 다르면 다시 만듦
+- 조회는 행렬-벡터 내적 1번 + argpartition (선수 수만큼 Python 반복 없음)
+"""
+
+import hashlib
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+
+from config.conditional import dataset_validators
+from players.models import Player, PlayerProfile
+
+TERM_RE = re.compile(r"[^\W\d_]{2,}")
+
+# TF-IDF 에서 뺄 흔한 단어 (소개글은 영어 위키 요약)
+STOP_WORDS = frozenset(
+    """
+    a an and are as at be been but by for from has have he his in into is it its
+    of on or she that the their they this to was were which who with after also
+    her him two one first all not more over than then there when where while
+    """.split()
+)
+
+NUMERIC_FIELDS = ["age", "height_cm", "weight_kg"]
+
+PLAYER_FIELDS = [
+    "player_id",
+    "position",
+    "nationality",
+    *NUMERIC_FIELDS,
+    "profile__introduction",
+    "profile__playing_style",
+    "profile__career_summary",
+]
+
+_lock = threading.Lock()
+_loaded = {}
+
+
+@dataclass(frozen=True)
+class SimilarityIndex:
+    """load() 결과 - 행 순서는 player_ids 와 같음"""
+
+    version: str
+    player_ids: np.ndarray
+    positions: np.ndarray
+    vectors: np.ndarray
+    terms: np.ndarray
+    rows: dict  # 선수 ID → 행 번호
+
+
+def index_path():
+    return Path(settings.PLAYER_SIMILARITY_PATH)
+
+
+def data_version():
+    """선수/소개글 테이블 버전"""
+    tables, _ = dataset_validators(Player, PlayerProfile)
+    return hashlib.md5(tables.encode()).hexdigest()
+
+
+def tokenize(text):
+    return [term for term in TERM_RE.findall(text.lower()) if term not in STOP_WORDS]
+
+
+def tfidf(documents, max_terms):
+    """
+    문서 목록 → (TF-IDF 행렬 (문서 수, 단어 수), 단어 배열)
+    2개 이상 문서에 나오고 절반 이하 문서에 나오는 단어 중 문서 빈도 상위 max_terms 개
+    """
+    tokens = [tokenize(document) for document in documents]
+    vocabulary = {}
+    ids = [
+        np.array(
+            [vocabulary.setdefault(term, len(vocabulary)) for term in terms],
+            dtype=np.int64,
+        )
+        for terms in tokens
+    ]
+    n_documents = len(documents)
+    n_terms = len(vocabulary)
+    if not n_terms:
+        return np.zeros((n_documents, 0), dtype=np.float32), np.array([], dtype=str)
+
+    # (문서, 단어) 빈도 - 문서마다 bincount 대신 평탄화한 키로 한 번에
+    lengths = np.array([len(row) for row in ids])
+    documents_of = np.repeat(np.arange(n_documents), lengths)
+    keys = documents_of * n_terms + np.concatenate(ids)
+    pairs, counts = np.unique(keys, return_counts=True)
+    document_frequency = np.bincount(pairs % n_terms, minlength=n_terms)
+
+    keep = (document_frequency >= 2) & (document_frequency <= n_documents / 2)
+    candidates = np.flatnonzero(keep)
+    order = np.argsort(-document_frequency[candidates], kind="stable")
+    chosen = np.sort(candidates[order[:max_terms]])
+    column = np.full(n_terms, -1)
+    column[chosen] = np.arange(len(chosen))
+
+    matrix = np.zeros((n_documents, len(chosen)), dtype=np.float32)
+    selected = column[pairs % n_terms] >= 0
+    rows = pairs[selected] // n_terms
+    columns = column[pairs[selected] % n_terms]
+    idf = np.log((1 + n_documents) / (1 + document_frequency[chosen])) + 1
+    matrix[rows, columns] = (1 + np.log(counts[selected])) * idf[columns]
+
+    terms = np.array(list(vocabulary), dtype=str)[chosen]
+    return normalize(matrix), terms
+
+
+def normalize(matrix):
+    """행 L2 정규화 (0 벡터는 그대로)"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def one_hot(values):
+    """범주 값 목록 → 원-핫 행렬 (빈 값은 0 행)"""
+    categories = sorted({value for value in values if value})
+    index = {value: i for i, value in enumerate(categories)}
+    matrix = np.zeros((len(values), len(categories)), dtype=np.float32)
+    for row, value in enumerate(values):
+        if value:
+            matrix[row, index[value]] = 1.0
+    return matrix
+
+
+def standardize(rows):
+    """숫자 속성 (선수 수, 속성 수) → 표준화 (빈 값은 평균 = 0)"""
+    matrix = np.array(rows, dtype=float)
+    mean = np.nanmean(matrix, axis=0)
+    std = np.nanstd(matrix, axis=0)
+    std[~(std > 0)] = 1.0
+    matrix = (matrix - mean) / std
+    return np.nan_to_num(matrix, nan=0.0).astype(np.float32)
+
+
+def vectorize(players):
+    """선수 values dict 목록 → (선수 벡터 (선수 수, 차원), 단어 배열)"""
+    numeric = standardize(
+        [
+            [
+                np.nan if player[field] is None else player[field]
+                for field in NUMERIC_FIELDS
+            ]
+            for player in players
+        ]
+    )
+    positions = one_hot([player["position"] for player in players])
+    nationalities = one_hot([player["nationality"] for player in players])
+    text, terms = tfidf(
+        [
+            " ".join(
+                player[field] or ""
+                for field in (
+                    "profile__introduction",
+                    "profile__playing_style",
+                    "profile__career_summary",
+                )
+            )
+            for player in players
+        ],
+        settings.PLAYER_SIMILARITY_MAX_TERMS,
+    )
+
+    weights = settings.PLAYER_SIMILARITY_WEIGHTS
+    blocks = [
+        normalize(numeric) * weights["attributes"],
+        positions * weights["position"],
+        nationalities * weights["nationality"],
+        text * weights["text"],
+    ]
+    return normalize(np.hstack(blocks).astype(np.float32)), terms
+
+
+def rebuild():
+    """DB 선수 전체로 인덱스 다시 만들어 저장 → SimilarityIndex"""
+    version = data_version()
+    players = list(Player.objects.order_by("pk").values(*PLAYER_FIELDS))
+    vectors, terms = vectorize(players)
+
+    path = index_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.stem}.{os.getpid()}.npz")
+    np.savez(
+        temporary,
+        version=np.array(version),
+        player_ids=np.array([player["player_id"] for player in players], dtype=str),
+        positions=np.array([player["position"] for player in players], dtype=str),
+        vectors=vectors,
+        terms=terms,
+    )
+    os.replace(temporary, path)
+
+    index = read(path)
+    with _lock:
+        _loaded.clear()
+        _loaded[index.version] = index
+    return index
+
+
+def read(path):
+    """.npz 파일 → SimilarityIndex"""
+    with np.load(path) as data:
+        player_ids = data["player_ids"]
+        return SimilarityIndex(
+            version=str(data["version"]),
+            player_ids=player_ids,
+            positions=data["positions"],
+            vectors=data["vectors"],
+            terms=data["terms"],
+            rows={player_id: i for i, player_id in enumerate(player_ids.tolist())},
+        )
+
+
+def load():
+    """현재 인덱스 (파일이 없거나 선수 데이터 버전이 다르면 다시 만듦, 프로세스 안에서 재사용)"""
+    version = data_version()
+    with _lock:
+        index = _loaded.get(version)
+        if index is None and index_path().exists():
+            index = read(index_path())
+            if index.version == version:
+                _loaded.clear()
+                _loaded[version] = index
+            else:
+                index = None
+    return index or rebuild()
+
+
+def nearest(index, player_id, k=10, position=None):
+    """
+    선수 ID → 가장 비슷한 선수 [(선수 ID, 유사도)] (유사도 내림차순, 본인 제외)
+    position 이 있으면 그 포지션 선수만, 선수가 인덱스에 없으면 None
+    """
+    row = index.rows.get(player_id)
+    if row is None:
+        return None
+
+    scores = index.vectors @ index.vectors[row]
+    scores[row] = -np.inf
+    if position:
+        scores[index.positions != position] = -np.inf
+
+    candidates = np.flatnonzero(np.isfinite(scores))
+    k = min(k, len(candidates))
+    if k == 0:
+        return []
+    top = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+    top = top[np.argsort(-scores[top], kind="stable")]
+    return [
+        (str(player), round(float(score), 4))
+        for player, score in zip(index.player_ids[top], scores[top], strict=True)
+    ]
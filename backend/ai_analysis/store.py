@@ -0,0 +1,61 @@
+"""
+예측 저장소 읽기 - 경기 목록/대시보드 응답에 예측을 붙일 때 사용
+- 예측은 predictions.refit() 이 적재/재추정 때 한 번에 채운 MatchPrediction 을 그대로 읽음
+  (요청마다 다시 계산하지 않음)
+- 응답 1번에 쿼리 1번 (현재 모델 버전 예측만, 경기 ID 목록으로 조회)
+- 값은 소수점 4자리로 저장되어 있어 FastJSONRenderer 로 렌더링해도 출력이 같음
+"""
+
+from .models import MatchPrediction
+from .predictions import MODEL_VERSION
+
+FIELDS = [
+    "data_version",
+    "home_win",
+    "draw",
+    "away_win",
+    "home_expected_goals",
+    "away_expected_goals",
+    "likely_home_score",
+    "likely_away_score",
+]
+
+
+def fetch(match_ids):
+    """경기 ID 목록 → {경기 ID: 예측 dict} (예측이 없는 경기는 빠짐)"""
+    match_ids = {match_id for match_id in match_ids if match_id}
+    if not match_ids:
+        return {}
+    rows = MatchPrediction.objects.filter(
+        match__match_id__in=match_ids, model_version=MODEL_VERSION
+    ).values_list("match__match_id", *FIELDS)
+    return {
+        row[0]: {
+            "model_version": MODEL_VERSION,
+            **dict(zip(FIELDS, row[1:], strict=True)),
+        }
+        for row in rows
+    }
+
+
+def attach(rows, key="prediction"):
+    """응답 행(dict, match_id 포함) 마다 예측 추가 (없으면 None)"""
+    predictions = fetch(row["match_id"] for row in rows)
+    for row in rows:
+        row[key] = predictions.get(row["match_id"])
+    return rows
+
+
+def for_team(prediction, is_home):
+    """예측 dict → 한 팀 입장의 승/무/패 확률, 기대 득실점"""
+    side, other = ("home", "away") if is_home else ("away", "home")
+    return {
+        "win": prediction[f"{side}_win"],
+        "draw": prediction["draw"],
+        "loss": prediction[f"{other}_win"],
+        "expected_goals_for": prediction[f"{side}_expected_goals"],
+        "expected_goals_against": prediction[f"{other}_expected_goals"],
+        "likely_score": (
+            f"{prediction[f'likely_{side}_score']}-{prediction[f'likely_{other}_score']}"
+        ),
+    }
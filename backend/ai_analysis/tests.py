@@ -1 +1,756 @@
-# Create your tests here.
+from datetime import UTC, datetime, timedelta
+from io import StringIO
+from itertools import combinations
+
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+
+from matches.models import Match
+from teams.models import Team
+
+from . import (
+    backtest,
+    engine,
+    evaluation,
+    features,
+    matchups,
+    montecarlo,
+    predictions,
+    previews,
+    ratings,
+    season,
+    store,
+)
+from .models import (
+    BacktestRun,
+    HeadToHead,
+    MatchPrediction,
+    MatchPreview,
+    RatingHistory,
+    TeamRating,
+)
+
+User = get_user_model()
+
+MODEL = predictions.MODEL_VERSION
+
+KICKOFF = datetime(2025, 8, 16, 14, 0, tzinfo=UTC)
+
+# (팀 ID, 팀명, 전력) - 전력 차이로 결과를 정함
+TEAMS = [
+    ("382", "Manchester City", 3),
+    ("362", "Aston Villa", 2),
+    ("393", "Nottingham Forest", 1),
+    ("301", "Luton Town", 0),
+]
+
+
+def score(home, away):
+    """전력 차이로 정한 결정적 점수 (홈 이점 1골)"""
+    diff = home[2] - away[2]
+    return max(diff + 1, 0), max(-diff, 0)
+
+
+def make_league(scheduled=3):
+    """
+    4팀 2라운드 로빈 - 1라운드 6경기 + 2라운드 앞 (6 - scheduled) 경기 종료,
+    나머지는 예정 경기 → 경기 목록 (날짜순)
+    """
+    for team_id, name, _ in TEAMS:
+        Team.objects.create(team_id=team_id, team_name=name, league="EPL")
+
+    fixtures = list(combinations(TEAMS, 2))
+    fixtures += [(away, home) for home, away in fixtures]
+    matches = []
+    for number, (home, away) in enumerate(fixtures):
+        finished = number < len(fixtures) - scheduled
+        home_score, away_score = score(home, away) if finished else (None, None)
+        matches.append(
+            Match.objects.create(
+                match_id=str(1000 + number),
+                season="2025",
+                matchday=number // 2 + 1,
+                match_date=KICKOFF + timedelta(days=7 * number),
+                home_team_id=home[0],
+                home_team_name=home[1],
+                away_team_id=away[0],
+                away_team_name=away[1],
+                home_score=home_score,
+                away_score=away_score,
+                status="finished" if finished else "scheduled",
+            )
+        )
+    return matches
+
+
+class EngineTests(SimpleTestCase):
+    """Dixon-Coles 엔진 (NumPy 배열 입력)"""
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.attack = np.array([1.6, 1.0, 0.6])
+        self.defence = np.array([0.8, 1.3, 1.9])
+        pairs = [(h, a) for h in range(3) for a in range(3) if h != a] * 200
+        self.home, self.away = (np.array(side) for side in zip(*pairs, strict=True))
+        lam, mu = engine.expected_goals(
+            self.attack, self.defence, 1.3, self.home, self.away
+        )
+        self.home_goals = rng.poisson(lam)
+        self.away_goals = rng.poisson(mu)
+
+    def test_fit_recovers_strength_order(self):
+        strengths = engine.fit(
+            self.home, self.away, self.home_goals, self.away_goals, 3
+        )
+        self.assertEqual(list(np.argsort(-strengths.attack)), [0, 1, 2])
+        self.assertEqual(list(np.argsort(strengths.defence)), [0, 1, 2])
+        self.assertAlmostEqual(strengths.home_advantage, 1.3, delta=0.15)
+        self.assertLessEqual(abs(strengths.rho), 0.25)
+
+    def test_score_matrix_is_normalized(self):
+        strengths = engine.fit(
+            self.home, self.away, self.home_goals, self.away_goals, 3
+        )
+        lam, mu, matrix = engine.score_matrix(strengths, [0, 2], [2, 0], max_goals=8)
+        self.assertEqual(matrix.shape, (2, 9, 9))
+        np.testing.assert_allclose(matrix.sum(axis=(1, 2)), 1.0)
+
+        home_win, draw, away_win = engine.outcome_probabilities(matrix)
+        np.testing.assert_allclose(home_win + draw + away_win, 1.0)
+        self.assertGreater(home_win[0], away_win[0])
+        self.assertGreater(away_win[1], 0)
+        home_score, away_score = engine.most_likely_scores(matrix)
+        self.assertEqual(home_score.shape, (2,))
+
+    def test_fit_without_results(self):
+        strengths = engine.fit([], [], [], [], 2)
+        np.testing.assert_allclose(strengths.attack, 1.0)
+        self.assertEqual(strengths.rho, 0.0)
+
+
+class FeatureComputeTests(SimpleTestCase):
+    """특성 계산 - 모든 값은 "이 경기 전까지" 기준"""
+
+    def setUp(self):
+        finished = features.STATUSES.index("finished")
+        scheduled = features.STATUSES.index("scheduled")
+        day = features.SECONDS_PER_DAY
+        # 0팀 2-0 1팀 → 1팀 1-1 0팀 → 0팀 vs 1팀 (예정)
+        self.matches, self.rows = features.compute(
+            {
+                "match_pk": np.array([1, 2, 3]),
+                "match_date": np.array([0, 7, 10]) * day,
+                "home": np.array([0, 1, 0]),
+                "away": np.array([1, 0, 1]),
+                "home_goals": np.array([2, 1, np.nan]),
+                "away_goals": np.array([0, 1, np.nan]),
+                "status": np.array([finished, finished, scheduled]),
+                "matchday": np.array([1, 2, 3]),
+            },
+            2,
+        )
+
+    def test_team_rows(self):
+        rows = self.rows
+        self.assertEqual(rows["team_offsets"].tolist(), [0, 3, 6])
+        self.assertEqual(rows["match_index"].tolist(), [0, 1, 2, 0, 1, 2])
+        self.assertEqual(self.matches["finished"].tolist(), [True, True, False])
+
+    def test_form_before_each_match(self):
+        rows = self.rows
+        self.assertEqual(rows["played_before"].tolist(), [0, 1, 2, 0, 1, 2])
+        self.assertEqual(rows["form_points"].tolist(), [0, 3, 4, 0, 0, 1])
+        self.assertEqual(rows["form_goals_for"].tolist(), [0, 2, 3, 0, 0, 1])
+        self.assertEqual(rows["form_goals_against"].tolist(), [0, 0, 1, 0, 2, 3])
+
+    def test_venue_and_rest(self):
+        rows = self.rows
+        # 0팀 3번째 경기(홈) 전 홈 경기는 2-0 1경기
+        self.assertEqual(rows["venue_goals_for"][2], 2.0)
+        self.assertEqual(rows["venue_goals_against"][2], 0.0)
+        self.assertTrue(np.isnan(rows["venue_goals_for"][0]))
+        np.testing.assert_array_equal(rows["rest_days"], [np.nan, 7, 3, np.nan, 7, 3])
+
+    def test_window(self):
+        values = np.array([3.0, 1.0, 3.0, np.nan])
+        played = np.array([True, True, True, False])
+        starts = np.zeros(4, dtype=int)
+        sums = features.window_sums(values, played, starts, 2)
+        self.assertEqual(sums.tolist(), [0, 3, 4, 4])
+
+
+class FeatureStoreTests(TestCase):
+    """특성 저장소 - 바뀐 경기만 다시 읽어 합쳐도 전체 재빌드와 같은 결과"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.matches = make_league()
+
+    def test_update_matches_rebuild(self):
+        meta, rebuilt = features.update()
+        self.assertTrue(rebuilt)
+        self.assertEqual(meta["matches"], 12)
+        self.assertEqual(features.update(), (meta, False))
+
+        finish(self.matches[-1], 2, 2)
+        meta, rebuilt = features.update()
+        self.assertFalse(rebuilt)
+        self.assertEqual(features.rebuild()["version"], meta["version"])
+
+    def test_deleted_match_triggers_rebuild(self):
+        features.update()
+        self.matches[-1].delete()
+        meta, rebuilt = features.update()
+        self.assertTrue(rebuilt)
+        self.assertEqual(meta["matches"], 11)
+
+    def test_load(self):
+        store = features.load()
+        self.assertIs(features.load(), store)
+        self.assertEqual(int(np.sum(store.matches["finished"])), 9)
+
+        team = store.team_index()[TEAMS[0][0]]
+        rows = store.team_rows(team)
+        # 맨시티는 6전 전승 (남은 경기 없음) - 마지막 경기 전 최근 5경기 15점
+        self.assertEqual(rows.stop - rows.start, 6)
+        self.assertEqual(store.rows["form_points"][rows][-1], 15)
+
+        finish(self.matches[-1], 0, 0)
+        self.assertNotEqual(features.load().version, store.version)
+
+
+class PredictionTests(TestCase):
+    """refit() → 예정 경기 예측 저장 / 예측 API"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.matches = make_league()
+
+    def get(self, path, **params):
+        return self.client.get(path, params, HTTP_HOST="localhost")
+
+    def test_refit_predicts_scheduled_matches(self):
+        result = predictions.refit()
+        self.assertEqual(result["teams"], 4)
+        self.assertEqual(result["predictions"], 3)
+
+        scheduled = [m for m in self.matches if m.status == "scheduled"]
+        stored = MatchPrediction.objects.in_bulk(field_name="match_id")
+        self.assertEqual(set(stored), {m.pk for m in scheduled})
+        for prediction in stored.values():
+            total = prediction.home_win + prediction.draw + prediction.away_win
+            self.assertAlmostEqual(total, 1.0, places=3)
+            self.assertEqual(prediction.data_version, result["data_version"])
+
+    def test_stale_predictions_are_evicted(self):
+        predictions.refit()
+        finished = self.matches[0]
+        MatchPrediction.objects.create(
+            match=finished,
+            model_version="old",
+            home_win=1,
+            draw=0,
+            away_win=0,
+            home_expected_goals=1,
+            away_expected_goals=1,
+            likely_home_score=1,
+            likely_away_score=0,
+            scorelines=[],
+        )
+        MatchPrediction.objects.filter(match__status="scheduled").update(
+            data_version="old"
+        )
+        self.assertEqual(predictions.evict(predictions.MODEL_VERSION, "new"), 3)
+        # 종료 경기의 경기 전 예측은 남김
+        self.assertTrue(MatchPrediction.objects.filter(match=finished).exists())
+
+    def test_api(self):
+        predictions.refit()
+        rows = self.get("/api/predictions/").json()
+        self.assertEqual(len(rows), 3)
+
+        match_id = self.matches[-1].match_id
+        detail = self.get(f"/api/predictions/{match_id}/").json()
+        self.assertEqual(len(detail["scorelines"]), 11)
+
+        matchday = self.matches[-1].matchday
+        rows = self.get("/api/predictions/by_matchday/", matchday=matchday).json()
+        self.assertIn(match_id, [row["match_id"] for row in rows])
+
+    def test_by_matchday_requires_number(self):
+        path = "/api/predictions/by_matchday/"
+        self.assertEqual(self.get(path).status_code, 400)
+        self.assertEqual(self.get(path, matchday="x").status_code, 400)
+        self.assertEqual(self.get("/api/predictions/999/").status_code, 404)
+
+
+def finish(match, home_score, away_score):
+    match.home_score = home_score
+    match.away_score = away_score
+    match.status = "finished"
+    match.save()
+
+
+class RatingTests(TestCase):
+    """Elo 레이팅 - 새로 끝난 경기만 이어서 반영, 필요하면 전체 재계산"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.matches = make_league()
+
+    def snapshot(self):
+        return dict(TeamRating.objects.values_list("team_id", "rating"))
+
+    def test_rebuild(self):
+        self.assertEqual(ratings.rebuild(), 9)
+        current = self.snapshot()
+        self.assertEqual(len(current), 4)
+        # 제로섬: 평균은 시작 레이팅 그대로
+        self.assertAlmostEqual(sum(current.values()) / 4, 1500.0)
+        best = max(current, key=current.get)
+        self.assertEqual(best, TEAMS[0][0])
+        self.assertEqual(RatingHistory.objects.count(), 18)
+
+    def test_incremental_update_matches_rebuild(self):
+        self.assertEqual(ratings.update(), (9, False))
+        self.assertEqual(ratings.update(), (0, False))
+
+        finish(self.matches[9], 0, 2)
+        self.assertEqual(ratings.update(), (1, False))
+        incremental = self.snapshot()
+
+        ratings.rebuild()
+        for team_id, rating in self.snapshot().items():
+            self.assertAlmostEqual(incremental[team_id], rating)
+
+    def test_score_correction_triggers_rebuild(self):
+        ratings.update()
+        finish(self.matches[0], 0, 5)
+        count, rebuilt = ratings.update()
+        self.assertTrue(rebuilt)
+        history = RatingHistory.objects.get(match=self.matches[0], is_home=True)
+        self.assertEqual((history.goals_for, history.goals_against), (0, 5))
+
+    def test_waves_keep_team_order(self):
+        home = np.array([0, 2, 0, 1])
+        away = np.array([1, 3, 2, 3])
+        self.assertEqual(ratings.assign_waves(home, away, 4).tolist(), [0, 0, 1, 1])
+
+    def test_api(self):
+        ratings.rebuild()
+        rows = self.client.get("/api/ratings/", HTTP_HOST="localhost").json()
+        self.assertEqual(rows[0]["team_id"], TEAMS[0][0])
+
+        path = f"/api/ratings/{TEAMS[3][0]}/history/"
+        data = self.client.get(path, HTTP_HOST="localhost").json()
+        self.assertEqual(len(data["history"]), 4)
+        self.assertEqual(data["history"][-1]["rating_after"], data["rating"])
+
+        response = self.client.get("/api/ratings/999/history/", HTTP_HOST="localhost")
+        self.assertEqual(response.status_code, 404)
+
+
+class MonteCarloTests(SimpleTestCase):
+    """몬테카를로 시뮬레이션 (NumPy 배열 입력)"""
+
+    def test_certain_result(self):
+        # 남은 1경기: 1팀이 1-0 으로 무조건 이김 → 1팀이 동률 2팀을 제치고 1위
+        scorelines = np.zeros((1, 3, 3))
+        scorelines[0, 1, 0] = 1.0
+        positions, expected_points = montecarlo.run(
+            np.array([10, 10]),
+            np.array([0, 0]),
+            np.array([5, 5]),
+            np.array([1]),
+            np.array([0]),
+            scorelines,
+            100,
+            seed=1,
+            shards=3,
+        )
+        np.testing.assert_allclose(positions, [[0, 1], [1, 0]])
+        np.testing.assert_allclose(expected_points, [10, 13])
+
+    def test_shards_sum_to_count(self):
+        scorelines = np.full((2, 3, 3), 1 / 9)
+        args = (
+            np.zeros(3),
+            np.zeros(3),
+            np.zeros(3),
+            np.array([0, 1]),
+            np.array([1, 2]),
+            scorelines,
+        )
+        positions, _ = montecarlo.run(*args, 1001, seed=3, shards=4)
+        np.testing.assert_allclose(positions.sum(axis=0), 1.0)
+        np.testing.assert_allclose(positions.sum(axis=1), 1.0)
+        again, _ = montecarlo.run(*args, 1001, seed=3, shards=4)
+        np.testing.assert_array_equal(positions, again)
+
+
+@override_settings(SIMULATION_WORKERS=1, SIMULATION_COUNT=500)
+class SeasonTests(TestCase):
+    """시즌 시뮬레이션 - 적재 커맨드에서 저장한 결과만 API 로 응답"""
+
+    path = "/api/predictions/season/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.matches = make_league()
+
+    def get(self, **headers):
+        return self.client.get(self.path, HTTP_HOST="localhost", **headers)
+
+    def test_not_ready(self):
+        response = self.get()
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "60")
+
+    def test_refresh(self):
+        result = season.refresh(seed=1)
+        self.assertEqual(result["simulations"], 500)
+        self.assertEqual(result["remaining_fixtures"], 3)
+        # 예측이 없던 예정 경기는 먼저 채움
+        self.assertEqual(MatchPrediction.objects.count(), 3)
+
+        teams = result["teams"]
+        self.assertEqual(teams[0]["team_name"], TEAMS[0][1])
+        self.assertEqual([team["rank"] for team in teams], [1, 2, 3, 4])
+        # 순위 칸마다 팀 1개: 우승 1팀, 4위 이내 4팀, 강등 3팀
+        for field, places in (("title", 1), ("top4", 4), ("relegation", 3)):
+            self.assertAlmostEqual(sum(team[field] for team in teams), places)
+        for team in teams:
+            self.assertAlmostEqual(sum(team["positions"]), 1.0, places=3)
+            self.assertGreaterEqual(team["expected_points"], team["points"])
+        self.assertEqual(season.get_result(), result)
+
+    def test_endpoint(self):
+        call_command("simulate_season", count=200, seed=2, stdout=StringIO())
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["simulations"], 200)
+
+        response = self.get(HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+    def test_result_expires_with_data(self):
+        season.refresh(seed=1)
+        finish(self.matches[-1], 1, 1)
+        # 파일이 남아 있어도 데이터 버전이 다르면 쓰지 않음
+        self.assertTrue(season.result_path().exists())
+        self.assertIsNone(season.get_result())
+        self.assertEqual(self.get().status_code, 503)
+
+
+class StoreTests(TestCase):
+    """저장된 예측을 경기 목록/대시보드 응답에 붙임 (응답마다 쿼리 1번)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.matches = make_league()
+        predictions.refit()
+
+    def get(self, path, auth=None, **params):
+        headers = {"HTTP_AUTHORIZATION": auth} if auth else {}
+        return self.client.get(path, params, HTTP_HOST="localhost", **headers)
+
+    def test_fetch_current_model_only(self):
+        scheduled = [m.match_id for m in self.matches[-3:]]
+        MatchPrediction.objects.filter(match__match_id=scheduled[0]).update(
+            model_version="old"
+        )
+        with self.assertNumQueries(1):
+            stored = store.fetch([*scheduled, self.matches[0].match_id, None])
+        self.assertEqual(set(stored), set(scheduled[1:]))
+        self.assertEqual(store.fetch([]), {})
+
+    def test_for_team(self):
+        prediction = store.fetch([self.matches[-1].match_id])[self.matches[-1].match_id]
+        home = store.for_team(prediction, True)
+        away = store.for_team(prediction, False)
+        self.assertEqual((home["win"], home["loss"]), (away["loss"], away["win"]))
+        self.assertEqual(
+            home["likely_score"], "-".join(reversed(away["likely_score"].split("-")))
+        )
+
+    def test_match_list_include(self):
+        rows = self.get("/api/matches/", include="predictions").json()
+        by_id = {row["match_id"]: row["prediction"] for row in rows}
+        self.assertIsNone(by_id[self.matches[0].match_id])
+        self.assertEqual(by_id[self.matches[-1].match_id]["model_version"], MODEL)
+        self.assertNotIn("prediction", self.get("/api/matches/").json()[0])
+
+        rows = self.get(
+            "/api/matches/by_matchday/", matchday=6, include="predictions"
+        ).json()
+        self.assertTrue(all(row["prediction"] for row in rows))
+
+    def test_include_errors(self):
+        response = self.get("/api/matches/", include="odds")
+        self.assertEqual(response.status_code, 400)
+        response = self.get("/api/matches/", include="predictions", fields="status")
+        self.assertEqual(response.status_code, 400)
+        # preview 는 라운드별 목록에서만
+        self.assertEqual(self.get("/api/matches/", include="preview").status_code, 400)
+
+    def test_dashboard(self):
+        user = User.objects.create_user("fan", "fan@example.com", "pw")
+        user.favorite_teams.add(Team.objects.get(team_id=TEAMS[1][0]))
+        Match.objects.filter(status="scheduled").update(
+            match_date=timezone.now() + timedelta(days=1)
+        )
+
+        auth = f"Bearer {AccessToken.for_user(user)}"
+        data = self.get("/api/accounts/dashboard/", auth=auth).json()["ai_analysis"]
+        self.assertEqual(data["model_version"], MODEL)
+        [next_match] = data["next_matches"]
+        self.assertEqual(next_match["team_id"], TEAMS[1][0])
+        prediction = store.fetch([next_match["match_id"]])[next_match["match_id"]]
+        # 원정 경기 - 응원 팀 입장으로 뒤집은 확률
+        self.assertFalse(next_match["is_home"])
+        self.assertEqual(next_match["win"], prediction["away_win"])
+        self.assertEqual(next_match["loss"], prediction["home_win"])
+
+
+class EvaluationTests(SimpleTestCase):
+    """평가 지표 (NumPy 배열 입력)"""
+
+    def test_outcomes(self):
+        outcomes = evaluation.outcomes(np.array([2, 1, 0]), np.array([0, 1, 3]))
+        self.assertEqual(outcomes.tolist(), [evaluation.HOME, evaluation.DRAW, 2])
+
+    def test_perfect_prediction(self):
+        actual = np.array([0, 1, 2])
+        scores = evaluation.scores(np.eye(3), actual)
+        self.assertEqual((scores["brier"], scores["accuracy"]), (0.0, 1.0))
+        self.assertAlmostEqual(scores["log_loss"], 0.0)
+
+    def test_uniform_prediction(self):
+        actual = np.array([0, 0, 1, 2])
+        scores = evaluation.scores(np.full((4, 3), 1 / 3), actual)
+        self.assertAlmostEqual(scores["log_loss"], np.log(3))
+        self.assertAlmostEqual(scores["brier"], 2 / 3)
+        [row] = scores["calibration"]
+        self.assertEqual((row["bin"], row["count"]), ("0.3-0.4", 12))
+        self.assertEqual(row["observed"], round(1 / 3, 4))
+
+    def test_no_matches(self):
+        scores = evaluation.scores(np.empty((0, 3)), np.empty(0, dtype=int))
+        self.assertEqual(scores["matches"], 0)
+        self.assertIsNone(scores["log_loss"])
+
+
+class BacktestTests(TestCase):
+    """워크포워드 평가 - 라운드마다 이전 라운드로만 학습"""
+
+    @classmethod
+    def setUpTestData(cls):
+        make_league()
+
+    def test_run(self):
+        runs = backtest.run(start_matchday=2, workers=1)
+        self.assertEqual([run.model_name for run in runs], list(evaluation.MODELS))
+        self.assertEqual(len({run.run_id for run in runs}), 1)
+        for run in runs:
+            # 2~5라운드 종료 경기 7개
+            self.assertEqual((run.start_matchday, run.end_matchday), (2, 5))
+            self.assertEqual(run.matches, 7)
+            self.assertLess(run.brier, 2)
+        self.assertEqual(runs[-1].parameters, {})
+        self.assertIsNone(backtest.previous(runs[0]))
+
+        again = backtest.run(["poisson"], start_matchday=2, workers=1)
+        self.assertEqual(backtest.previous(again[0]), runs[1])
+
+    def test_no_matchdays(self):
+        [run] = backtest.run(["base-rate"], start_matchday=99, workers=1)
+        self.assertEqual(run.matches, 0)
+        self.assertIsNone(run.log_loss)
+
+    def test_command(self):
+        out = StringIO()
+        call_command("backtest_models", start=2, workers=1, stdout=out)
+        call_command(
+            "backtest_models", models="poisson", start=2, workers=1, stdout=out
+        )
+        self.assertEqual(BacktestRun.objects.count(), 4)
+        self.assertIn("직전 대비", out.getvalue())
+
+        with self.assertRaises(CommandError):
+            call_command("backtest_models", models="poisson,elo", stdout=out)
+
+
+class PreviewTests(TestCase):
+    """경기 프리뷰 - 라운드 단위 일괄 생성, 읽는 쪽은 저장된 프리뷰만 조회"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.matches = make_league()
+        matchups.update()
+
+    def test_likely_scores(self):
+        matrix = np.zeros((3, 3))
+        matrix[1, 0], matrix[1, 1], matrix[0, 2] = 0.5, 0.3, 0.2
+        scores = previews.likely_scores(matrix, count=2)
+        self.assertEqual([row["score"] for row in scores], ["1-0", "1-1"])
+
+    def test_refresh_without_predictions(self):
+        # 예정 경기가 있는 5, 6라운드 (5라운드 종료 경기 포함)
+        self.assertEqual(previews.refresh(), 4)
+        preview = previews.fetch(6)[self.matches[10].match_id]
+        self.assertIsNone(preview["probabilities"])
+        self.assertEqual(preview["likely_scores"], [])
+
+        # 루턴(홈) vs 빌라 - 루턴은 4전 전패, 1라운드 원정 0-3 패
+        self.assertEqual(preview["form"]["home"]["results"], "LLLL")
+        meetings = preview["head_to_head"]
+        self.assertEqual((meetings["played"], meetings["losses"]), (1, 1))
+        self.assertEqual(meetings["recent"][0]["goals_against"], 3)
+        types = [point["type"] for point in preview["key_points"]]
+        self.assertEqual(types, ["form", "head_to_head"])
+
+    def test_refresh_with_predictions(self):
+        predictions.refit()
+        previews.refresh()
+        for preview in previews.fetch(6).values():
+            total = sum(preview["probabilities"].values())
+            self.assertAlmostEqual(total, 1.0, places=3)
+            self.assertEqual(len(preview["likely_scores"]), previews.LIKELY_SCORES)
+            self.assertLessEqual(len(preview["key_points"]), 5)
+            self.assertEqual(preview["key_points"][0]["type"], "prediction")
+
+        # 종료 경기는 이전 맞대결만 (이 경기 결과는 빠짐)
+        finished = previews.fetch(5)[self.matches[8].match_id]
+        self.assertEqual(finished["head_to_head"]["played"], 1)
+
+    def test_query_count_does_not_grow(self):
+        store = features.load()
+        counts = []
+        for matchdays in ([5], [1, 2, 3, 4, 5, 6]):
+            with CaptureQueriesContext(connection) as queries:
+                previews.build(matchdays, store=store, version="v")
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+        self.assertEqual(MatchPreview.objects.count(), 12)
+        self.assertEqual(previews.build([99], store=store, version="v"), 0)
+
+    def test_by_matchday_include(self):
+        previews.refresh()
+        path = "/api/matches/by_matchday/"
+        with self.assertNumQueries(2):
+            rows = self.client.get(
+                path, {"matchday": 6, "include": "preview"}, HTTP_HOST="localhost"
+            ).json()
+        self.assertTrue(all(row["preview"]["key_points"] for row in rows))
+
+        rows = self.client.get(
+            path, {"matchday": 1, "include": "preview"}, HTTP_HOST="localhost"
+        ).json()
+        self.assertEqual({row["preview"] for row in rows}, {None})
+
+
+class HeadToHeadTests(TestCase):
+    """맞대결 집계 - 바뀐 경기의 팀 쌍만 다시 집계해도 전체 재집계와 같은 결과"""
+
+    path = "/api/matches/head_to_head/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.matches = make_league()
+
+    def snapshot(self):
+        return {
+            (row.team_a_id, row.team_b_id): (
+                row.played,
+                row.team_a_wins,
+                row.draws,
+                row.team_b_wins,
+                row.team_a_goals,
+                row.team_b_goals,
+                row.recent,
+            )
+            for row in HeadToHead.objects.all()
+        }
+
+    def get(self, **params):
+        return self.client.get(self.path, params, HTTP_HOST="localhost")
+
+    def test_incremental_update_matches_rebuild(self):
+        self.assertEqual(matchups.update(), (6, True))
+        # 경계 시각의 경기는 다시 읽으므로 바뀐 게 없어도 0쌍이 아닐 수 있음
+        pairs, rebuilt = matchups.update()
+        self.assertFalse(rebuilt)
+        self.assertLessEqual(pairs, 1)
+
+        finish(self.matches[10], 1, 1)  # 루턴 vs 빌라 2번째 맞대결
+        self.assertFalse(matchups.update()[1])
+        finish(self.matches[0], 0, 1)  # 점수 정정
+        self.assertFalse(matchups.update()[1])
+        incremental = self.snapshot()
+
+        matchups.rebuild()
+        self.assertEqual(incremental, self.snapshot())
+        key = matchups.pair_key(TEAMS[1][0], TEAMS[3][0])
+        self.assertEqual(incremental[key][0], 2)
+
+    def test_unfinished_pair_is_removed(self):
+        matchups.update()
+        match = self.matches[4]
+        match.status = "postponed"
+        match.save()
+        self.assertFalse(matchups.update()[1])
+        key = matchups.pair_key(match.home_team_id, match.away_team_id)
+        self.assertNotIn(key, self.snapshot())
+
+    def test_deleted_match_triggers_rebuild(self):
+        matchups.update()
+        self.matches[0].delete()
+        self.assertEqual(matchups.update(), (6, True))
+
+    def test_for_team_before(self):
+        matchups.update()
+        finish(self.matches[10], 1, 1)
+        matchups.update()
+        key = matchups.pair_key(TEAMS[1][0], TEAMS[3][0])
+        record = matchups.lookup([key])[key]
+
+        luton = matchups.for_team(record, TEAMS[3][0])
+        self.assertEqual((luton["played"], luton["draws"], luton["losses"]), (2, 1, 1))
+        self.assertEqual(luton["recent"][0]["result"], "D")
+        before = matchups.for_team(
+            record, TEAMS[3][0], before=self.matches[10].match_date
+        )
+        self.assertEqual((before["played"], before["draws"]), (1, 0))
+
+    def test_endpoint(self):
+        matchups.update()
+        response = self.get(team1=TEAMS[0][0], team2=TEAMS[3][0])
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["team_name"], TEAMS[0][1])
+        self.assertEqual((data["played"], data["wins"]), (2, 2))
+
+        response = self.client.get(
+            self.path,
+            {"team1": TEAMS[0][0], "team2": TEAMS[3][0]},
+            HTTP_HOST="localhost",
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_endpoint_without_meetings(self):
+        Team.objects.create(team_id="349", team_name="AFC Bournemouth", league="EPL")
+        data = self.get(team1="349", team2=TEAMS[0][0]).json()
+        self.assertEqual((data["opponent_name"], data["played"]), (TEAMS[0][1], 0))
+
+    def test_endpoint_errors(self):
+        self.assertEqual(self.get(team1=TEAMS[0][0]).status_code, 400)
+        response = self.get(team1=TEAMS[0][0], team2=TEAMS[0][0])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.get(team1=TEAMS[0][0], team2="999").status_code, 404)
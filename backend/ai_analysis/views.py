@@ -1 +1,122 @@
-# Create your views here.
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from config.conditional import ConditionalGetMixin
+from matches.models import Match
+
+from . import season
+from .models import MatchPrediction, RatingHistory, TeamRating
+from .serializers import (
+    MatchPredictionDetailSerializer,
+    MatchPredictionSerializer,
+    RatingHistorySerializer,
+    TeamRatingSerializer,
+)
+
+
+class MatchPredictionViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    경기 예측 조회 API (Dixon-Coles 모델, ai_analysis/engine.py)
+    - list: 예정 경기 예측 (경기 날짜순)
+    - retrieve: 경기 1개 예측 + 점수 확률 행렬 (/api/predictions/{match_id}/)
+    - by_matchday: 라운드별 예측 (?matchday=15)
+    - season: 시즌 최종 순위 확률 (몬테카를로, ai_analysis/season.py)
+    """
+
+    queryset = MatchPrediction.objects.select_related("match")
+    serializer_class = MatchPredictionSerializer
+    permission_classes = [AllowAny]
+    lookup_field = "match__match_id"
+    lookup_url_kwarg = "match_id"
+
+    def get_serializer_class(self):
+        if self.action == "retrieve":
+            return MatchPredictionDetailSerializer
+        return MatchPredictionSerializer
+
+    def get_conditional_models(self):
+        if self.action == "season":
+            return [Match, MatchPrediction]
+        return super().get_conditional_models()
+
+    def get_queryset(self):
+        queryset = super().get_queryset().order_by("match__match_date")
+        if self.action == "list":
+            return queryset.filter(match__status="scheduled")
+        return queryset
+
+    @action(detail=False, methods=["get"])
+    def by_matchday(self, request):
+        """라운드별 경기 예측 (?matchday=15)"""
+        matchday = request.query_params.get("matchday")
+
+        if not matchday:
+            return Response(
+                {"error": "matchday 파라미터가 필요합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            matchday = int(matchday)
+        except ValueError:
+            return Response(
+                {"error": "matchday는 숫자여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        predictions = self.get_queryset().filter(match__matchday=matchday)
+        serializer = self.get_serializer(predictions, many=True)
+        return Response(serializer.data)
+
+    @action(detail=False, methods=["get"])
+    def season(self, request):
+        """
+        시즌 최종 순위 확률 (현재 순위표 + 남은 경기 예측으로 시뮬레이션)
+        팀별 우승 / 4위 이내 / 강등 확률, 기대 승점, 순위별 확률 (positions[0] = 1위)
+        """
+        result = season.get_result()
+        if result is None:
+            # 시뮬레이션은 데이터 적재 커맨드에서만 실행 (요청 중에 계산하지 않음)
+            response = Response(
+                {"error": "시즌 시뮬레이션 결과를 준비 중입니다."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+            response["Retry-After"] = "60"
+            return response
+        return self.conditional_response(request, lambda request: Response(result))
+
+
+class TeamRatingViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    팀 Elo 레이팅 조회 API (ai_analysis/ratings.py)
+    - list: 현재 레이팅 순위 (높은 순)
+    - retrieve: 팀 1개 현재 레이팅 (/api/ratings/{team_id}/)
+    - history: 팀의 경기별 레이팅 변화 (/api/ratings/{team_id}/history/)
+    """
+
+    queryset = TeamRating.objects.all()
+    serializer_class = TeamRatingSerializer
+    permission_classes = [AllowAny]
+    lookup_field = "team_id"
+    conditional_models = [TeamRating]
+
+    @action(detail=True, methods=["get"])
+    def history(self, request, team_id=None):
+        """팀 레이팅 변화 (경기 날짜순)"""
+        team = self.get_object()
+        history = (
+            RatingHistory.objects.filter(team_id=team.team_id)
+            .select_related("match")
+            .order_by("match_date")
+        )
+        serializer = RatingHistorySerializer(history, many=True)
+        return Response(
+            {
+                "team_id": team.team_id,
+                "team_name": team.team_name,
+                "rating": team.rating,
+                "history": serializer.data,
+            }
+        )
@@ -0,0 +1,73 @@
+"""
+자동완성 인덱스 벤치마크
+- 인덱스 생성 시간, 검색 1회 지연 시간 (타이핑처럼 1~4글자 접두어)
+- 비교: 글자마다 선수/팀/스태프 테이블을 icontains 로 조회하는 경우
+
+실행: uv run python benchmarks/autocomplete.py [--repeat 200]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from config.autocomplete import Autocomplete  # noqa: E402
+from players.models import Player  # noqa: E402
+from teams.models import Staff, Team  # noqa: E402
+
+WORDS = ["saka", "arsenal", "guardiola", "van dijk", "jimenez", "manchester"]
+
+
+def prefixes():
+    return [word[:n] for word in WORDS for n in range(1, 5)]
+
+
+def icontains(text, limit=10):
+    results = list(Team.objects.filter(team_name__icontains=text)[:limit])
+    results += Player.objects.filter(name__icontains=text)[:limit]
+    results += Staff.objects.filter(name__icontains=text)[:limit]
+    return results[:limit]
+
+
+def measure(func, queries, repeat):
+    times = []
+    for _ in range(repeat):
+        for query in queries:
+            start = time.perf_counter()
+            func(query)
+            times.append(time.perf_counter() - start)
+    times.sort()
+    return statistics.median(times) * 1000, times[int(len(times) * 0.99) - 1] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    autocomplete = Autocomplete()
+    start = time.perf_counter()
+    index = autocomplete.reload()
+    build = time.perf_counter() - start
+    keys = len(index.name_keys) + len(index.word_keys)
+    print(f"인덱스 생성: {build * 1000:.1f}ms (대상 {len(index)}개, 키 {keys}개)")
+
+    queries = prefixes()
+    p50, p99 = measure(lambda q: index.search(q, 10), queries, args.repeat)
+    print(f"인덱스 검색:   p50 {p50:.4f}ms, p99 {p99:.4f}ms")
+
+    p50, p99 = measure(icontains, queries, max(args.repeat // 20, 1))
+    print(f"icontains 3회: p50 {p50:.4f}ms, p99 {p99:.4f}ms")
+
+
+if __name__ == "__main__":
+    main()
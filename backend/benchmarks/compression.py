@@ -0,0 +1,72 @@
+"""
+엔드포인트별 응답 압축 벤치마크
+- 원본 / gzip / brotli 크기와 압축 CPU 시간(ms)
+- 미들웨어 설정값(COMPRESSION_GZIP_LEVEL, COMPRESSION_BROTLI_QUALITY) 기준
+
+실행: uv run python benchmarks/compression.py [--repeat 10]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.test import Client  # noqa: E402
+
+from config import middleware  # noqa: E402
+
+ENDPOINTS = [
+    "/api/players/",
+    "/api/staff/",
+    "/api/matches/",
+    "/api/standings/",
+    "/api/teams/",
+]
+
+
+def measure(content, encoding, repeat):
+    """(압축 크기, 최소 소요 시간 ms)"""
+    best = float("inf")
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = len(middleware.compress(content, encoding))
+        best = min(best, time.perf_counter() - start)
+    return size, best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    encodings = ["gzip"] + (["br"] if middleware.brotli is not None else [])
+    client = Client(HTTP_HOST="localhost")
+
+    header = f"{'endpoint':<18} {'raw':>9}"
+    for encoding in encodings:
+        header += f" {encoding + ' bytes':>11} {'ratio':>6} {'ms':>7}"
+    print(header)
+
+    for url in ENDPOINTS:
+        content = client.get(url).content
+        line = f"{url:<18} {len(content):>9,}"
+        for encoding in encodings:
+            size, ms = measure(content, encoding, args.repeat)
+            line += f" {size:>11,} {size / len(content):>6.1%} {ms:>7.2f}"
+        print(line)
+
+    if middleware.brotli is None:
+        print("\n(brotli 미설치: gzip 만 측정)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+경기 특성 저장소 벤치마크 (ai_analysis/features.py)
+- 현재 DB: 전체 재빌드, 바뀐 경기 1개 반영(update), memmap 열기(load)
+- 특성 계산: 벡터화 한 번 vs 팀별 Python 반복 (--seasons N 배 경기 수)
+
+실행: uv run python benchmarks/features.py [--seasons 10] [--repeat 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+import numpy as np  # noqa: E402
+from django.db import transaction  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from ai_analysis import features  # noqa: E402
+from matches.models import Match  # noqa: E402
+
+SECONDS_PER_SEASON = 365 * 24 * 60 * 60
+
+
+def timed(func, repeat):
+    """(결과, 중앙값 ms)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return result, statistics.median(times) * 1000
+
+
+def python_form(columns, n_teams):
+    """비교용: 팀별로 경기를 돌면서 최근 폼/휴식일 계산"""
+    result = []
+    for team in range(n_teams):
+        history = []
+        previous = None
+        for i in np.flatnonzero((columns["home"] == team) | (columns["away"] == team)):
+            home = columns["home"][i] == team
+            scored = columns["home_goals" if home else "away_goals"][i]
+            conceded = columns["away_goals" if home else "home_goals"][i]
+            recent = history[-features.FORM_WINDOW :]
+            date = columns["match_date"][i]
+            result.append(
+                (
+                    sum(points for points, _, _ in recent),
+                    sum(goals for _, goals, _ in recent),
+                    sum(goals for _, _, goals in recent),
+                    np.nan if previous is None else date - previous,
+                )
+            )
+            previous = date
+            if not np.isnan(scored):
+                points = 3 if scored > conceded else 1 if scored == conceded else 0
+                history.append((points, scored, conceded))
+    return result
+
+
+def repeated(columns, seasons):
+    """경기 컬럼을 seasons 번 이어 붙임 (날짜는 시즌 단위로 밀기)"""
+    result = {}
+    for name, array in columns.items():
+        parts = [np.asarray(array)] * seasons
+        if name == "match_date":
+            parts = [array + i * SECONDS_PER_SEASON for i, array in enumerate(parts)]
+        if name == "match_pk":
+            parts = [array + i * len(array) for i, array in enumerate(parts)]
+        result[name] = np.concatenate(parts)
+    return result
+
+
+def current(repeat):
+    meta, rebuild_ms = timed(features.rebuild, max(repeat // 4, 1))
+    _, load_ms = timed(features.load, repeat)
+
+    # 경기 1개 수정 후 반영 (트랜잭션 롤백 후 원래 상태로 다시 반영)
+    match = Match.objects.filter(status="finished").first()
+    with transaction.atomic():
+        Match.objects.filter(pk=match.pk).update(updated_at=timezone.now())
+        _, update_ms = timed(features.update, 1)
+        transaction.set_rollback(True)
+    features.rebuild()
+    print(
+        f"현재 DB ({meta['matches']}경기): 전체 재빌드 {rebuild_ms:.2f}ms, "
+        f"1경기 반영 {update_ms:.2f}ms, load {load_ms:.2f}ms"
+    )
+
+
+def synthetic(seasons, repeat):
+    store = features.load()
+    base = {name: store.matches[name] for name in features.BASE_COLUMNS}
+    columns = repeated(base, seasons)
+    n_teams = len(store.teams)
+
+    _, vectorized_ms = timed(lambda: features.compute(columns, n_teams), repeat)
+    _, python_ms = timed(lambda: python_form(columns, n_teams), max(repeat // 10, 1))
+    print(
+        f"특성 계산 {seasons}시즌 ({len(columns['match_pk'])}경기): "
+        f"벡터화 {vectorized_ms:.2f}ms, Python 반복(폼/휴식일만) {python_ms:.2f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seasons", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    current(args.repeat)
+    synthetic(1, args.repeat)
+    synthetic(args.seasons, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
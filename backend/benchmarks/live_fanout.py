@@ -0,0 +1,87 @@
+"""
+실시간 경기 스트림 fan-out 벤치마크
+- 구독자 N명(전체 구독 / 팀 구독 섞어서)에게 점수 변경 K건을 발행
+- 발행 1건당 소요 시간과 DB 쿼리 수 (구독자 수와 무관하게 0이어야 함)
+
+실행: uv run python benchmarks/live_fanout.py [--clients 5000] [--changes 20]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from asgiref.sync import sync_to_async  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+
+from matches.live import LiveBroker  # noqa: E402
+from matches.models import Match  # noqa: E402
+
+
+def publish(broker, rows):
+    """(발행 수, 소요 시간 s, DB 쿼리 수)"""
+    with CaptureQueriesContext(connection) as ctx:
+        start = time.perf_counter()
+        published = broker.publish(rows)
+        elapsed = time.perf_counter() - start
+    return published, elapsed, len(ctx.captured_queries)
+
+
+async def bench(clients, changes):
+    broker = LiveBroker()
+    matches = await sync_to_async(
+        lambda: list(
+            Match.objects.values("match_id", "home_team_id", "away_team_id")[:changes]
+        )
+    )()
+    team_ids = sorted({m["home_team_id"] for m in matches})
+
+    subscriptions = []
+    for i in range(clients):
+        # 절반은 전체 구독, 절반은 팀 1개 구독
+        teams = None if i % 2 == 0 else [team_ids[i % len(team_ids)]]
+        subscription, _ = await broker.subscribe(teams)
+        subscriptions.append(subscription)
+
+    rows = [{**m, "status": "live", "home_score": 9, "away_score": 9} for m in matches]
+
+    # update_matches 처럼 동기 코드(다른 스레드)에서 발행
+    published, elapsed, queries = await sync_to_async(publish)(broker, rows)
+
+    # call_soon_threadsafe 로 예약된 큐 적재 실행
+    await asyncio.sleep(0)
+    delivered = sum(s.queue.qsize() for s in subscriptions)
+
+    for subscription in subscriptions:
+        broker.unsubscribe(subscription)
+    broker._watcher.cancel()
+
+    print(f"구독자 {clients}명, 변경 {published}건")
+    print(
+        f"  발행 시간: {elapsed * 1000:.2f} ms ({elapsed * 1000 / published:.3f} ms/건)"
+    )
+    print(f"  전달 이벤트: {delivered}개")
+    print(f"  DB 쿼리: {queries}개")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=5000)
+    parser.add_argument("--changes", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(bench(args.clients, args.changes))
+
+
+if __name__ == "__main__":
+    main()
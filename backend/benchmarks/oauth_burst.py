@@ -0,0 +1,153 @@
+"""
+소셜 로그인 콜백 부하 테스트 (가짜 OAuth 제공자)
+- 로컬 가짜 제공자(토큰/사용자 정보 API, 응답 지연 --delay)를 띄우고
+  네이버 콜백을 동시에 --logins 개 호출 (ASGI 앱을 프로세스 안에서 직접 호출)
+- 콜백이 제공자 응답을 기다리는 동안 워커를 점유하지 않으면
+  전체 소요 시간 ≈ 제공자 왕복 2번 (동기 워커 W개면 ≈ logins / W × 왕복 2번)
+
+실행: uv run python benchmarks/oauth_burst.py [--logins 200] [--delay 0.2] [--workers 4]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+import httpx  # noqa: E402
+from django.conf import settings  # noqa: E402
+from django.core.asgi import get_asgi_application  # noqa: E402
+from django.db import connection  # noqa: E402
+
+from accounts.models import User  # noqa: E402
+
+
+class FakeProvider(BaseHTTPRequestHandler):
+    """code 로 받은 값을 그대로 사용자 ID 로 돌려주는 가짜 제공자"""
+
+    delay = 0.2
+
+    def log_message(self, *args):
+        pass
+
+    def reply(self, data):
+        time.sleep(self.delay)
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        form = dict(
+            item.split("=", 1) for item in self.rfile.read(length).decode().split("&")
+        )
+        self.reply({"access_token": form["code"]})
+
+    def do_GET(self):
+        user_id = self.headers["Authorization"].removeprefix("Bearer ")
+        self.reply(
+            {
+                "response": {
+                    "id": user_id,
+                    "email": f"{user_id}@example.com",
+                    "nickname": user_id,
+                }
+            }
+        )
+
+
+class ProviderServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def start_provider(delay):
+    FakeProvider.delay = delay
+    server = ProviderServer(("127.0.0.1", 0), FakeProvider)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def burst(logins, prefix):
+    app = get_asgi_application()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://localhost"
+    ) as client:
+
+        async def login(i):
+            start = time.perf_counter()
+            response = await client.get(
+                "/api/accounts/naver/callback/",
+                params={"code": f"{prefix}{i}", "state": "s"},
+            )
+            return response.status_code, time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(login(i) for i in range(logins)))
+        return results, time.perf_counter() - start
+
+
+def report(title, results, elapsed):
+    latencies = sorted(latency for _, latency in results)
+    statuses = {}
+    for status, _ in results:
+        statuses[status] = statuses.get(status, 0) + 1
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{title}")
+    print(f"  상태 코드: {statuses}")
+    print(
+        f"  전체 {elapsed:.2f}s, p50 {statistics.median(latencies) * 1000:.0f}ms, "
+        f"p95 {p95 * 1000:.0f}ms, {len(results) / elapsed:.0f} logins/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--delay", type=float, default=0.2)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    server = start_provider(args.delay)
+    base = f"http://127.0.0.1:{server.server_port}"
+    settings.ALLOWED_HOSTS = ["*"]
+    settings.OAUTH_PROVIDERS["naver"] = {
+        "token_url": f"{base}/token",
+        "user_info_url": f"{base}/me",
+    }
+
+    prefix = f"burst{int(time.time())}_"
+    try:
+        results, elapsed = asyncio.run(burst(args.logins, prefix))
+        report(f"신규 사용자 {args.logins}명 동시 로그인", results, elapsed)
+
+        results, elapsed = asyncio.run(burst(args.logins, prefix))
+        report(f"기존 사용자 {args.logins}명 동시 로그인", results, elapsed)
+    finally:
+        deleted, _ = User.objects.filter(social_id__startswith=prefix).delete()
+        connection.close()
+        server.shutdown()
+
+    blocking = -(-args.logins // args.workers) * 2 * args.delay
+    print(f"참고: 동기 워커 {args.workers}개로 처리 시 최소 {blocking:.1f}s")
+    print(f"(테스트 사용자 {deleted}명 삭제)")
+
+
+if __name__ == "__main__":
+    main()
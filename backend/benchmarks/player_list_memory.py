@@ -0,0 +1,78 @@
+"""
+선수 목록 요청 1번의 메모리 사용량 (tracemalloc 최대치)
+- 분리 전: 소개글까지 한 행에 있던 SELECT * (→ PlayerProfile JOIN 으로 재현)
+- 분리 후: 시리얼라이저 필드 컬럼만 SELECT (.only)
+- 목록 API: GET /api/players/?ordering=name (스냅샷 없이 실제 쿼리/직렬화)
+
+실행: uv run python benchmarks/player_list_memory.py [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.test import Client  # noqa: E402
+
+from players.models import Player  # noqa: E402
+from players.serializers import PlayerSerializer  # noqa: E402
+
+
+def before():
+    players = Player.objects.select_related("profile")
+    return PlayerSerializer(players, many=True).data
+
+
+def after():
+    players = Player.objects.only(*PlayerSerializer.Meta.fields)
+    return PlayerSerializer(players, many=True).data
+
+
+def api():
+    return Client().get("/api/players/?ordering=name").content
+
+
+def measure(func, repeat):
+    """(최대 메모리 MB, 중앙값 ms)"""
+    peaks = []
+    times = []
+    for _ in range(repeat):
+        tracemalloc.start()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    times.sort()
+    return max(peaks) / 1024 / 1024, times[len(times) // 2] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    settings.ALLOWED_HOSTS = ["*"]
+    print(f"선수 {Player.objects.count()}명")
+    for label, func in [
+        ("분리 전 (SELECT *, 소개글 포함)", before),
+        ("분리 후 (직렬화 컬럼만)", after),
+        ("목록 API", api),
+    ]:
+        peak, ms = measure(func, args.repeat)
+        print(f"{label:<32} 최대 {peak:>6.2f}MB  {ms:>7.2f}ms")
+    print("(tracemalloc 측정 중이라 시간은 실제보다 느림 - 상대 비교용)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+경기 예측 엔진 벤치마크 (ai_analysis/engine.py)
+- 현재 DB: 종료 경기 로드 + 전력 추정, 예정 경기 전체 점수 행렬, refit() 전체 (저장 포함)
+- --seasons N: 20팀 N시즌 분량 가상 결과로 추정 + 380경기 예측, Elo 전체 재계산
+  (DB 사용 안 함)
+
+실행: uv run python benchmarks/predictions.py [--seasons 10] [--repeat 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+import numpy as np  # noqa: E402
+
+from ai_analysis import engine, predictions, ratings  # noqa: E402
+
+TEAMS = 20
+
+
+def timed(func, repeat):
+    """(결과, 중앙값 ms)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return result, statistics.median(times) * 1000
+
+
+def season_fixtures(seasons):
+    """모든 팀이 홈/원정 한 번씩 만나는 경기 × seasons"""
+    home, away = np.nonzero(~np.eye(TEAMS, dtype=bool))
+    return np.tile(home, seasons), np.tile(away, seasons)
+
+
+def synthetic(seasons, repeat):
+    rng = np.random.default_rng(0)
+    attack = rng.lognormal(0, 0.25, TEAMS)
+    defence = rng.lognormal(0, 0.2, TEAMS) * 1.3
+    home, away = season_fixtures(seasons)
+    home_goals = rng.poisson(attack[home] * defence[away] * 1.2)
+    away_goals = rng.poisson(attack[away] * defence[home])
+
+    strengths, fit_ms = timed(
+        lambda: engine.fit(home, away, home_goals, away_goals, TEAMS), repeat
+    )
+    fixtures = season_fixtures(1)
+    _, predict_ms = timed(lambda: engine.score_matrix(strengths, *fixtures), repeat)
+    _, elo_ms = timed(
+        lambda: ratings.compute(
+            home, away, home_goals, away_goals, np.full(TEAMS, 1500.0)
+        ),
+        repeat,
+    )
+    correlation = np.corrcoef(np.log(attack), np.log(strengths.attack))[0, 1]
+    print(
+        f"가상 {seasons}시즌 ({len(home)}경기): 추정 {fit_ms:.2f}ms "
+        f"({strengths.iterations}회 반복), 380경기 예측 {predict_ms:.2f}ms, "
+        f"공격력 상관계수 {correlation:.3f}"
+    )
+    print(f"Elo 전체 재계산 ({len(home)}경기): {elo_ms:.2f}ms")
+
+
+def current(repeat):
+    (index, strengths), fit_ms = timed(predictions.fit_strengths, repeat)
+    fixtures = np.arange(len(index)), np.roll(np.arange(len(index)), 1)
+    _, predict_ms = timed(lambda: engine.score_matrix(strengths, *fixtures), repeat)
+    result, refit_ms = timed(predictions.refit, max(repeat // 4, 1))
+    print(
+        f"현재 DB: 로드+추정 {fit_ms:.2f}ms, {len(index)}경기 예측 {predict_ms:.2f}ms"
+    )
+    print(
+        f"refit() 전체 (예정 {result['predictions']}경기 저장 포함): {refit_ms:.2f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seasons", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    current(args.repeat)
+    synthetic(args.seasons, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
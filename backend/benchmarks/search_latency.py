@@ -0,0 +1,120 @@
+"""
+선수 검색 지연 시간 비교: 기존 icontains (LIKE '%x%') vs 검색 인덱스 (config/search.py)
+- 기존: SearchFilter 와 같은 name/full_name/team_name/nationality OR icontains
+- 인덱스: 같은 컬럼 접두어 검색 (pk__in 서브쿼리) / ?q= 관련도순 상위 20개 + 전체 개수
+- --scale N: 선수 데이터를 N배로 복제해 측정 (리그가 늘어난 상황, 끝나면 롤백)
+
+실행: uv run python benchmarks/search_latency.py [--scale 20] [--repeat 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import transaction  # noqa: E402
+from django.db.models import Q  # noqa: E402
+
+from config.search import INDEXES  # noqa: E402
+from players.models import Player  # noqa: E402
+
+QUERIES = ["saka", "arsenal", "brazil", "man", "jimenez", "van dijk", "united"]
+
+SEARCH_FIELDS = ["name", "full_name", "team_name", "nationality"]
+
+
+class Rollback(Exception):
+    pass
+
+
+def timed(func, repeat):
+    """(결과, 중앙값 ms)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return result, statistics.median(times) * 1000
+
+
+def icontains(text):
+    condition = Q()
+    for field in SEARCH_FIELDS:
+        condition |= Q(**{f"{field}__icontains": text})
+    return list(Player.objects.filter(condition).values_list("pk", flat=True))
+
+
+def indexed(index, text):
+    matching = index.matching(filters={"name team nationality": text})
+    return list(Player.objects.filter(pk__in=matching).values_list("pk", flat=True))
+
+
+def ranked(index, text):
+    return index.count(text), index.ranked(text, limit=20)
+
+
+def scale_players(factor):
+    """선수 행을 factor 배로 복제 (player_id 만 다르게)"""
+    fields = [f.attname for f in Player._meta.concrete_fields if not f.primary_key]
+    rows = list(Player.objects.values(*fields))
+    copies = [
+        Player(**{**row, "player_id": f"{row['player_id']}-x{copy}"})
+        for copy in range(1, factor)
+        for row in rows
+    ]
+    Player.objects.bulk_create(copies, batch_size=1000)
+
+
+def run(repeat):
+    index = INDEXES["players"]
+    print(f"선수 {Player.objects.count()}명")
+    print(f"{'검색어':<10} {'icontains':>16} {'인덱스':>16} {'q= 관련도순':>18}")
+    totals = [0, 0, 0]
+    for text in QUERIES:
+        old, old_ms = timed(lambda text=text: icontains(text), repeat)
+        new, new_ms = timed(lambda text=text: indexed(index, text), repeat)
+        (count, _), ranked_ms = timed(lambda text=text: ranked(index, text), repeat)
+        totals = [totals[0] + old_ms, totals[1] + new_ms, totals[2] + ranked_ms]
+        print(
+            f"{text:<10} {old_ms:>8.2f}ms ({len(old):>4}) "
+            f"{new_ms:>8.2f}ms ({len(new):>4}) {ranked_ms:>8.2f}ms ({count:>4})"
+        )
+    print(
+        f"{'합계':<10} {totals[0]:>8.2f}ms        {totals[1]:>8.2f}ms        "
+        f"{totals[2]:>8.2f}ms"
+    )
+    print("(괄호: 결과 수 - 인덱스는 단어 앞부분 일치라 단어 중간 일치는 제외)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.scale <= 1:
+        run(args.repeat)
+        return
+
+    # 복제 데이터와 인덱스 재구성 모두 트랜잭션 안에서 → 끝나면 롤백
+    try:
+        with transaction.atomic():
+            scale_players(args.scale)
+            INDEXES["players"].rebuild()
+            run(args.repeat)
+            raise Rollback
+    except Rollback:
+        pass
+
+
+if __name__ == "__main__":
+    main()
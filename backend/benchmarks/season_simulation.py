@@ -0,0 +1,83 @@
+"""
+시즌 시뮬레이션 벤치마크 (ai_analysis/montecarlo.py, season.py)
+- 실행 시간: 시뮬레이션 수별 현재 프로세스 vs 프로세스 풀 (--workers)
+- 수렴: 시뮬레이션 수별 순위 확률과 가장 큰 실행 결과의 최대 차이,
+  우승 확률 표준오차 sqrt(p(1-p)/N)
+- 현재 DB 의 순위표 + 남은 경기 예측 사용
+
+실행: uv run python benchmarks/season_simulation.py [--counts 1000,10000,100000] [--workers 4]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+import numpy as np  # noqa: E402
+
+from ai_analysis import montecarlo, season  # noqa: E402
+
+
+def timed(func, *args, **kwargs):
+    """(결과, ms)"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--counts", default="1000,10000,100000")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    counts = sorted(int(count) for count in args.counts.split(","))
+
+    season.ensure_predictions()
+    teams, _, *inputs = season.load_inputs()
+    print(f"{len(teams)}팀, 남은 경기 {len(inputs[3])}개, 워커 {args.workers}개")
+
+    executor = montecarlo.create_executor(args.workers)
+    # 워커 프로세스 시작 비용은 첫 요청에만 들어가므로 미리 띄워 둠
+    montecarlo.run(*inputs, 10, shards=args.workers, executor=executor)
+
+    results = {}
+    for count in counts:
+        (positions, _), single_ms = timed(montecarlo.run, *inputs, count, seed=0)
+        _, pool_ms = timed(
+            montecarlo.run,
+            *inputs,
+            count,
+            seed=0,
+            shards=args.workers,
+            executor=executor,
+        )
+        results[count] = positions
+        print(
+            f"{count:>7}회: 현재 프로세스 {single_ms:8.1f}ms, "
+            f"풀 {pool_ms:8.1f}ms ({single_ms / pool_ms:.2f}배)"
+        )
+    executor.shutdown()
+
+    reference = results[counts[-1]]
+    leader = reference[:, 0].argmax()
+    print(f"수렴 (기준: {counts[-1]}회, 우승 확률 1위 {teams[leader]})")
+    for count in counts[:-1]:
+        difference = np.abs(results[count] - reference).max()
+        title = results[count][leader, 0]
+        error = np.sqrt(title * (1 - title) / count)
+        print(
+            f"{count:>7}회: 순위 확률 최대 차이 {difference:.4f}, "
+            f"우승 확률 {title:.4f} ± {error:.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+목록 직렬화 벤치마크
+- 기존 ModelSerializer + JSONRenderer 와 RowSerializer + FastJSONRenderer 비교
+- 두 경로의 응답 바이트가 같은지 함께 확인
+
+실행: uv run python benchmarks/serializers.py [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from config.renderers import FastJSONRenderer  # noqa: E402
+from config.rows import RowSerializer  # noqa: E402
+from matches.models import Match  # noqa: E402
+from matches.serializers import MatchListSerializer  # noqa: E402
+from players.models import Player  # noqa: E402
+from players.serializers import PlayerSerializer  # noqa: E402
+from teams.models import Staff, TeamStanding  # noqa: E402
+from teams.serializers import StaffSerializer, TeamStandingSerializer  # noqa: E402
+
+TARGETS = [
+    ("players", Player, PlayerSerializer),
+    ("matches", Match, MatchListSerializer),
+    ("staff", Staff, StaffSerializer),
+    ("standings", TeamStanding, TeamStandingSerializer),
+]
+
+
+def measure(func, repeat):
+    """func 를 repeat 번 실행한 최소 시간(초)과 마지막 결과"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench(name, model, serializer_class, repeat):
+    """한 목록에 대해 두 직렬화 경로 비교"""
+    queryset = model.objects.all()
+    rows = queryset.count()
+    if not rows:
+        print(f"{name:<10} {0:>5}  (데이터 없음)")
+        return
+
+    row_serializer = RowSerializer.for_serializer(serializer_class)
+
+    def drf():
+        data = serializer_class(queryset.all(), many=True).data
+        return JSONRenderer().render(data)
+
+    def fast():
+        data = row_serializer.to_rows(row_serializer.values_list(queryset.all()))
+        return FastJSONRenderer().render(data)
+
+    drf_time, drf_body = measure(drf, repeat)
+    fast_time, fast_body = measure(fast, repeat)
+
+    print(
+        f"{name:<10} {rows:>5} {rows / drf_time:>12,.0f} {rows / fast_time:>12,.0f} "
+        f"{drf_time / fast_time:>7.1f}x {str(drf_body == fast_body):>10}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(
+        f"{'endpoint':<10} {'rows':>5} {'drf rows/s':>12} {'fast rows/s':>12} "
+        f"{'speedup':>8} {'same bytes':>10}"
+    )
+
+    for name, model, serializer_class in TARGETS:
+        bench(name, model, serializer_class, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+비슷한 선수 찾기 벤치마크 (ai_analysis/similarity.py)
+- 인덱스 빌드(TF-IDF + 숫자 속성), .npz 읽기
+- 조회 지연 시간: 선수 전체를 기준으로 top-k (포지션 필터 없음 / 있음), 중앙값과 p95
+- 비교: 선수마다 Python 으로 코사인 유사도 계산 (몇 명만)
+- 가상 데이터: 벡터를 --scale 배로 늘렸을 때 조회 시간
+
+실행: uv run python benchmarks/similarity.py [--k 10] [--scale 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+import numpy as np  # noqa: E402
+
+from ai_analysis import similarity  # noqa: E402
+
+
+def timed(func, *args, **kwargs):
+    """(결과, ms)"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def latencies(index, player_ids, k, position=None):
+    """선수마다 조회 → (중앙값 ms, p95 ms)"""
+    times = [
+        timed(similarity.nearest, index, player_id, k, position)[1]
+        for player_id in player_ids
+    ]
+    return statistics.median(times), float(np.percentile(times, 95))
+
+
+def python_nearest(index, player_id, k):
+    """비교용: 선수마다 Python 으로 내적 계산 후 정렬"""
+    vectors = index.vectors.tolist()
+    target = vectors[index.rows[player_id]]
+    scores = [
+        (sum(a * b for a, b in zip(vector, target, strict=True)), other)
+        for vector, other in zip(vectors, index.player_ids.tolist(), strict=True)
+        if other != player_id
+    ]
+    return sorted(scores, reverse=True)[:k]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--scale", type=int, default=20)
+    args = parser.parse_args()
+
+    index, build_ms = timed(similarity.rebuild)
+    _, read_ms = timed(similarity.read, similarity.index_path())
+    rows, dimensions = index.vectors.shape
+    print(
+        f"인덱스: 선수 {rows}명 × {dimensions}차원 (단어 {len(index.terms)}개), "
+        f"빌드 {build_ms:.1f}ms, 파일 읽기 {read_ms:.2f}ms"
+    )
+
+    player_ids = index.player_ids.tolist()
+    median, p95 = latencies(index, player_ids, args.k)
+    print(
+        f"top-{args.k} 조회 ({len(player_ids)}회): 중앙값 {median:.3f}ms, p95 {p95:.3f}ms"
+    )
+    position = index.positions[0]
+    median, p95 = latencies(index, player_ids, args.k, position)
+    print(f"  position={position}: 중앙값 {median:.3f}ms, p95 {p95:.3f}ms")
+
+    sample = player_ids[:5]
+    times = [timed(python_nearest, index, player_id, args.k)[1] for player_id in sample]
+    print(f"  Python 반복 ({len(sample)}회): 중앙값 {statistics.median(times):.1f}ms")
+
+    # 가상 데이터: 같은 벡터를 scale 배로 (선수 ID 는 번호를 붙여 구분)
+    scaled_ids = np.array(
+        [f"{player_id}-{i}" for i in range(args.scale) for player_id in player_ids]
+    )
+    scaled = replace(
+        index,
+        player_ids=scaled_ids,
+        positions=np.tile(index.positions, args.scale),
+        vectors=np.tile(index.vectors, (args.scale, 1)),
+        rows={player_id: i for i, player_id in enumerate(scaled_ids.tolist())},
+    )
+    median, p95 = latencies(scaled, scaled_ids[:: args.scale * 5].tolist(), args.k)
+    print(
+        f"가상 {len(scaled_ids)}명: top-{args.k} 중앙값 {median:.3f}ms, p95 {p95:.3f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
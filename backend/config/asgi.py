@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_asgi_application()
+
+# 자동완성 인덱스를 첫 요청 전에 미리 생성
+from config import autocomplete  # noqa: E402
+
+autocomplete.warm()
@@ -0,0 +1,227 @@
+"""
+선수/팀/스태프 이름 자동완성 (프로세스 내 접두어 인덱스)
+- 정규화(대소문자·악센트 무시)한 이름과 이름 속 각 단어 시작 위치를 키로 하는 정렬 배열
+- 검색은 bisect 로 접두어 범위를 찾아 앞에서부터 k개만 읽음 (DB 조회 없음)
+- 서버 시작 시(warm) 만들고, 데이터 버전(dataset_validators)이 바뀌면 다시 만듦
+  버전 확인은 AUTOCOMPLETE_CHECK_INTERVAL 초에 한 번만
+
+    GET /api/autocomplete/?q=sak&limit=10&types=player,team
+"""
+
+import bisect
+import logging
+import threading
+import time
+import unicodedata
+
+from django.conf import settings
+from django.db import DatabaseError
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from config.conditional import dataset_validators
+
+logger = logging.getLogger(__name__)
+
+TYPES = ("player", "team", "staff")
+
+# NFKD 로 분해되지 않는 라틴 문자
+FOLD = str.maketrans(
+    {"ø": "o", "ł": "l", "đ": "d", "ð": "d", "þ": "th", "æ": "ae", "œ": "oe", "ı": "i"}
+)
+
+MAX_LIMIT = 50
+
+
+def normalize(text):
+    """대소문자·악센트 무시, 문자/숫자 외에는 공백 1개로"""
+    text = unicodedata.normalize("NFKD", text.casefold().translate(FOLD))
+    chars = []
+    for char in text:
+        if unicodedata.combining(char):
+            continue
+        chars.append(char if char.isalnum() else " ")
+    return " ".join("".join(chars).split())
+
+
+def load_entities():
+    """DB → 자동완성 대상 목록 [(type, 응답 dict, 검색 이름들)]"""
+    from players.models import Player
+    from teams.models import Staff, Team
+
+    entities = []
+    for team_id, team_name in Team.objects.values_list("team_id", "team_name"):
+        entities.append(
+            ("team", {"id": team_id, "name": team_name}, [team_name]),
+        )
+    for player_id, name, full_name, team_name, position in Player.objects.values_list(
+        "player_id", "name", "full_name", "team_name", "position"
+    ):
+        entities.append(
+            (
+                "player",
+                {
+                    "id": player_id,
+                    "name": name,
+                    "team_name": team_name,
+                    "position": position,
+                },
+                [name, full_name],
+            ),
+        )
+    for pk, name, team_name, position in Staff.objects.values_list(
+        "pk", "name", "team_name", "position"
+    ):
+        entities.append(
+            (
+                "staff",
+                {"id": pk, "name": name, "team_name": team_name, "position": position},
+                [name],
+            ),
+        )
+    return entities
+
+
+class PrefixIndex:
+    """
+    정렬된 키 배열 2개 (불변 - 다시 만들 때는 새 인스턴스로 교체)
+    - names: 전체 이름 (이름 앞부분 일치가 먼저)
+    - words: 이름 속 두 번째 단어부터의 시작 위치 ("bukayo saka" → "saka")
+    """
+
+    def __init__(self, entities, version=None):
+        self.version = version
+        self.items = []
+        names = []
+        words = []
+
+        for kind, item, labels in entities:
+            position = len(self.items)
+            self.items.append({"type": kind, **item})
+            seen = set()
+            for label in labels:
+                key = normalize(label or "")
+                if not key or key in seen:
+                    continue
+                seen.add(key)
+                names.append((key, position))
+                start = key.find(" ")
+                while start != -1:
+                    words.append((key[start + 1 :], position))
+                    start = key.find(" ", start + 1)
+
+        names.sort()
+        words.sort()
+        self.name_keys = [key for key, _ in names]
+        self.name_items = [position for _, position in names]
+        self.word_keys = [key for key, _ in words]
+        self.word_items = [position for _, position in words]
+
+    def __len__(self):
+        return len(self.items)
+
+    def search(self, query, limit=10, types=None):
+        prefix = normalize(query)
+        if not prefix:
+            return []
+
+        results = []
+        seen = set()
+        for keys, positions in (
+            (self.name_keys, self.name_items),
+            (self.word_keys, self.word_items),
+        ):
+            i = bisect.bisect_left(keys, prefix)
+            while i < len(keys) and keys[i].startswith(prefix):
+                position = positions[i]
+                i += 1
+                if position in seen:
+                    continue
+                seen.add(position)
+                item = self.items[position]
+                if types and item["type"] not in types:
+                    continue
+                results.append(item)
+                if len(results) >= limit:
+                    return results
+        return results
+
+
+class Autocomplete:
+    """현재 인덱스 + 데이터 버전이 바뀌었을 때 다시 만들기"""
+
+    def __init__(self):
+        self.index = None
+        self.checked_at = 0.0
+        self.lock = threading.Lock()
+
+    def version(self):
+        from players.models import Player
+        from teams.models import Staff, Team
+
+        return dataset_validators(Player, Team, Staff)[0]
+
+    def reload(self, version=None):
+        version = version or self.version()
+        self.index = PrefixIndex(load_entities(), version)
+        self.checked_at = time.monotonic()
+        return self.index
+
+    def get_index(self):
+        """인덱스 (없으면 만들고, 확인 주기가 지났으면 버전 비교 후 필요 시 다시 만듦)"""
+        index = self.index
+        elapsed = time.monotonic() - self.checked_at
+        if index is not None and elapsed < settings.AUTOCOMPLETE_CHECK_INTERVAL:
+            return index
+
+        # 다른 스레드가 확인/재생성 중이면 기존 인덱스로 응답
+        if not self.lock.acquire(blocking=index is None):
+            return index
+        try:
+            if self.index is not index:
+                return self.index
+            version = self.version()
+            if index is None or index.version != version:
+                return self.reload(version)
+            self.checked_at = time.monotonic()
+            return index
+        finally:
+            self.lock.release()
+
+
+autocomplete_index = Autocomplete()
+
+
+def warm():
+    """서버 시작 시 인덱스 생성 (마이그레이션 전 등 DB 오류는 첫 요청 때 다시 시도)"""
+    try:
+        index = autocomplete_index.get_index()
+    except DatabaseError as e:
+        logger.warning("자동완성 인덱스 생성 실패: %s", e)
+        return None
+    return len(index)
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def autocomplete(request):
+    """
+    이름 자동완성 (?q=검색어&limit=10&types=player,team,staff)
+    응답: {"query", "results": [{"type", "id", "name", ...}]}
+    """
+    query = request.query_params.get("q", "")
+    try:
+        limit = min(int(request.query_params.get("limit", 10)), MAX_LIMIT)
+    except ValueError:
+        return Response({"error": "limit 은 숫자여야 합니다."}, status=400)
+
+    types = request.query_params.get("types")
+    types = set(types.split(",")) if types else None
+    if types and not types <= set(TYPES):
+        return Response(
+            {"error": f"types 는 {', '.join(TYPES)} 중에서 선택해주세요."}, status=400
+        )
+
+    results = autocomplete_index.get_index().search(query, max(limit, 1), types)
+    return Response({"query": query, "results": results})
@@ -0,0 +1,189 @@
+"""
+배치 API - 여러 GET 요청을 한 번의 HTTP 왕복으로 처리
+- 하위 요청은 같은 프로세스/DB 커넥션에서 바로 뷰 함수를 호출
+- 인증은 배치 요청에서 한 번만 하고 하위 요청에는 그 사용자를 그대로 전달
+- ETag 가 있는 하위 응답은 캐시에 저장하고, 다음 요청에서 If-None-Match 로
+  재검증해 304 이면 캐시된 본문을 재사용
+
+    GET  /api/batch/?teams=/api/teams/&standings=/api/standings/
+    POST /api/batch/  {"requests": [{"id": "teams", "url": "/api/teams/"}, ...]}
+
+응답: {"teams": {"status": 200, "body": [...]}, "standings": {...}}
+비동기 뷰(실시간 스트림, 소셜 로그인 콜백)는 하위 요청으로 실행하지 않고 501
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse, QueryDict
+from django.urls import Resolver404, resolve
+from django.utils.cache import get_conditional_response, patch_cache_control
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "batch"
+
+# 하위 요청에 그대로 넘기는 META
+FORWARDED_META = (
+    "SERVER_NAME",
+    "SERVER_PORT",
+    "REMOTE_ADDR",
+    "HTTP_HOST",
+    "HTTP_X_FORWARDED_PROTO",
+    "HTTP_ACCEPT_LANGUAGE",
+    "wsgi.url_scheme",
+)
+
+
+def parse_requests(request):
+    """[(id, url), ...] - 형식이 잘못되면 ValueError"""
+    if request.method == "GET":
+        items = [(key, request.query_params[key]) for key in request.query_params]
+    else:
+        items = []
+        for item in request.data.get("requests", []):
+            if isinstance(item, str):
+                items.append((item, item))
+            elif isinstance(item, dict) and item.get("url"):
+                items.append((str(item.get("id", item["url"])), item["url"]))
+            else:
+                raise ValueError("요청 형식이 올바르지 않습니다.")
+
+    if not items:
+        raise ValueError("요청 목록이 비어 있습니다.")
+    if len(items) > settings.BATCH_MAX_REQUESTS:
+        raise ValueError(
+            f"한 번에 최대 {settings.BATCH_MAX_REQUESTS}개까지 요청할 수 있습니다."
+        )
+    for _, url in items:
+        path = urlsplit(url).path
+        if not path.startswith("/api/") or path.startswith("/api/batch/"):
+            raise ValueError(f"지원하지 않는 URL 입니다: {url}")
+    return items
+
+
+def build_subrequest(request, url, etag=None):
+    """배치 요청의 사용자/호스트 정보를 가진 GET 하위 요청"""
+    parts = urlsplit(url)
+
+    sub = HttpRequest()
+    sub.method = "GET"
+    sub.path = sub.path_info = parts.path
+    sub.GET = QueryDict(parts.query)
+    sub.META = {key: request.META[key] for key in FORWARDED_META if key in request.META}
+    sub.META.update(
+        REQUEST_METHOD="GET",
+        QUERY_STRING=parts.query,
+        HTTP_ACCEPT="application/json",
+    )
+    if etag:
+        sub.META["HTTP_IF_NONE_MATCH"] = etag
+
+    # DRF 인증 생략 (배치 요청에서 이미 인증한 사용자 사용)
+    sub.user = request.user
+    sub._force_auth_user = request.user
+    sub._force_auth_token = request.auth
+    return sub
+
+
+def cache_key(request, url):
+    user = request.user.pk if request.user.is_authenticated else ""
+    digest = hashlib.md5(url.encode()).hexdigest()
+    return f"{CACHE_PREFIX}:{user}:{digest}"
+
+
+def is_async_view(func):
+    """async def 뷰 또는 view_is_async 클래스 뷰 (동기 호출 시 코루틴만 돌려줌)"""
+    view_class = getattr(func, "view_class", None)
+    return asyncio.iscoroutinefunction(func) or bool(
+        getattr(view_class, "view_is_async", False)
+    )
+
+
+def execute(request, url):
+    """하위 요청 실행 → (status, JSON 본문 bytes, ETag)"""
+    key = cache_key(request, url)
+    cached = cache.get(key)
+
+    try:
+        match = resolve(urlsplit(url).path)
+    except Resolver404:
+        return 404, b'{"error":"Not found."}', None
+
+    if is_async_view(match.func):
+        return 501, b'{"error":"Async views are not supported in batch."}', None
+
+    sub = build_subrequest(request, url, etag=cached[0] if cached else None)
+    sub.resolver_match = match
+
+    # 하위 요청 1개가 실패해도 배치 전체는 응답 (그 항목만 500)
+    try:
+        response = match.func(sub, *match.args, **match.kwargs)
+        if hasattr(response, "render"):
+            response.render()
+
+        if response.status_code == 304 and cached:
+            return cached[1], cached[2], cached[0]
+
+        content = response.content
+        if not response.get("Content-Type", "").startswith("application/json"):
+            content = b"null"
+
+        etag = response.get("ETag")
+        if etag and response.status_code == 200:
+            cache.set(
+                key,
+                (etag, response.status_code, content),
+                settings.BATCH_CACHE_TIMEOUT,
+            )
+        return response.status_code, content, etag
+    except Exception:
+        logger.exception("배치 하위 요청 실패: %s", url)
+        return 500, b'{"error":"Internal server error."}', None
+
+
+@api_view(["GET", "POST"])
+@permission_classes([AllowAny])
+def batch(request):
+    """배치 요청 (GET 하위 요청만 지원)"""
+    try:
+        items = parse_requests(request)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
+
+    # 같은 URL 은 한 번만 실행
+    results = {}
+    for _, url in items:
+        if url not in results:
+            results[url] = execute(request, url)
+
+    parts = []
+    for name, url in items:
+        status, content, _ = results[url]
+        parts.append(
+            json.dumps(name, ensure_ascii=False).encode()
+            + b':{"status":%d,"body":%s}' % (status, content)
+        )
+    body = b"{" + b",".join(parts) + b"}"
+
+    response = HttpResponse(body, content_type="application/json")
+
+    # 모든 하위 응답에 ETag 가 있으면 배치 응답도 조건부 요청 지원
+    etags = [results[url][2] for _, url in items]
+    if request.method == "GET" and all(etags):
+        key = "|".join([request.get_full_path(), *etags])
+        etag = f'W/"{hashlib.md5(key.encode()).hexdigest()}"'
+        not_modified = get_conditional_response(request._request, etag=etag)
+        if not_modified is not None:
+            response = not_modified
+        response["ETag"] = etag
+        patch_cache_control(response, no_cache=True)
+    return response
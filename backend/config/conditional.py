@@ -0,0 +1,81 @@
+"""
+조건부 GET (ETag / Last-Modified)
+- 테이블의 MAX(updated_at) 와 행 수로 검증값을 만드는 가벼운 집계 쿼리 1번
+- If-None-Match / If-Modified-Since 가 일치하면 본 쿼리/직렬화 없이 304 응답
+"""
+
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+
+def dataset_validators(*models):
+    """모델 테이블들의 (버전 문자열, 마지막 수정 시각)"""
+    parts = []
+    last_modified = None
+
+    for model in models:
+        stats = model.objects.aggregate(last=Max("updated_at"), count=Count("pk"))
+        parts.append(f"{model._meta.label}:{stats['count']}:{stats['last']}")
+        if stats["last"] and (last_modified is None or stats["last"] > last_modified):
+            last_modified = stats["last"]
+
+    return "|".join(parts), last_modified
+
+
+class ConditionalGetMixin:
+    """
+    list / retrieve 응답에 ETag, Last-Modified 를 붙이고 304 를 처리하는 믹스인
+    conditional_models 에 응답이 의존하는 모델을 지정 (기본값: queryset 모델)
+    """
+
+    conditional_models = None
+
+    def get_conditional_models(self):
+        return self.conditional_models or [self.queryset.model]
+
+    def get_validators(self, request):
+        """(ETag, Last-Modified) - 같은 데이터 + 같은 URL 이면 같은 값"""
+        version, last_modified = dataset_validators(*self.get_conditional_models())
+        key = "|".join(
+            [version, request.get_full_path(), request.META.get("HTTP_ACCEPT", "")]
+        )
+        etag = f'W/"{hashlib.md5(key.encode()).hexdigest()}"'
+        return etag, last_modified
+
+    def conditional_response(self, request, handler, *args, **kwargs):
+        """검증값이 일치하면 handler 를 실행하지 않고 304 반환"""
+        etag, last_modified = self.get_validators(request)
+        # HTTP 날짜는 초 단위 → 버림 (아니면 If-Modified-Since 가 맞지 않음)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(
+            request._request, etag=etag, last_modified=timestamp
+        )
+        if response is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+
+        response["ETag"] = etag
+        if timestamp is not None:
+            response["Last-Modified"] = http_date(timestamp)
+        # 브라우저가 휴리스틱 캐시 대신 항상 재검증하도록
+        patch_cache_control(response, no_cache=True)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().list, *args, **kwargs)
+
+    def get_object(self):
+        # 304 판단 전에 조회한 객체를 handler 에서 다시 조회하지 않도록 재사용
+        if not hasattr(self, "_conditional_object"):
+            self._conditional_object = super().get_object()
+        return self._conditional_object
+
+    def retrieve(self, request, *args, **kwargs):
+        # 없는 객체는 If-None-Match 가 맞아도 304 가 아니라 404
+        self.get_object()
+        return self.conditional_response(request, super().retrieve, *args, **kwargs)
@@ -0,0 +1,88 @@
+"""
+목록 필터 UI 용 항목별 개수 (facet)
+- 항목마다 GROUP BY 쿼리 1번 (목록을 내려받아 클라이언트에서 세지 않도록)
+- 목록과 같은 필터(?position=, ?search=, ?height_cm_min= 등)를 적용한 개수
+- 결과는 데이터 버전(dataset_validators) + 필터 조건별로 캐시
+
+    GET /api/players/facets/?position=Defender&facets=nationality,team
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from config.conditional import dataset_validators
+
+CACHE_PREFIX = "facets"
+
+# 개수에 영향이 없는 쿼리 파라미터
+IGNORED_PARAMS = {"facets", "ordering", "cursor", "page", "page_size", "fields"}
+
+
+def count_by(queryset, field):
+    """[{"value", "count"}] 개수 많은 순 (빈 값 제외)"""
+    rows = (
+        queryset.exclude(Q(**{field: ""}) | Q(**{f"{field}__isnull": True}))
+        .values(field)
+        .annotate(count=Count("pk"))
+        .order_by("-count", field)
+    )
+    return [{"value": row[field], "count": row["count"]} for row in rows]
+
+
+class FacetsMixin:
+    """
+    facets 액션을 추가하는 믹스인
+    facet_fields: {응답 키: 모델 필드}
+    """
+
+    facet_fields = {}
+
+    def facet_cache_key(self, request, names):
+        version = dataset_validators(self.queryset.model)[0]
+        params = sorted(
+            (key, value)
+            for key, values in request.query_params.lists()
+            if key not in IGNORED_PARAMS
+            for value in values
+        )
+        raw = "|".join([version, ",".join(names), repr(params)])
+        digest = hashlib.md5(raw.encode()).hexdigest()
+        return f"{CACHE_PREFIX}:{self.queryset.model._meta.label_lower}:{digest}"
+
+    def get_facets(self, request, names):
+        key = self.facet_cache_key(request, names)
+        facets = cache.get(key)
+        if facets is None:
+            queryset = self.filter_queryset(self.get_queryset())
+            facets = {
+                "total": queryset.count(),
+                "facets": {
+                    name: count_by(queryset, self.facet_fields[name]) for name in names
+                },
+            }
+            cache.set(key, facets, settings.FACETS_CACHE_TIMEOUT)
+        return facets
+
+    def facets_response(self, request):
+        names = request.query_params.get("facets")
+        names = names.split(",") if names else list(self.facet_fields)
+        unknown = [name for name in names if name not in self.facet_fields]
+        if unknown:
+            choices = ", ".join(self.facet_fields)
+            return Response(
+                {"error": f"facets 는 {choices} 중에서 선택해주세요."}, status=400
+            )
+        return Response(self.get_facets(request, names))
+
+    @action(detail=False, methods=["get"])
+    def facets(self, request):
+        """
+        항목별 개수 (?facets=position,nationality,team + 목록과 같은 필터)
+        응답: {"total", "facets": {"position": [{"value", "count"}], ...}}
+        """
+        return self.conditional_response(request, self.facets_response)
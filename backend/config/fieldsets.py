@@ -0,0 +1,103 @@
+"""
+?fields= 희소 필드셋 지원
+- 시리얼라이저: 요청된 필드만 직렬화
+- ViewSet: 같은 필드 목록으로 .only() 를 적용해 SQL 컬럼도 줄임
+  (?fields 가 없으면 시리얼라이저의 전체 필드 - 직렬화하지 않는 컬럼은 읽지 않음)
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.exceptions import ValidationError
+
+
+class SparseFieldsetSerializerMixin:
+    """fields 인자로 받은 필드만 남기는 시리얼라이저 믹스인"""
+
+    # 모델 컬럼이 아닌 필드(프로퍼티 등)가 읽는 컬럼
+    field_dependencies = {}
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class SparseFieldsetMixin:
+    """?fields=name,team_name 파라미터를 처리하는 ViewSet 믹스인"""
+
+    fields_query_param = "fields"
+
+    def get_requested_fields(self):
+        """요청된 필드 목록 (없으면 None)"""
+        raw = self.request.query_params.get(self.fields_query_param)
+        if not raw:
+            return None
+
+        serializer_class = self.get_serializer_class()
+        if not issubclass(serializer_class, SparseFieldsetSerializerMixin):
+            return None
+
+        requested = [name.strip() for name in raw.split(",") if name.strip()]
+        available = serializer_class().fields
+        unknown = [name for name in requested if name not in available]
+        if unknown:
+            raise ValidationError(
+                {"error": f"알 수 없는 필드입니다: {', '.join(unknown)}"}
+            )
+        return requested
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_requested_fields()
+        if fields is not None:
+            kwargs.setdefault("fields", fields)
+        return super().get_serializer(*args, **kwargs)
+
+    def get_queryset(self):
+        """?fields 가 없어도 시리얼라이저 필드 컬럼만 SELECT (SELECT * 대신)"""
+        queryset = super().get_queryset()
+        serializer_class = self.get_serializer_class()
+        if not issubclass(serializer_class, SparseFieldsetSerializerMixin):
+            return queryset
+        fields = self.get_requested_fields() or list(serializer_class().fields)
+        return queryset.only(*self.get_only_columns(queryset.model, fields))
+
+    def get_only_columns(self, model, fields):
+        """직렬화 필드 + 정렬 컬럼을 모델 컬럼명으로 변환"""
+        serializer_class = self.get_serializer_class()
+        serializer_fields = serializer_class().fields
+        dependencies = serializer_class.field_dependencies
+
+        names = []
+        for name in fields:
+            names.append(serializer_fields[name].source)
+            names.extend(dependencies.get(name, []))
+        names.extend(self.get_ordering_columns())
+
+        columns = []
+        for name in names:
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            if field.concrete and name not in columns:
+                columns.append(name)
+        return columns
+
+    def get_ordering_columns(self):
+        """정렬/커서 위치 계산에 필요한 컬럼"""
+        sources = [
+            getattr(self, "ordering", None),
+            getattr(self.paginator, "ordering", None),
+            self.request.query_params.get("ordering", "").split(","),
+        ]
+
+        ordering = []
+        for source in sources:
+            if not source:
+                continue
+            if isinstance(source, str):
+                source = [source]
+            ordering.extend(name.strip().lstrip("-") for name in source)
+        return [name for name in ordering if name]
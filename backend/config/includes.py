@@ -0,0 +1,37 @@
+"""
+?include= 관련 데이터 포함 옵션
+- 기본 응답에는 없는 무거운 데이터(예측 등)를 요청한 경우에만 붙임
+    GET /api/matches/?include=predictions
+    GET /api/matches/by_matchday/?matchday=15&include=preview
+"""
+
+from rest_framework.exceptions import ValidationError
+
+
+class IncludeMixin:
+    """?include=a,b 파라미터를 검사하는 ViewSet 믹스인 (include_options 중에서만 허용)"""
+
+    include_query_param = "include"
+    include_options = ()
+
+    def get_include_options(self):
+        """현재 액션에서 허용하는 include 이름 (액션별로 다르면 오버라이드)"""
+        return self.include_options
+
+    def get_includes(self):
+        """요청된 include 이름 집합 (알 수 없는 이름이면 400)"""
+        raw = self.request.query_params.get(self.include_query_param)
+        if not raw:
+            return set()
+
+        requested = {name.strip() for name in raw.split(",") if name.strip()}
+        options = self.get_include_options()
+        unknown = sorted(requested - set(options))
+        if unknown:
+            choices = ", ".join(options)
+            raise ValidationError(
+                {
+                    "error": f"include 는 {choices} 중에서 선택해주세요: {', '.join(unknown)}"
+                }
+            )
+        return requested
@@ -0,0 +1,129 @@
+"""
+JSON 응답 압축 미들웨어
+- Accept-Encoding 협상: br (brotli 설치 시) > gzip
+- COMPRESSION_MIN_SIZE 이상인 GET JSON 응답만 압축
+- ETag 가 있는 응답(캐시 가능한 응답)은 압축 결과를 캐시에 함께 저장해 재사용
+"""
+
+import gzip
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 선택 의존성
+    brotli = None
+
+CACHE_PREFIX = "compressed"
+
+
+def parse_accept_encoding(header):
+    """Accept-Encoding 헤더를 {인코딩: q값} 으로 변환"""
+    encodings = {}
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        encodings[name.strip().lower()] = q
+    return encodings
+
+
+def choose_encoding(header):
+    """클라이언트가 허용하는 인코딩 중 가장 좋은 것 (없으면 None)"""
+    accepted = parse_accept_encoding(header)
+    candidates = ["br", "gzip"] if brotli is not None else ["gzip"]
+
+    best = None
+    best_q = 0.0
+    for encoding in candidates:
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(content, encoding):
+    if encoding == "br":
+        return brotli.compress(content, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    # mtime=0: 같은 입력이면 같은 바이트 (캐시/ETag 안정)
+    return gzip.compress(
+        content, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0
+    )
+
+
+class CompressionMiddleware:
+    """JSON 응답 gzip / brotli 압축"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if not self.should_compress(request, response):
+            return response
+
+        encoding = choose_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding is None:
+            patch_vary_headers(response, ("Accept-Encoding",))
+            return response
+
+        start = time.perf_counter()
+        original_size = len(response.content)
+        compressed = self.get_compressed(response, encoding)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        if len(compressed) >= original_size:
+            return response
+
+        response.content = compressed
+        response["Content-Length"] = str(len(compressed))
+        response["Content-Encoding"] = encoding
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        # 압축 결과가 달라지므로 강한 ETag 는 약한 ETag 로
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+
+        if settings.DEBUG:
+            response["Server-Timing"] = (
+                f'compress;dur={elapsed:.2f};desc="{encoding} '
+                f'{original_size}->{len(compressed)}"'
+            )
+        return response
+
+    def should_compress(self, request, response):
+        """GET 요청의 JSON 응답 중 일정 크기 이상만 압축"""
+        if request.method != "GET" or response.status_code != 200:
+            return False
+        if response.streaming or response.has_header("Content-Encoding"):
+            return False
+        if not response.get("Content-Type", "").startswith("application/json"):
+            return False
+        return len(response.content) >= settings.COMPRESSION_MIN_SIZE
+
+    def get_compressed(self, response, encoding):
+        """ETag 가 있으면 캐시된 압축 결과 재사용"""
+        etag = response.get("ETag")
+        if not etag:
+            return compress(response.content, encoding)
+
+        digest = hashlib.md5(etag.encode()).hexdigest()
+        key = f"{CACHE_PREFIX}:{encoding}:{digest}"
+        compressed = cache.get(key)
+        if compressed is None:
+            compressed = compress(response.content, encoding)
+            cache.set(key, compressed, settings.COMPRESSION_CACHE_TIMEOUT)
+        return compressed
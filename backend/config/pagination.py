@@ -0,0 +1,57 @@
+"""
+목록 API 공통 커서 페이지네이션
+- 인덱스가 걸린 정렬 컬럼을 기준으로 WHERE 조건으로 이동하므로 깊은 페이지도 O(page)
+- API_LEGACY_UNPAGINATED = True 이면 ?cursor 또는 ?page_size 를 보낸 요청만 페이지네이션
+  (기존 프론트엔드처럼 전체 목록을 받는 클라이언트 호환용)
+"""
+
+from django.conf import settings
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination
+
+
+class OptInCursorPagination(CursorPagination):
+    """요청 시에만 동작하는 커서 페이지네이션"""
+
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if settings.API_LEGACY_UNPAGINATED and not self.is_requested(request):
+            return None
+
+        # NULL 은 커서 위치로 쓸 수 없으므로 nullable 컬럼 정렬은 거부 (행을 빼지 않음)
+        for field in self.get_ordering(request, queryset, view):
+            name = field.lstrip("-")
+            if queryset.model._meta.get_field(name).null:
+                raise ValidationError(
+                    {
+                        "error": f"{name} 정렬은 값이 없는 행이 있어 "
+                        "커서 페이지네이션과 함께 쓸 수 없습니다."
+                    }
+                )
+        return super().paginate_queryset(queryset, request, view)
+
+    def is_requested(self, request):
+        """클라이언트가 페이지네이션을 요청했는지 여부"""
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+
+class PlayerCursorPagination(OptInCursorPagination):
+    """선수 목록 (이름순)"""
+
+    ordering = "name"
+
+
+class StaffCursorPagination(OptInCursorPagination):
+    """감독/코치 목록 (팀명순)"""
+
+    ordering = ("team_name", "position", "name")
+
+
+class MatchCursorPagination(OptInCursorPagination):
+    """경기 목록 (최신순)"""
+
+    ordering = "-match_date"
@@ -0,0 +1,53 @@
+"""
+빠른 JSON 렌더러
+- orjson 이 설치되어 있으면 사용 (DRF JSONRenderer 와 같은 바이트 출력)
+- 들여쓰기 요청, 지원하지 않는 타입 등은 기존 JSONRenderer 로 처리
+- 아주 크거나 작은 float 의 지수 표기(1e16 / 1e+16)는 다를 수 있으므로
+  float 가 없는 목록 API 에만 사용
+"""
+
+from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+# datetime 등은 DRF 인코더 형식을 그대로 따르도록 default 로 넘김
+ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson
+    else 0
+)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """orjson 기반 JSONRenderer (출력 형식은 동일)"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data, default=JSONEncoder().default, option=ORJSON_OPTIONS
+            )
+        except (TypeError, ValueError, orjson.JSONEncodeError):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # JSONRenderer 와 동일하게 U+2028, U+2029 이스케이프
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028")
+            ret = ret.replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
+
+
+# 목록 ViewSet 용 renderer_classes
+FAST_RENDERER_CLASSES = [FastJSONRenderer, BrowsableAPIRenderer]
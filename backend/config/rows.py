@@ -0,0 +1,170 @@
+"""
+목록 API 빠른 직렬화 (읽기 전용)
+- 모델 인스턴스 대신 .values_list() 튜플에서 바로 dict 행을 만듦
+- DRF 시리얼라이저 필드 정의로부터 컬럼/변환 함수를 미리 컴파일
+- 출력은 기존 ModelSerializer 결과와 동일 (키 순서, 값 형식 포함)
+"""
+
+from rest_framework import serializers
+from rest_framework.response import Response
+
+from config.fieldsets import SparseFieldsetSerializerMixin
+
+# DB 값이 그대로 JSON 값이 되는 필드 (None 포함)
+IDENTITY_FIELDS = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.FloatField,
+    serializers.ChoiceField,
+    serializers.ReadOnlyField,
+)
+
+# DRF 필드의 to_representation 을 그대로 사용하는 필드
+CONVERTED_FIELDS = (
+    serializers.DateTimeField,
+    serializers.DateField,
+)
+
+
+class RowSerializer:
+    """
+    ModelSerializer 와 같은 출력을 values_list() 로 만드는 직렬화기
+
+    모델 컬럼이 아닌 필드(프로퍼티)는 시리얼라이저의 field_dependencies 와
+    row_mappers 로 계산한다.
+        field_dependencies = {"is_live": ["status"]}
+        row_mappers = {"is_live": lambda status: status == "live"}
+    """
+
+    _cache = {}
+
+    def __init__(self, serializer_class, fields=None):
+        model = serializer_class.Meta.model
+        dependencies = getattr(serializer_class, "field_dependencies", {})
+        mappers = getattr(serializer_class, "row_mappers", {})
+
+        if fields is not None and issubclass(
+            serializer_class, SparseFieldsetSerializerMixin
+        ):
+            serializer = serializer_class(fields=fields)
+        else:
+            serializer = serializer_class()
+
+        columns = {f.name for f in model._meta.concrete_fields}
+
+        self.names = []
+        self.columns = []
+        self.conversions = []
+        self.computed = []
+
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+
+            if name in mappers:
+                self.computed.append((len(self.names), name, mappers[name]))
+                self.names.append(name)
+                continue
+
+            if field.source not in columns:
+                raise TypeError(f"{serializer_class.__name__}.{name}")
+
+            if isinstance(field, CONVERTED_FIELDS):
+                self.conversions.append((len(self.columns), field.to_representation))
+            elif not isinstance(field, IDENTITY_FIELDS):
+                raise TypeError(f"{serializer_class.__name__}.{name}")
+
+            self.names.append(name)
+            self.columns.append(field.source)
+
+        # 계산 필드가 읽는 컬럼은 출력 컬럼 뒤에 추가
+        self.output_width = len(self.columns)
+        computed = []
+        for position, name, mapper in self.computed:
+            indexes = []
+            for source in dependencies.get(name, []):
+                if source not in self.columns:
+                    self.columns.append(source)
+                indexes.append(self.columns.index(source))
+            computed.append((position, mapper, indexes))
+        self.computed = computed
+
+    @classmethod
+    def for_serializer(cls, serializer_class, fields=None):
+        """시리얼라이저별 컴파일 결과 캐시 (지원하지 않는 필드가 있으면 None)"""
+        key = (serializer_class, tuple(fields) if fields is not None else None)
+        if key not in cls._cache:
+            try:
+                cls._cache[key] = cls(serializer_class, fields)
+            except TypeError:
+                cls._cache[key] = None
+        return cls._cache[key]
+
+    def values_list(self, queryset):
+        return queryset.values_list(*self.columns)
+
+    def values(self, queryset, extra=()):
+        extra = [column for column in extra if column not in self.columns]
+        return queryset.values(*self.columns, *extra)
+
+    def to_rows(self, rows):
+        """values_list() 튜플 또는 values() dict 목록을 응답 행으로 변환"""
+        names = self.names
+        columns = self.columns
+        width = self.output_width
+        conversions = self.conversions
+        computed = self.computed
+
+        result = []
+        for row in rows:
+            if isinstance(row, dict):
+                row = [row[column] for column in columns]
+            else:
+                row = list(row)
+
+            for index, convert in conversions:
+                if row[index] is not None:
+                    row[index] = convert(row[index])
+
+            values = row[:width]
+            for position, mapper, indexes in computed:
+                values.insert(position, mapper(*[row[i] for i in indexes]))
+
+            result.append(dict(zip(names, values, strict=True)))
+        return result
+
+
+class RowSerializerMixin:
+    """list 액션을 RowSerializer 로 처리하는 ViewSet 믹스인"""
+
+    def get_row_serializer(self):
+        fields = None
+        if hasattr(self, "get_requested_fields"):
+            fields = self.get_requested_fields()
+        return RowSerializer.for_serializer(self.get_serializer_class(), fields)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.list_response(queryset)
+
+    def list_response(self, queryset):
+        """목록 응답 (페이지네이션 포함)"""
+        row_serializer = self.get_row_serializer()
+
+        if row_serializer is None:
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                serializer = self.get_serializer(page, many=True)
+                return self.get_paginated_response(serializer.data)
+            serializer = self.get_serializer(queryset, many=True)
+            return Response(serializer.data)
+
+        # 커서 페이지네이션은 dict 행에서 다음 커서 위치(정렬 컬럼)를 읽음
+        ordering = []
+        if hasattr(self, "get_ordering_columns"):
+            ordering = self.get_ordering_columns()
+        page = self.paginate_queryset(row_serializer.values(queryset, ordering))
+        if page is not None:
+            return self.get_paginated_response(row_serializer.to_rows(page))
+        return Response(row_serializer.to_rows(row_serializer.values_list(queryset)))
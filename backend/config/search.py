@@ -0,0 +1,408 @@
+"""
+선수/스태프 전문 검색 (full-text search) 인덱스
+- SQLite: FTS5 가상 테이블 (unicode61, 악센트 무시) + bm25 관련도
+- PostgreSQL: 컬럼별 tsvector + 가중치 합친 document(GIN 인덱스) + ts_rank
+- 그 밖의 DB 는 인덱스 없이 기존 icontains 검색으로 대체
+- 테이블은 마이그레이션(create), 내용은 로더 커맨드가 끝날 때 rebuild() 로 다시 채움
+
+    ?q=kane           → 모든 컬럼에서 접두어 검색, 관련도순
+    ?name=son&team=tot → 컬럼별 접두어 검색 (LIKE '%x%' 대신 인덱스 사용)
+"""
+
+import re
+
+from django.db import connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+from rest_framework import filters
+from rest_framework.pagination import PageNumberPagination
+
+TERM_RE = re.compile(r"\w+")
+
+# 검색어에서 사용할 최대 단어 수
+MAX_TERMS = 10
+
+# PostgreSQL setweight 등급 (가중치 높은 순)
+PG_WEIGHTS = "ABCD"
+
+
+def search_terms(text):
+    """검색어 → 단어 목록 (FTS 문법 문자는 버림)"""
+    return [term.lower() for term in TERM_RE.findall(text or "")][:MAX_TERMS]
+
+
+class SearchIndex:
+    """
+    모델 1개의 검색 인덱스
+    columns: 인덱스 컬럼 → (원본 DB 컬럼 목록, 관련도 가중치)
+    """
+
+    def __init__(self, model_path, table, columns):
+        self.model_path = model_path
+        self.table = table
+        self.columns = columns
+
+    @property
+    def model(self):
+        return import_string(self.model_path)
+
+    @staticmethod
+    def supports(connection):
+        return connection.vendor in ("sqlite", "postgresql")
+
+    def available(self, using="default"):
+        return self.supports(connections[using])
+
+    # ------------------------------------------------------------------
+    # 테이블 생성 / 재구성
+    # ------------------------------------------------------------------
+
+    def create_sql(self, connection):
+        if connection.vendor == "sqlite":
+            columns = ", ".join(self.columns)
+            return [
+                f"CREATE VIRTUAL TABLE {self.table} USING fts5("
+                f"{columns}, tokenize='unicode61 remove_diacritics 2')"
+            ]
+        if connection.vendor == "postgresql":
+            columns = "".join(
+                f"{column} tsvector NOT NULL, " for column in self.columns
+            )
+            return [
+                f"CREATE TABLE {self.table} ("
+                f"id bigint PRIMARY KEY, {columns}document tsvector NOT NULL)",
+                f"CREATE INDEX {self.table}_document ON {self.table} USING gin (document)",
+            ]
+        return []
+
+    def drop_sql(self, connection):
+        if not self.supports(connection):
+            return []
+        return [f"DROP TABLE IF EXISTS {self.table}"]
+
+    def source_sql(self):
+        """
+        원본 테이블 → (FROM 절, pk 컬럼, 인덱스 컬럼별 텍스트 SQL 식)
+        원본 컬럼 "profile__introduction" 은 역방향 1:1 관계 테이블을 LEFT JOIN
+        """
+        model = self.model
+        table = model._meta.db_table
+        pk = f"{table}.{model._meta.pk.column}"
+        joins = {}
+
+        def column_sql(source):
+            if "__" not in source:
+                return f"{table}.{source}"
+            relation, column = source.split("__", 1)
+            related = model._meta.get_field(relation)
+            related_table = related.related_model._meta.db_table
+            joins[related_table] = (
+                f" LEFT JOIN {related_table} "
+                f"ON {related_table}.{related.field.column} = {pk}"
+            )
+            return f"{related_table}.{column}"
+
+        exprs = {
+            column: " || ' ' || ".join(
+                f"coalesce({column_sql(source)}, '')" for source in sources
+            )
+            for column, (sources, _) in self.columns.items()
+        }
+        return table + "".join(joins.values()), pk, exprs
+
+    def source_tables(self):
+        """rebuild 에 필요한 원본 테이블 이름"""
+        model = self.model
+        tables = {model._meta.db_table}
+        for sources, _ in self.columns.values():
+            for source in sources:
+                if "__" in source:
+                    relation = model._meta.get_field(source.split("__", 1)[0])
+                    tables.add(relation.related_model._meta.db_table)
+        return tables
+
+    def rebuild_sql(self, connection):
+        source, pk, exprs = self.source_sql()
+        columns = ", ".join(self.columns)
+
+        if connection.vendor == "sqlite":
+            values = ", ".join(exprs.values())
+            return [
+                f"DELETE FROM {self.table}",
+                f"INSERT INTO {self.table} (rowid, {columns}) "
+                f"SELECT {pk}, {values} FROM {source}",
+            ]
+        if connection.vendor == "postgresql":
+            grades = self.pg_grades()
+            vectors = [f"to_tsvector('simple', {expr})" for expr in exprs.values()]
+            document = " || ".join(
+                f"setweight({vector}, '{grades[column]}')"
+                for column, vector in zip(self.columns, vectors, strict=True)
+            )
+            return [
+                f"DELETE FROM {self.table}",
+                f"INSERT INTO {self.table} (id, {columns}, document) "
+                f"SELECT {pk}, {', '.join(vectors)}, {document} FROM {source}",
+            ]
+        return []
+
+    def create(self, schema_editor):
+        """
+        마이그레이션용 - 테이블 생성 후 현재 데이터로 채움
+        (원본 테이블이 아직 없는 이전 마이그레이션 시점이면 빈 테이블만 만듦)
+        """
+        connection = schema_editor.connection
+        sqls = self.create_sql(connection)
+        if self.source_tables() <= set(connection.introspection.table_names()):
+            sqls += self.rebuild_sql(connection)
+        for sql in sqls:
+            schema_editor.execute(sql)
+
+    def drop(self, schema_editor):
+        for sql in self.drop_sql(schema_editor.connection):
+            schema_editor.execute(sql)
+
+    def rebuild(self, using="default"):
+        """원본 테이블 내용으로 인덱스 재구성 (로더 커맨드에서 호출)"""
+        connection = connections[using]
+        with connection.cursor() as cursor:
+            for sql in self.rebuild_sql(connection):
+                cursor.execute(sql)
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+
+    def pg_grades(self):
+        weights = sorted({weight for _, weight in self.columns.values()}, reverse=True)
+        grade = {weight: PG_WEIGHTS[min(i, 3)] for i, weight in enumerate(weights)}
+        return {column: grade[weight] for column, (_, weight) in self.columns.items()}
+
+    def where(self, connection, text=None, filters=None):
+        """
+        (WHERE 식, 파라미터, 관련도 ORDER BY 식, 파라미터) - 검색어가 없으면 None
+        filters: 인덱스 컬럼 (공백으로 구분해 여러 개) → 검색어
+        """
+        parts = [(None, search_terms(text))]
+        parts += [
+            (column, search_terms(value)) for column, value in (filters or {}).items()
+        ]
+        parts = [(column, terms) for column, terms in parts if terms]
+        if not parts:
+            return None
+
+        if connection.vendor == "sqlite":
+            expressions = []
+            for column, terms in parts:
+                expression = "(" + " ".join(f'"{term}"*' for term in terms) + ")"
+                if column is not None:
+                    expression = f"{{{column}}} : {expression}"
+                expressions.append(expression)
+            weights = ", ".join(str(weight) for _, weight in self.columns.values())
+            return (
+                f"{self.table} MATCH %s",
+                [" AND ".join(expressions)],
+                f"bm25({self.table}, {weights})",
+                [],
+            )
+
+        # PostgreSQL: document 로 GIN 인덱스 검색 + 컬럼 조건
+        every = " & ".join(f"'{term}':*" for _, terms in parts for term in terms)
+        conditions = ["document @@ to_tsquery('simple', %s)"]
+        params = [every]
+        for column, terms in parts:
+            if column is not None:
+                vector = " || ".join(column.split())
+                conditions.append(f"({vector}) @@ to_tsquery('simple', %s)")
+                params.append(" & ".join(f"'{term}':*" for term in terms))
+        return (
+            " AND ".join(conditions),
+            params,
+            # bm25 와 같이 작을수록 관련도가 높도록 부호 반전
+            "-ts_rank(document, to_tsquery('simple', %s))",
+            [every],
+        )
+
+    def id_column(self, connection):
+        return "rowid" if connection.vendor == "sqlite" else "id"
+
+    def matching(self, text=None, filters=None, using="default"):
+        """검색 결과 pk 서브쿼리 (queryset.filter(pk__in=...) 용) - 검색어가 없으면 None"""
+        connection = connections[using]
+        where = self.where(connection, text, filters)
+        if where is None:
+            return None
+        sql, params, _, _ = where
+        return RawSQL(
+            f"SELECT {self.id_column(connection)} FROM {self.table} WHERE {sql}", params
+        )
+
+    def count(self, text=None, filters=None, using="default"):
+        connection = connections[using]
+        sql, params, _, _ = self.where(connection, text, filters)
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT count(*) FROM {self.table} WHERE {sql}", params)
+            return cursor.fetchone()[0]
+
+    def ranked(self, text=None, filters=None, limit=None, offset=0, using="default"):
+        """관련도순 pk 목록"""
+        connection = connections[using]
+        sql, params, rank, rank_params = self.where(connection, text, filters)
+        id_column = self.id_column(connection)
+        query = (
+            f"SELECT {id_column} FROM {self.table} WHERE {sql} "
+            f"ORDER BY {rank}, {id_column}"
+        )
+        params = [*params, *rank_params]
+        if limit is not None:
+            query += " LIMIT %s OFFSET %s"
+            params += [limit, offset]
+        with connection.cursor() as cursor:
+            cursor.execute(query, params)
+            return [row[0] for row in cursor.fetchall()]
+
+
+INDEXES = {
+    "players": SearchIndex(
+        "players.models.Player",
+        "players_player_fts",
+        {
+            "name": (["name", "full_name"], 10),
+            "team": (["team_name"], 5),
+            "nationality": (["nationality"], 2),
+            "position": (["position", "position_abbr"], 2),
+            "text": (["profile__introduction", "profile__playing_style"], 1),
+        },
+    ),
+    "staff": SearchIndex(
+        "teams.models.Staff",
+        "teams_staff_fts",
+        {
+            "name": (["name"], 10),
+            "team": (["team_name"], 5),
+            "nationality": (["nationality"], 2),
+            "position": (["position"], 2),
+        },
+    ),
+}
+
+
+def rebuild(name):
+    """로더 커맨드용 - 인덱스 재구성 (지원하지 않는 DB 면 False)"""
+    index = INDEXES[name]
+    if not index.available():
+        return False
+    index.rebuild()
+    return True
+
+
+class RankedResults:
+    """관련도순 검색 결과 - Django Paginator 가 필요한 범위만 조회"""
+
+    def __init__(self, index, text, filters, load):
+        self.index = index
+        self.text = text
+        self.filters = filters
+        self.load = load  # pk 목록 → 같은 순서의 결과 목록
+
+    def count(self):
+        return self.index.count(self.text, self.filters)
+
+    def __getitem__(self, page):
+        ids = self.index.ranked(
+            self.text, self.filters, page.stop - page.start, page.start
+        )
+        return self.load(ids)
+
+
+class SearchPagination(PageNumberPagination):
+    """관련도순 검색 결과 페이지네이션 (?page, ?page_size)"""
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class FullTextSearchMixin:
+    """
+    search 액션을 검색 인덱스로 처리하는 ViewSet 믹스인
+    search_params: 쿼리 파라미터 → (인덱스 컬럼, 인덱스가 없을 때 icontains 필드)
+    """
+
+    search_index = None
+    search_params = {}
+
+    def search_response(self, request):
+        queryset = self.get_queryset()
+        params = request.query_params
+        text = params.get("q", "").strip()
+        filters = {
+            column: params[param]
+            for param, (column, _) in self.search_params.items()
+            if params.get(param)
+        }
+
+        index = INDEXES[self.search_index]
+        if not index.available():
+            return self.list_response(self.icontains_search(queryset, text, params))
+
+        if not search_terms(text):
+            # 컬럼 조건만 있으면 기존 정렬/페이지네이션 그대로
+            matching = index.matching(filters=filters)
+            if matching is not None:
+                queryset = queryset.filter(pk__in=matching)
+            return self.list_response(queryset)
+
+        paginator = SearchPagination()
+        results = RankedResults(
+            index, text, filters, lambda ids: self.load_ranked(queryset, ids)
+        )
+        page = paginator.paginate_queryset(results, request, view=self)
+        return paginator.get_paginated_response(page)
+
+    def load_ranked(self, queryset, ids):
+        """pk 목록 → 같은 순서의 응답 행"""
+        row_serializer = self.get_row_serializer()
+        if row_serializer is None:
+            objects = queryset.in_bulk(ids)
+            ordered = [objects[pk] for pk in ids if pk in objects]
+            return self.get_serializer(ordered, many=True).data
+
+        pk = queryset.model._meta.pk.attname
+        values = {
+            row[pk]: row
+            for row in row_serializer.values(queryset.filter(pk__in=ids), [pk])
+        }
+        return row_serializer.to_rows(values[i] for i in ids if i in values)
+
+    def icontains_search(self, queryset, text, params):
+        for param, (_, field) in self.search_params.items():
+            if params.get(param):
+                queryset = queryset.filter(**{f"{field}__icontains": params[param]})
+        if text:
+            condition = Q()
+            for _, field in self.search_params.values():
+                condition |= Q(**{f"{field}__icontains": text})
+            queryset = queryset.filter(condition)
+        return queryset
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """?search= 를 검색 인덱스로 처리 (정렬/페이지네이션은 기존 그대로)"""
+
+    def filter_queryset(self, request, queryset, view):
+        name = getattr(view, "search_index", None)
+        text = request.query_params.get(self.search_param, "")
+        if name is None or not INDEXES[name].available() or not text.strip():
+            return super().filter_queryset(request, queryset, view)
+
+        # search_fields 에 해당하는 인덱스 컬럼에서만 검색
+        columns = getattr(view, "search_columns", None)
+        if columns:
+            matching = INDEXES[name].matching(filters={" ".join(columns): text})
+        else:
+            matching = INDEXES[name].matching(text)
+        if matching is None:
+            return queryset.none()
+        return queryset.filter(pk__in=matching)
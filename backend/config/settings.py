@@ -47,6 +47,7 @@ INSTALLED_APPS = [
     # Third party apps
     "rest_framework",
     "rest_framework.authtoken",  # 추가
+    "django_filters",
     "corsheaders",
     "dj_rest_auth",  # 추가
     "dj_rest_auth.registration",  # 추가
@@ -62,11 +63,13 @@ INSTALLED_APPS = [
     "teams",
     "matches",
     "players",
+    "sync",
     "ai_analysis",
 ]
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "config.middleware.CompressionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -164,17 +167,46 @@ CORS_ALLOW_ALL_ORIGINS = True
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        # 요청마다 User 를 조회하지 않는 JWT 인증 (accounts/authentication.py)
+        "accounts.authentication.StatelessJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticatedOrReadOnly",
     ],
-    # 페이지네이션 비활성화 (프론트엔드에서 직접 처리)
+    # 페이지네이션은 ViewSet별 커서 페이지네이션 사용 (config/pagination.py)
     # "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     # "PAGE_SIZE": 20,
 }
 
+# 기존처럼 전체 목록 반환 (True면 ?cursor / ?page_size 요청에만 페이지네이션 적용)
+API_LEGACY_UNPAGINATED = os.getenv("API_LEGACY_UNPAGINATED", "True") == "True"
+
+# JSON 응답 압축 (config/middleware.py)
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))  # bytes
+COMPRESSION_GZIP_LEVEL = 6
+COMPRESSION_BROTLI_QUALITY = 5  # brotli 패키지가 설치된 경우에만 사용
+COMPRESSION_CACHE_TIMEOUT = 60 * 60  # ETag 별 압축 결과 캐시 (초)
+
+# 공개 목록 API 정적 JSON 스냅샷 (config/snapshots.py)
+SNAPSHOT_ENABLED = os.getenv("SNAPSHOT_ENABLED", "True") == "True"
+SNAPSHOT_DIR = BASE_DIR / "data" / "snapshots"
+
+# 배치 API (config/batch.py)
+BATCH_MAX_REQUESTS = 10
+BATCH_CACHE_TIMEOUT = 60 * 5  # ETag 가 있는 하위 응답 캐시 (초)
+
+# 목록 항목별 개수 (config/facets.py) - 데이터 버전별 캐시라 길게 둬도 됨
+FACETS_CACHE_TIMEOUT = 60 * 60
+
+# 실시간 경기 스트림 (matches/live.py, ASGI 전용)
+LIVE_POLL_INTERVAL = int(
+    os.getenv("LIVE_POLL_INTERVAL", "5")
+)  # 다른 프로세스 변경분 확인 주기 (초)
+LIVE_HEARTBEAT_INTERVAL = 15  # 초
+LIVE_QUEUE_SIZE = 100  # 구독자별 대기 이벤트 수 (넘으면 연결 종료 후 재접속)
+LIVE_RETRY_MS = 3000  # EventSource 재접속 대기 (ms)
+
 AUTH_USER_MODEL = "accounts.User"
 
 from datetime import timedelta
@@ -190,6 +222,53 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
 
+# 경기 예측 (ai_analysis/predictions.py)
+PREDICTION_TIME_DECAY = 0.0065  # 경기 가중치 감쇠 (일 단위, 약 반년 전 결과는 1/3)
+PREDICTION_PRIOR_MATCHES = 2.0  # 팀마다 더하는 리그 평균 가상 경기 수
+PREDICTION_MAX_GOALS = 10  # 점수 행렬 크기 (0 ~ N 골)
+
+# 팀 Elo 레이팅 (ai_analysis/ratings.py)
+ELO_INITIAL = 1500.0
+ELO_K = 20.0  # 경기당 최대 변화 기준값
+ELO_HOME_ADVANTAGE = 65.0  # 홈팀 레이팅 보정
+
+# 팀 맞대결 집계 (ai_analysis/matchups.py)
+HEAD_TO_HEAD_RECENT = 5  # 저장하는 최근 맞대결 결과 수
+
+# 예측 모델 워크포워드 평가 (ai_analysis/backtest.py)
+BACKTEST_START_MATCHDAY = 4  # 이 라운드부터 예측 (이전 라운드는 학습만)
+BACKTEST_WORKERS = int(
+    os.getenv("BACKTEST_WORKERS", str(os.cpu_count() or 1))
+)  # 1 이면 프로세스 풀 없이 실행
+BACKTEST_CALIBRATION_BINS = 10
+
+# 경기 특성 저장소 (ai_analysis/features.py, 컬럼별 .npy)
+FEATURE_STORE_DIR = BASE_DIR / "data" / "features"
+
+# 팀 시즌 통계 (teams/stats.py)
+TEAM_STATS_CACHE_TIMEOUT = 60 * 60 * 24  # 경기 데이터 버전별 캐시라 길게 둬도 됨
+
+# 비슷한 선수 찾기 인덱스 (ai_analysis/similarity.py)
+PLAYER_SIMILARITY_PATH = BASE_DIR / "data" / "similarity" / "players.npz"
+PLAYER_SIMILARITY_MAX_TERMS = 2000  # 소개글 TF-IDF 단어 수
+PLAYER_SIMILARITY_WEIGHTS = {  # 벡터 블록별 가중치 (블록마다 L2 정규화 후 곱함)
+    "attributes": 1.0,  # 나이/키/몸무게
+    "position": 1.0,
+    "nationality": 0.5,
+    "text": 1.5,  # 소개글 TF-IDF
+}
+
+# 시즌 최종 순위 시뮬레이션 (ai_analysis/season.py)
+SIMULATION_COUNT = int(os.getenv("SIMULATION_COUNT", "100000"))
+SIMULATION_WORKERS = int(
+    os.getenv("SIMULATION_WORKERS", str(os.cpu_count() or 1))
+)  # 1 이면 프로세스 풀 없이 실행
+SIMULATION_CACHE_TIMEOUT = 60 * 60 * 24  # 데이터 버전별 캐시라 길게 둬도 됨
+SIMULATION_RESULT_PATH = BASE_DIR / "data" / "simulation" / "season.json"
+
+# 응원 팀 ID 캐시 유지 시간 (초, accounts/favorites.py)
+FAVORITE_TEAMS_CACHE_TTL = 60
+
 # dj-rest-auth Settings
 REST_AUTH = {
     "USE_JWT": True,
@@ -241,3 +320,30 @@ SOCIALACCOUNT_PROVIDERS = {
         }
     },
 }
+
+# 소셜 로그인 콜백 (accounts/oauth.py)
+# 부하 테스트 등에서 가짜 제공자로 바꿀 수 있도록 URL 을 환경 변수로 설정 가능
+OAUTH_PROVIDERS = {
+    "naver": {
+        "token_url": os.getenv(
+            "NAVER_TOKEN_URL", "https://nid.naver.com/oauth2.0/token"
+        ),
+        "user_info_url": os.getenv(
+            "NAVER_USER_INFO_URL", "https://openapi.naver.com/v1/nid/me"
+        ),
+    },
+    "google": {
+        "token_url": os.getenv(
+            "GOOGLE_TOKEN_URL", "https://oauth2.googleapis.com/token"
+        ),
+        "user_info_url": os.getenv(
+            "GOOGLE_USER_INFO_URL", "https://www.googleapis.com/oauth2/v2/userinfo"
+        ),
+    },
+}
+OAUTH_CONNECT_TIMEOUT = 3  # 초
+OAUTH_READ_TIMEOUT = 5  # 초
+OAUTH_MAX_CONNECTIONS = 100  # 이벤트 루프별 연결 풀 크기
+
+# 자동완성 인덱스 데이터 버전 확인 주기 (초, config/autocomplete.py)
+AUTOCOMPLETE_CHECK_INTERVAL = 30
@@ -0,0 +1,256 @@
+"""
+공개 목록 API 정적 JSON 스냅샷
+- 로더/업데이트 커맨드가 끝날 때 publish() 로 버전별 파일 생성
+    data/snapshots/<name>/<version>.json (+ .json.gz, .json.br)
+    data/snapshots/<name>/latest.json  (+ .gz, .br)  ← 프론트 프록시용 고정 경로
+    data/snapshots/<name>/current.json               ← 현재 버전 포인터 (+ 형식 지문)
+- ViewSet list 는 쿼리 파라미터가 없으면 ORM 없이 파일을 그대로 응답
+  시리얼라이저 필드가 바뀌어 형식 지문이 다르면 스냅샷을 쓰지 않음
+- 관리자 화면 등에서 모델이 저장/삭제되면 (post_save / post_delete) 스냅샷 무효화
+  → 다음 publish() 까지 일반 목록 API 로 응답
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.module_loading import import_string
+
+from config.middleware import brotli, choose_encoding
+from config.renderers import FastJSONRenderer
+from config.rows import RowSerializer
+
+# 스냅샷 이름: (모델, 시리얼라이저, 정렬) - 각 ViewSet list 기본 응답과 동일
+SNAPSHOTS = {
+    "standings": (
+        "teams.models.TeamStanding",
+        "teams.serializers.TeamStandingSerializer",
+        ["rank"],
+    ),
+    "teams": ("teams.models.Team", "teams.serializers.TeamSerializer", ["team_name"]),
+    "staff": (
+        "teams.models.Staff",
+        "teams.serializers.StaffSerializer",
+        ["team_name", "position"],
+    ),
+    "players": (
+        "players.models.Player",
+        "players.serializers.PlayerSerializer",
+        ["name"],
+    ),
+    "matches": (
+        "matches.models.Match",
+        "matches.serializers.MatchListSerializer",
+        ["-match_date"],
+    ),
+}
+
+# 인코딩별 파일 확장자
+SUFFIXES = {None: ".json", "gzip": ".json.gz", "br": ".json.br"}
+
+# 보관할 이전 버전 수
+KEEP_VERSIONS = 3
+
+_pointer_cache = {}
+_schema_cache = {}
+
+
+def snapshot_dir(name):
+    return Path(settings.SNAPSHOT_DIR) / name
+
+
+def schema(name):
+    """스냅샷 형식 지문 (모델/시리얼라이저/정렬/출력 필드 목록)"""
+    if name not in _schema_cache:
+        model_path, serializer_path, ordering = SNAPSHOTS[name]
+        row_serializer = RowSerializer.for_serializer(import_string(serializer_path))
+        key = json.dumps(
+            [model_path, serializer_path, ordering, row_serializer.names]
+        ).encode()
+        _schema_cache[name] = hashlib.sha256(key).hexdigest()[:16]
+    return _schema_cache[name]
+
+
+def build(name):
+    """스냅샷 본문(JSON bytes) 생성"""
+    model_path, serializer_path, ordering = SNAPSHOTS[name]
+    model = import_string(model_path)
+    row_serializer = RowSerializer.for_serializer(import_string(serializer_path))
+
+    queryset = model.objects.order_by(*ordering)
+    rows = row_serializer.to_rows(row_serializer.values_list(queryset))
+    return FastJSONRenderer().render(rows)
+
+
+def _write_atomic(path, content):
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(content)
+    os.replace(tmp, path)
+
+
+def _link_atomic(source, target):
+    """target 을 source 와 같은 파일로 교체 (하드링크, 실패 시 복사)"""
+    tmp = target.with_name(target.name + ".tmp")
+    if tmp.exists():
+        tmp.unlink()
+    try:
+        os.link(source, tmp)
+    except OSError:
+        shutil.copyfile(source, tmp)
+    os.replace(tmp, target)
+
+
+def publish(name):
+    """스냅샷을 다시 만들어 현재 버전으로 지정 (비활성화 시 None)"""
+    if not settings.SNAPSHOT_ENABLED:
+        return None
+
+    body = build(name)
+    version = hashlib.sha256(body).hexdigest()[:16]
+
+    directory = snapshot_dir(name)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    variants = {None: body, "gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(body, quality=11)
+
+    for encoding, content in variants.items():
+        path = directory / f"{version}{SUFFIXES[encoding]}"
+        if not path.exists():
+            _write_atomic(path, content)
+        _link_atomic(path, directory / f"latest{SUFFIXES[encoding]}")
+
+    pointer = {
+        "version": version,
+        "schema": schema(name),
+        "generated_at": timezone.now().isoformat(),
+        "size": len(body),
+        "encodings": [encoding for encoding in variants if encoding],
+    }
+    _write_atomic(directory / "current.json", json.dumps(pointer).encode())
+
+    _prune(directory, version)
+    return pointer
+
+
+def _prune(directory, current):
+    """오래된 버전 파일 정리"""
+    versions = {}
+    for path in directory.glob("*.json*"):
+        version = path.name.split(".")[0]
+        if version not in ("latest", "current", current):
+            versions.setdefault(version, []).append(path)
+
+    ordered = sorted(
+        versions.items(), key=lambda item: max(p.stat().st_mtime for p in item[1])
+    )
+    for _, paths in ordered[: max(0, len(ordered) - (KEEP_VERSIONS - 1))]:
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+
+def current(name):
+    """현재 스냅샷 포인터 (없으면 None) - 파일 mtime 기준으로 메모리 캐시"""
+    if not settings.SNAPSHOT_ENABLED:
+        return None
+
+    path = snapshot_dir(name) / "current.json"
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    cached = _pointer_cache.get(name)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, "rb") as f:
+        pointer = json.loads(f.read())
+    _pointer_cache[name] = (mtime, pointer)
+    return pointer
+
+
+def invalidate(name):
+    """현재 스냅샷 포인터와 고정 경로 파일 삭제 (버전별 파일은 _prune 이 정리)"""
+    directory = snapshot_dir(name)
+    (directory / "current.json").unlink(missing_ok=True)
+    for suffix in SUFFIXES.values():
+        (directory / f"latest{suffix}").unlink(missing_ok=True)
+    _pointer_cache.pop(name, None)
+
+
+def model_changed(sender, **kwargs):
+    """post_save / post_delete 수신 - 그 모델의 스냅샷 무효화"""
+    model_path = f"{sender.__module__}.{sender.__name__}"
+    for name, (snapshot_model, _, _) in SNAPSHOTS.items():
+        if snapshot_model == model_path:
+            invalidate(name)
+
+
+def age_seconds(pointer):
+    """스냅샷 생성 후 지난 시간(초)"""
+    generated_at = datetime.fromisoformat(pointer["generated_at"])
+    return (timezone.now() - generated_at).total_seconds()
+
+
+def response(request, name):
+    """스냅샷 파일 응답 (스냅샷이 없으면 None)"""
+    pointer = current(name)
+    if pointer is None or pointer.get("schema") != schema(name):
+        return None
+
+    etag = f'W/"{pointer["version"]}"'
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        not_modified["ETag"] = etag
+        return not_modified
+
+    encoding = choose_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+    if encoding is not None and encoding not in pointer["encodings"]:
+        encoding = None
+
+    path = snapshot_dir(name) / f"{pointer['version']}{SUFFIXES[encoding]}"
+    try:
+        with open(path, "rb") as f:
+            content = f.read()
+    except FileNotFoundError:
+        return None
+
+    result = HttpResponse(content, content_type="application/json")
+    if encoding:
+        result["Content-Encoding"] = encoding
+    result["ETag"] = etag
+    patch_vary_headers(result, ("Accept-Encoding",))
+    patch_cache_control(result, no_cache=True)
+    return result
+
+
+class SnapshotListMixin:
+    """파라미터 없는 JSON list 요청을 스냅샷 파일로 응답하는 ViewSet 믹스인"""
+
+    snapshot_name = None
+
+    def list(self, request, *args, **kwargs):
+        if (
+            self.snapshot_name
+            and not request.query_params
+            and request.accepted_renderer.format == "json"
+        ):
+            snapshot = response(request, self.snapshot_name)
+            if snapshot is not None:
+                return snapshot
+        return super().list(request, *args, **kwargs)
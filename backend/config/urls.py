@@ -1,6 +1,9 @@
 from django.contrib import admin
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+from ai_analysis.views import MatchPredictionViewSet, TeamRatingViewSet
+from config.autocomplete import autocomplete
+from config.batch import batch
 from players.views import PlayerViewSet
 from teams.views import TeamViewSet, StaffViewSet, TeamStandingViewSet
 
@@ -9,10 +12,15 @@ router.register(r"players", PlayerViewSet, basename="player")
 router.register(r"teams", TeamViewSet, basename="team")
 router.register(r"staff", StaffViewSet, basename="staff")
 router.register(r"standings", TeamStandingViewSet, basename="standing")
+router.register(r"predictions", MatchPredictionViewSet, basename="prediction")
+router.register(r"ratings", TeamRatingViewSet, basename="rating")
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/accounts/", include("accounts.urls")),
+    path("api/batch/", batch, name="batch"),  # 여러 GET 요청 묶음
+    path("api/autocomplete/", autocomplete, name="autocomplete"),  # 이름 자동완성
+    path("api/sync/", include("sync.urls")),  # 델타 동기화
     path("api/", include("matches.urls")),
     path("api/", include(router.urls)),  # 통합된 라우터
 ]
@@ -0,0 +1,14 @@
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_data(settings, tmp_path):
+    """테스트마다 스냅샷/특성 저장소 등 data/ 파일을 임시 폴더에 쓰고 캐시 비우기"""
+    settings.SNAPSHOT_DIR = tmp_path / "snapshots"
+    settings.FEATURE_STORE_DIR = tmp_path / "features"
+    settings.PLAYER_SIMILARITY_PATH = tmp_path / "similarity" / "players.npz"
+    settings.SIMULATION_RESULT_PATH = tmp_path / "simulation" / "season.json"
+    cache.clear()
+    yield
+    cache.clear()
@@ -0,0 +1,217 @@
+"""
+실시간 경기 상태/점수 브로커 (프로세스 내 pub/sub)
+- 구독자가 있는 동안 경기 상태를 메모리에 들고 있다가, 바뀐 경기만 이벤트로 발행
+- 이벤트는 한 번만 직렬화(SSE 프레임)해서 해당 구독자 큐에 그대로 전달
+  → 비용은 변경 수에 비례 (클라이언트 수 × 폴링 수가 아님)
+- 입력 경로
+    1) update_matches 커맨드가 같은 프로세스에서 실행되면 직접 publish()
+    2) 다른 프로세스(cron 등)에서 실행된 경우를 위해 watcher 가 LIVE_POLL_INTERVAL 마다
+       updated_at 이후 변경분만 1번 조회해서 publish()
+"""
+
+import asyncio
+import contextvars
+import json
+import threading
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+
+from .models import Match
+
+# 변경 여부를 비교하는 필드
+STATE_FIELDS = (
+    "status",
+    "home_score",
+    "away_score",
+    "home_half_score",
+    "away_half_score",
+)
+
+EVENT_FIELDS = ("match_id", "home_team_id", "away_team_id", *STATE_FIELDS)
+
+
+def encode(event, data, event_id=None):
+    """SSE 프레임"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append("data: " + json.dumps(data, ensure_ascii=False, default=str))
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+def deliver(deliveries):
+    for subscription, frame in deliveries:
+        subscription.put(frame)
+
+
+class Subscription:
+    """구독자 1명 (이벤트 루프의 asyncio.Queue)"""
+
+    def __init__(self, team_ids=None):
+        self.team_ids = frozenset(team_ids) if team_ids else None
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=settings.LIVE_QUEUE_SIZE)
+
+    def matches(self, row):
+        return self.team_ids is None or bool(
+            self.team_ids & {row["home_team_id"], row["away_team_id"]}
+        )
+
+    def put(self, frame):
+        """이벤트 루프 스레드에서만 호출"""
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            # 느린 클라이언트: 연결을 끊고 재접속(스냅샷부터 다시)하게 함
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+
+class LiveBroker:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._all = set()
+        self._by_team = defaultdict(set)
+        self._state = None  # match_id -> 이벤트 row
+        self._cursor = None  # watcher 가 마지막으로 본 updated_at
+        self._sequence = 0
+        self._watcher = None
+
+    # ------------------------------------------------------------------
+    # 구독
+    # ------------------------------------------------------------------
+
+    async def subscribe(self, team_ids=None):
+        """구독 등록 → (Subscription, 현재 진행 중인 경기 목록)"""
+        if self._state is None:
+            state, cursor = await sync_to_async(self._load_state)()
+            with self._lock:
+                if self._state is None:
+                    self._state, self._cursor = state, cursor
+
+        subscription = Subscription(team_ids)
+        with self._lock:
+            if subscription.team_ids is None:
+                self._all.add(subscription)
+            else:
+                for team_id in subscription.team_ids:
+                    self._by_team[team_id].add(subscription)
+
+            live = [
+                row
+                for row in self._state.values()
+                if row["status"] == "live" and subscription.matches(row)
+            ]
+
+            if self._watcher is None:
+                # 요청 컨텍스트(요청별 sync 스레드 등)를 물려받지 않도록 새 컨텍스트로 실행
+                self._watcher = asyncio.get_running_loop().create_task(
+                    self._watch(), context=contextvars.Context()
+                )
+        return subscription, live
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._all.discard(subscription)
+            for team_id in subscription.team_ids or ():
+                subscribers = self._by_team.get(team_id)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._by_team[team_id]
+
+    def has_subscribers(self):
+        return bool(self._all or self._by_team)
+
+    # ------------------------------------------------------------------
+    # 발행
+    # ------------------------------------------------------------------
+
+    def publish(self, rows):
+        """경기 row(dict) 목록 중 상태가 바뀐 것만 이벤트로 발행 → 발행 수"""
+        published = 0
+        pending = defaultdict(list)
+        with self._lock:
+            if self._state is None:
+                # 구독자가 없는 프로세스 (예: cron 으로 실행된 커맨드)
+                return 0
+
+            for row in rows:
+                previous = self._state.get(row["match_id"])
+                # row 에 없는 필드는 이전 값 유지 (부분 업데이트)
+                row = {
+                    field: row.get(field, previous and previous[field])
+                    for field in EVENT_FIELDS
+                }
+                if previous is not None and all(
+                    previous[field] == row[field] for field in STATE_FIELDS
+                ):
+                    continue
+
+                self._state[row["match_id"]] = row
+                self._sequence += 1
+                changed = [
+                    field
+                    for field in STATE_FIELDS
+                    if previous is None or previous[field] != row[field]
+                ]
+                frame = encode("match", {**row, "changed": changed}, self._sequence)
+
+                targets = set(self._all)
+                targets.update(self._by_team.get(row["home_team_id"], ()))
+                targets.update(self._by_team.get(row["away_team_id"], ()))
+                for subscription in targets:
+                    pending[subscription.loop].append((subscription, frame))
+                published += 1
+
+        # 루프별로 한 번만 깨워서 전달 (발행 스레드와 루프 스레드가 다를 수 있음)
+        for loop, deliveries in pending.items():
+            loop.call_soon_threadsafe(deliver, deliveries)
+        return published
+
+    # ------------------------------------------------------------------
+    # DB
+    # ------------------------------------------------------------------
+
+    def _load_state(self):
+        state = {}
+        cursor = None
+        for row in Match.objects.values(*EVENT_FIELDS, "updated_at"):
+            updated_at = row.pop("updated_at")
+            if cursor is None or updated_at > cursor:
+                cursor = updated_at
+            state[row["match_id"]] = row
+        return state, cursor
+
+    def _changed_rows(self):
+        """마지막 조회 이후 updated_at 이 바뀐 경기"""
+        close_old_connections()
+        queryset = Match.objects.values(*EVENT_FIELDS, "updated_at")
+        if self._cursor is not None:
+            queryset = queryset.filter(updated_at__gt=self._cursor)
+
+        rows = list(queryset)
+        if rows:
+            self._cursor = max(row["updated_at"] for row in rows)
+        return rows
+
+    async def _watch(self):
+        """다른 프로세스의 변경분 반영 (구독자가 없어지면 종료)"""
+        while True:
+            await asyncio.sleep(settings.LIVE_POLL_INTERVAL)
+            with self._lock:
+                if not self.has_subscribers():
+                    self._watcher = None
+                    self._state = None
+                    self._cursor = None
+                    return
+            rows = await sync_to_async(self._changed_rows)()
+            self.publish(rows)
+
+
+broker = LiveBroker()
@@ -1,5 +1,9 @@
 from django.core.management.base import BaseCommand
+from ai_analysis import features, matchups, predictions, previews, ratings, season
+from config import snapshots
+from matches import live
 from matches.models import Match
+from sync.changes import apply_rows
 import requests
 from datetime import datetime
 import pytz
@@ -58,20 +62,23 @@ class Command(BaseCommand):
                 else:
                     self.stdout.write(f"  📊 {len(events)}개 경기 발견")
 
+                    batch_rows = []
                     for event in events:
                         match_data = self.parse_match_data(event)
 
                         if match_data:
-                            match, created = Match.objects.update_or_create(
-                                match_id=match_data["match_id"], defaults=match_data
-                            )
+                            batch_rows.append(match_data)
 
-                            if created:
-                                total_created += 1
-                                self.stdout.write(f"  ✅ 새 경기 추가: {match}")
-                            else:
-                                total_updated += 1
-                                self.stdout.write(f"  🔄 경기 업데이트: {match}")
+                    # 바뀐 경기만 저장
+                    created, updated, _ = apply_rows(Match, ("match_id",), batch_rows)
+                    total_created += created
+                    total_updated += updated
+                    self.stdout.write(
+                        f"  ✅ 새 경기 {created}개, 🔄 업데이트 {updated}개"
+                    )
+
+                    # 같은 프로세스의 실시간 스트림 구독자에게 상태/점수 변경 전달
+                    live.broker.publish(batch_rows)
 
             except requests.exceptions.RequestException as e:
                 self.stdout.write(self.style.ERROR(f"  ❌ API 호출 실패: {e}"))
@@ -87,6 +94,40 @@ class Command(BaseCommand):
             )
         )
 
+        # 공개 목록 API 스냅샷 갱신
+        snapshot = snapshots.publish("matches")
+        if snapshot:
+            self.stdout.write(f"📦 스냅샷 갱신: {snapshot['version']}")
+
+        # 결과/일정이 바뀌었으면 특성 저장소(바뀐 경기만), 맞대결(바뀐 팀 쌍만),
+        # 레이팅(새로 끝난 경기만), 경기 예측, 예정 라운드 프리뷰, 시즌 시뮬레이션 다시 계산
+        if total_created or total_updated:
+            meta, rebuilt = features.update()
+            self.stdout.write(
+                f"🧮 특성 저장소 갱신: {meta['version']}"
+                + (" (전체 재빌드)" if rebuilt else "")
+            )
+            pairs, rebuilt = matchups.update()
+            self.stdout.write(
+                f"🤝 맞대결 집계 갱신: {pairs}쌍"
+                + (" (전체 재집계)" if rebuilt else "")
+            )
+            rated, rebuilt = ratings.update()
+            if rated:
+                self.stdout.write(
+                    f"📈 레이팅 반영: {rated}경기"
+                    + (" (전체 재계산)" if rebuilt else "")
+                )
+            result = predictions.refit()
+            self.stdout.write(
+                f"🤖 경기 예측 갱신: {result['predictions']}개 ({result['seconds']}초)"
+            )
+            self.stdout.write(f"🗒️ 경기 프리뷰 갱신: {previews.refresh()}개")
+            result = season.refresh()
+            self.stdout.write(
+                f"🎲 시즌 시뮬레이션 갱신: {result['simulations']}회 ({result['seconds']}초)"
+            )
+
     def parse_match_data(self, event):
         """ESPN API 이벤트 데이터를 Match 모델 형식으로 변환"""
         try:
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("matches", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="match",
+            index=models.Index(
+                fields=["updated_at"], name="matches_mat_updated_36c697_idx"
+            ),
+        ),
+    ]
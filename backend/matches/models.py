@@ -59,6 +59,7 @@ class Match(models.Model):
             models.Index(fields=['status']),
             models.Index(fields=['home_team_id']),
             models.Index(fields=['away_team_id']),
+            models.Index(fields=['updated_at']),
         ]
     
     def __str__(self):
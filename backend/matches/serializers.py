@@ -1,13 +1,20 @@
 from rest_framework import serializers
+from config.fieldsets import SparseFieldsetSerializerMixin
 from .models import Match
 
 
-class MatchSerializer(serializers.ModelSerializer):
+class MatchSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """경기 정보 시리얼라이저"""
 
     is_finished = serializers.BooleanField(read_only=True)
     is_live = serializers.BooleanField(read_only=True)
 
+    field_dependencies = {"is_finished": ["status"], "is_live": ["status"]}
+    row_mappers = {
+        "is_finished": lambda status: status == "finished",
+        "is_live": lambda status: status == "live",
+    }
+
     class Meta:
         model = Match
         fields = [
@@ -34,12 +41,18 @@ class MatchSerializer(serializers.ModelSerializer):
         ]
 
 
-class MatchListSerializer(serializers.ModelSerializer):
+class MatchListSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """경기 목록용 간단한 시리얼라이저"""
 
     is_finished = serializers.BooleanField(read_only=True)
     is_live = serializers.BooleanField(read_only=True)
 
+    field_dependencies = {"is_finished": ["status"], "is_live": ["status"]}
+    row_mappers = {
+        "is_finished": lambda status: status == "finished",
+        "is_live": lambda status: status == "live",
+    }
+
     class Meta:
         model = Match
         fields = [
@@ -1 +1,142 @@
-# Create your tests here.
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+
+from config.renderers import FastJSONRenderer
+from config.rows import RowSerializer
+
+from . import live
+from .models import Match
+from .serializers import MatchListSerializer, MatchSerializer
+
+KICKOFF = datetime(2025, 8, 16, 14, 0, tzinfo=UTC)
+
+
+def make_match(match_id, home, away, days=0, **fields):
+    """home / away: (팀 ID, 팀명)"""
+    fields.setdefault("season", "2025")
+    fields.setdefault("matchday", days // 7 + 1)
+    return Match.objects.create(
+        match_id=match_id,
+        match_date=KICKOFF + timedelta(days=days),
+        home_team_id=home[0],
+        home_team_name=home[1],
+        away_team_id=away[0],
+        away_team_name=away[1],
+        **fields,
+    )
+
+
+ARSENAL = ("359", "Arsenal")
+CHELSEA = ("363", "Chelsea")
+LIVERPOOL = ("364", "Liverpool")
+
+
+class RowSerializerTests(TestCase):
+    """values_list() 행 직렬화 / orjson 렌더러가 기존 출력과 같은지"""
+
+    @classmethod
+    def setUpTestData(cls):
+        make_match("1", ARSENAL, CHELSEA, status="finished", home_score=2, away_score=1)
+        make_match("2", LIVERPOOL, ARSENAL, days=7, status="live", venue="Anfield")
+        make_match("3", CHELSEA, LIVERPOOL, days=14)
+
+    def test_rows_match_model_serializer(self):
+        queryset = Match.objects.order_by("match_date")
+        for serializer_class in (MatchSerializer, MatchListSerializer):
+            row_serializer = RowSerializer.for_serializer(serializer_class)
+            rows = row_serializer.to_rows(row_serializer.values_list(queryset))
+            self.assertEqual(rows, serializer_class(queryset, many=True).data)
+
+    def test_rows_with_fields(self):
+        row_serializer = RowSerializer.for_serializer(
+            MatchListSerializer, ["match_id", "is_live"]
+        )
+        rows = row_serializer.to_rows(
+            row_serializer.values_list(Match.objects.order_by("match_date"))
+        )
+        self.assertEqual(rows[1], {"match_id": "2", "is_live": True})
+
+    def test_fast_renderer_output_is_identical(self):
+        data = MatchSerializer(Match.objects.order_by("match_date"), many=True).data
+        data[0]["venue"] = "line\u2028separator"
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_list_endpoint(self):
+        response = self.client.get(
+            "/api/matches/", {"ordering": "-match_date"}, HTTP_HOST="localhost"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row["match_id"] for row in response.json()], ["3", "2", "1"])
+
+
+def parse_frame(frame):
+    lines = dict(line.split(": ", 1) for line in frame.decode().strip().split("\n"))
+    return lines["event"], json.loads(lines["data"])
+
+
+def live_row(match_id, status="live", home=ARSENAL, away=CHELSEA, **scores):
+    return {
+        "match_id": match_id,
+        "home_team_id": home[0],
+        "away_team_id": away[0],
+        "status": status,
+        "home_score": scores.get("home_score", 0),
+        "away_score": scores.get("away_score", 0),
+        "home_half_score": None,
+        "away_half_score": None,
+    }
+
+
+class LiveBrokerTests(SimpleTestCase):
+    """실시간 스트림 브로커 - 바뀐 경기만 구독 팀별로 발행"""
+
+    def setUp(self):
+        self.broker = live.LiveBroker()
+        self.broker._state = {"1": live_row("1"), "2": live_row("2", home=LIVERPOOL)}
+        self.broker._watcher = object()  # DB 폴링 watcher 는 띄우지 않음
+
+    def drain(self, subscription):
+        frames = []
+        while not subscription.queue.empty():
+            frames.append(subscription.queue.get_nowait())
+        return frames
+
+    def test_publish_without_state_is_noop(self):
+        self.assertEqual(live.LiveBroker().publish([live_row("1")]), 0)
+
+    async def test_snapshot_and_changes(self):
+        everyone, snapshot = await self.broker.subscribe()
+        arsenal, arsenal_snapshot = await self.broker.subscribe([ARSENAL[0]])
+        self.assertEqual(len(snapshot), 2)
+        self.assertEqual([row["match_id"] for row in arsenal_snapshot], ["1"])
+
+        published = self.broker.publish(
+            [live_row("1", home_score=1), live_row("2"), live_row("3", home=LIVERPOOL)]
+        )
+        self.assertEqual(published, 2)  # 2번 경기는 그대로
+        await asyncio.sleep(0)
+
+        events = [parse_frame(frame) for frame in self.drain(everyone)]
+        self.assertEqual([data["match_id"] for _, data in events], ["1", "3"])
+        self.assertEqual(events[0][1]["changed"], ["home_score"])
+        self.assertEqual(len(self.drain(arsenal)), 1)
+
+        self.broker.unsubscribe(arsenal)
+        self.broker.unsubscribe(everyone)
+        self.assertFalse(self.broker.has_subscribers())
+
+    @override_settings(LIVE_QUEUE_SIZE=2)
+    async def test_slow_subscriber_is_disconnected(self):
+        subscription, _ = await self.broker.subscribe()
+        for score in range(1, 4):
+            self.broker.publish([live_row("1", home_score=score)])
+        await asyncio.sleep(0)
+        self.assertEqual(self.drain(subscription), [None])
+
+    def test_stream_requires_asgi(self):
+        response = self.client.get("/api/matches/stream/", HTTP_HOST="localhost")
+        self.assertEqual(response.status_code, 501)
@@ -1,10 +1,11 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import MatchViewSet
+from .views import MatchViewSet, live_stream
 
 router = DefaultRouter()
 router.register(r"matches", MatchViewSet, basename="match")
 
 urlpatterns = [
+    path("matches/stream/", live_stream, name="match-stream"),  # SSE (ASGI 전용)
     path("", include(router.urls)),
 ]
@@ -2,19 +2,53 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
+from rest_framework.exceptions import ValidationError
 from django.utils import timezone
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from asgiref.sync import sync_to_async
 from datetime import timedelta
+import asyncio
+from . import live
 from .models import Match
 from .serializers import MatchSerializer, MatchListSerializer
+from teams.models import Team
 from django.core.management import call_command
+from ai_analysis import matchups, previews, store
+from ai_analysis.models import HeadToHead, MatchPrediction
+from config.conditional import ConditionalGetMixin
+from config.fieldsets import SparseFieldsetMixin
+from config.includes import IncludeMixin
+from config.renderers import FAST_RENDERER_CLASSES
+from config import snapshots
+from config.rows import RowSerializerMixin
+from config.snapshots import SnapshotListMixin
+from config.pagination import MatchCursorPagination
 
 
-class MatchViewSet(viewsets.ReadOnlyModelViewSet):
-    """경기 일정 및 결과 ViewSet"""
+class MatchViewSet(
+    SparseFieldsetMixin,
+    IncludeMixin,
+    SnapshotListMixin,
+    ConditionalGetMixin,
+    RowSerializerMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
+    """
+    경기 일정 및 결과 ViewSet
+    - list, by_team: ?cursor, ?page_size 커서 페이지네이션
+    - 모든 목록: ?fields 필드 선택, ?include=predictions 경기별 예측 추가
+    - 라운드별 목록: ?include=preview 경기 프리뷰 추가 (라운드 단위 일괄 생성)
+    """
 
     queryset = Match.objects.all()
     serializer_class = MatchSerializer
     permission_classes = [AllowAny]
+    pagination_class = MatchCursorPagination
+    renderer_classes = FAST_RENDERER_CLASSES
+    snapshot_name = "matches"
+    include_options = ("predictions",)
 
     def get_serializer_class(self):
         """액션에 따라 다른 시리얼라이저 사용"""
@@ -22,6 +56,40 @@ class MatchViewSet(viewsets.ReadOnlyModelViewSet):
             return MatchListSerializer
         return MatchSerializer
 
+    def get_include_options(self):
+        if self.action == "by_matchday":
+            return self.include_options + ("preview",)
+        return super().get_include_options()
+
+    def get_conditional_models(self):
+        if self.action == "head_to_head":
+            return [HeadToHead, Team]
+        if "predictions" in self.get_includes():
+            return [Match, MatchPrediction]
+        return super().get_conditional_models()
+
+    def get_includes(self):
+        includes = super().get_includes()
+        fields = self.get_requested_fields()
+        if includes and fields is not None and "match_id" not in fields:
+            raise ValidationError(
+                {"error": "include 를 쓰려면 fields 에 match_id 가 필요합니다."}
+            )
+        return includes
+
+    def rows_response(self, rows):
+        """목록 행 응답 (?include=predictions 면 행마다 prediction 추가)"""
+        if "predictions" in self.get_includes():
+            store.attach(rows)
+        return Response(rows)
+
+    def list_response(self, queryset):
+        response = super().list_response(queryset)
+        if "predictions" in self.get_includes():
+            data = response.data
+            store.attach(data["results"] if isinstance(data, dict) else data)
+        return response
+
     def list(self, request, *args, **kwargs):
         """경기 목록 조회 (자동 업데이트 포함)"""
         # 데이터 자동 업데이트
@@ -30,12 +98,24 @@ class MatchViewSet(viewsets.ReadOnlyModelViewSet):
 
     def check_and_update_matches(self):
         """경기 데이터 자동 업데이트 (하루에 한 번)"""
+        # 1시간 이내에 만든 스냅샷이 있으면 DB 확인 생략
+        snapshot = snapshots.current("matches")
+        if (
+            snapshot
+            and snapshots.age_seconds(snapshot) < timedelta(hours=1).total_seconds()
+        ):
+            return
+
         try:
             # 가장 최근 업데이트된 경기 확인
-            latest_match = Match.objects.order_by("-updated_at").first()
+            latest_updated_at = (
+                Match.objects.order_by("-updated_at")
+                .values_list("updated_at", flat=True)
+                .first()
+            )
 
-            if latest_match:
-                time_diff = timezone.now() - latest_match.updated_at
+            if latest_updated_at:
+                time_diff = timezone.now() - latest_updated_at
                 # 1시간 이상 지났으면 업데이트
                 if time_diff > timedelta(hours=1):
                     call_command("update_matches")
@@ -49,26 +129,30 @@ class MatchViewSet(viewsets.ReadOnlyModelViewSet):
     def upcoming(self, request):
         """예정된 경기 목록"""
         now = timezone.now()
-        matches = self.queryset.filter(
-            match_date__gte=now, status="scheduled"
-        ).order_by("match_date")[:10]
+        matches = (
+            self.get_queryset()
+            .filter(match_date__gte=now, status="scheduled")
+            .order_by("match_date")[:10]
+        )
 
         serializer = self.get_serializer(matches, many=True)
-        return Response(serializer.data)
+        return self.rows_response(serializer.data)
 
     @action(detail=False, methods=["get"])
     def live(self, request):
         """진행 중인 경기 목록"""
-        matches = self.queryset.filter(status="live")
+        matches = self.get_queryset().filter(status="live")
         serializer = self.get_serializer(matches, many=True)
-        return Response(serializer.data)
+        return self.rows_response(serializer.data)
 
     @action(detail=False, methods=["get"])
     def finished(self, request):
         """종료된 경기 목록"""
-        matches = self.queryset.filter(status="finished").order_by("-match_date")[:20]
+        matches = (
+            self.get_queryset().filter(status="finished").order_by("-match_date")[:20]
+        )
         serializer = self.get_serializer(matches, many=True)
-        return Response(serializer.data)
+        return self.rows_response(serializer.data)
 
     @action(detail=False, methods=["get"])
     def by_date(self, request):
@@ -86,12 +170,14 @@ class MatchViewSet(viewsets.ReadOnlyModelViewSet):
 
             target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
 
-            matches = self.queryset.filter(match_date__date=target_date).order_by(
-                "match_date"
+            matches = (
+                self.get_queryset()
+                .filter(match_date__date=target_date)
+                .order_by("match_date")
             )
 
             serializer = self.get_serializer(matches, many=True)
-            return Response(serializer.data)
+            return self.rows_response(serializer.data)
 
         except ValueError:
             return Response(
@@ -114,17 +200,22 @@ class MatchViewSet(viewsets.ReadOnlyModelViewSet):
         from django.db.models import Q
 
         if team_id:
-            matches = self.queryset.filter(
-                Q(home_team_id=team_id) | Q(away_team_id=team_id)
-            ).order_by("-match_date")
+            matches = (
+                self.get_queryset()
+                .filter(Q(home_team_id=team_id) | Q(away_team_id=team_id))
+                .order_by("-match_date")
+            )
         else:
-            matches = self.queryset.filter(
-                Q(home_team_name__icontains=team_name)
-                | Q(away_team_name__icontains=team_name)
-            ).order_by("-match_date")
+            matches = (
+                self.get_queryset()
+                .filter(
+                    Q(home_team_name__icontains=team_name)
+                    | Q(away_team_name__icontains=team_name)
+                )
+                .order_by("-match_date")
+            )
 
-        serializer = self.get_serializer(matches, many=True)
-        return Response(serializer.data)
+        return self.list_response(matches)
 
     @action(detail=False, methods=["get"])
     def by_matchday(self, request):
@@ -139,9 +230,14 @@ class MatchViewSet(viewsets.ReadOnlyModelViewSet):
 
         try:
             matchday = int(matchday)
-            matches = self.queryset.filter(matchday=matchday).order_by("match_date")
+            matches = (
+                self.get_queryset().filter(matchday=matchday).order_by("match_date")
+            )
             serializer = self.get_serializer(matches, many=True)
-            return Response(serializer.data)
+            rows = serializer.data
+            if "preview" in self.get_includes():
+                previews.attach(rows, matchday)
+            return self.rows_response(rows)
 
         except ValueError:
             return Response(
@@ -149,6 +245,45 @@ class MatchViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+    @action(detail=False, methods=["get"])
+    def head_to_head(self, request):
+        """두 팀 맞대결 기록 (?team1=359&team2=364, team1 기준 승/무/패)"""
+        team_id = request.query_params.get("team1")
+        other_id = request.query_params.get("team2")
+
+        if not team_id or not other_id:
+            return Response(
+                {"error": "team1, team2 파라미터가 필요합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if team_id == other_id:
+            return Response(
+                {"error": "서로 다른 두 팀을 지정해주세요."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        key = matchups.pair_key(team_id, other_id)
+        record = matchups.lookup([key]).get(key)
+        names = matchups.team_names(record, team_id, other_id)
+        if len(names) < 2:
+            return Response(
+                {"error": "팀을 찾을 수 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        def handler(request):
+            return Response(
+                {
+                    "team_id": team_id,
+                    "team_name": names[team_id],
+                    "opponent_id": other_id,
+                    "opponent_name": names[other_id],
+                    **matchups.for_team(record, team_id),
+                }
+            )
+
+        return self.conditional_response(request, handler)
+
     @action(detail=False, methods=["post"])
     def force_update(self, request):
         """강제로 경기 데이터 업데이트"""
@@ -160,3 +295,77 @@ class MatchViewSet(viewsets.ReadOnlyModelViewSet):
                 {"error": f"업데이트 실패: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+
+# ========================================
+# 실시간 경기 스트림 (Server-Sent Events, ASGI 전용)
+# ========================================
+
+
+def _favorite_team_ids(raw_token):
+    """JWT access 토큰 사용자의 응원 팀 ID 목록 (유효하지 않으면 None)"""
+    from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+    from accounts.authentication import (
+        StatelessJWTAuthentication,
+        favorite_team_ids,
+    )
+
+    authentication = StatelessJWTAuthentication()
+    try:
+        user = authentication.get_user(authentication.get_validated_token(raw_token))
+    except (InvalidToken, TokenError):
+        return None
+    return favorite_team_ids(user)
+
+
+async def live_stream(request):
+    """
+    진행 중인 경기 상태/점수 변경 스트림
+    - ?teams=359,364 : 특정 팀 경기만
+    - ?favorites=1&token=<access> : 응원 팀 경기만 (EventSource 는 헤더를 못 보내므로 쿼리로 토큰 전달)
+    """
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse(
+            {"error": "실시간 스트림은 ASGI 서버에서만 지원합니다."}, status=501
+        )
+
+    team_ids = None
+    if request.GET.get("teams"):
+        team_ids = [t for t in request.GET["teams"].split(",") if t.strip()]
+    elif request.GET.get("favorites"):
+        raw_token = request.GET.get("token", "")
+        header = request.headers.get("Authorization", "")
+        if header.startswith("Bearer "):
+            raw_token = header[len("Bearer ") :]
+
+        team_ids = await sync_to_async(_favorite_team_ids)(raw_token)
+        if team_ids is None:
+            return JsonResponse({"error": "인증이 필요합니다."}, status=401)
+        if not team_ids:
+            return JsonResponse({"error": "응원 팀이 없습니다."}, status=400)
+
+    subscription, live_matches = await live.broker.subscribe(team_ids)
+
+    async def events():
+        try:
+            yield f"retry: {settings.LIVE_RETRY_MS}\n\n".encode()
+            yield live.encode("snapshot", live_matches)
+            while True:
+                try:
+                    frame = await asyncio.wait_for(
+                        subscription.queue.get(), settings.LIVE_HEARTBEAT_INTERVAL
+                    )
+                except TimeoutError:
+                    yield b": ping\n\n"
+                    continue
+                if frame is None:
+                    return
+                yield frame
+        finally:
+            live.broker.unsubscribe(subscription)
+
+    response = StreamingHttpResponse(events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # nginx 버퍼링 끄기
+    return response
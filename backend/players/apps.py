@@ -1,6 +1,16 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class PlayersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "players"
+
+    def ready(self):
+        from config import snapshots
+
+        from .models import Player
+
+        # 관리자 화면 등 개별 저장/삭제 → 목록 스냅샷 무효화
+        post_save.connect(snapshots.model_changed, sender=Player)
+        post_delete.connect(snapshots.model_changed, sender=Player)
@@ -0,0 +1,48 @@
+"""
+선수 신체 정보/등번호 표시 문자열 → 숫자 (load_players 에서 사용, 0006 마이그레이션에는 사본)
+    6' 2"   → 188 (cm)      1.88 m / 188 cm 도 지원
+    194 lbs → 88 (kg)       88 kg 도 지원
+    "10"    → 10
+값이 없거나 형식을 알 수 없으면 None
+"""
+
+import re
+
+FEET_INCHES = re.compile(r"(\d+)\s*'\s*(\d+(?:\.\d+)?)?")
+NUMBER = re.compile(r"\d+(?:\.\d+)?")
+
+
+def parse_height_cm(value):
+    value = (value or "").strip().lower()
+    match = FEET_INCHES.match(value)
+    if match:
+        inches = int(match.group(1)) * 12 + float(match.group(2) or 0)
+        return round(inches * 2.54)
+
+    number = NUMBER.match(value)
+    if number is None:
+        return None
+    amount = float(number.group())
+    if value.endswith("cm"):
+        return round(amount)
+    if value.endswith("m"):
+        return round(amount * 100)
+    return None
+
+
+def parse_weight_kg(value):
+    value = (value or "").strip().lower()
+    number = NUMBER.match(value)
+    if number is None:
+        return None
+    amount = float(number.group())
+    if value.endswith(("lbs", "lb")):
+        return round(amount * 0.45359237)
+    if value.endswith("kg"):
+        return round(amount)
+    return None
+
+
+def parse_jersey_number(value):
+    value = (value or "").strip()
+    return int(value) if value.isdigit() else None
@@ -0,0 +1,33 @@
+import django_filters
+
+from .models import Player
+
+
+class PlayerFilter(django_filters.FilterSet):
+    """
+    선수 목록 범위 필터 (모두 인덱스 컬럼 - SQL 에서 처리)
+    ?height_cm_min=190&position=Defender
+    ?weight_kg_min=70&weight_kg_max=80
+    ?birth_date_after=2000-01-01&birth_date_before=2004-12-31
+    ?jersey_no=7
+    ?nationality=England&team=Arsenal
+    """
+
+    height_cm = django_filters.RangeFilter()
+    weight_kg = django_filters.RangeFilter()
+    birth_date = django_filters.DateFromToRangeFilter()
+    jersey_no = django_filters.NumberFilter()
+    position = django_filters.CharFilter(lookup_expr="iexact")
+    nationality = django_filters.CharFilter(lookup_expr="iexact")
+    team = django_filters.CharFilter(field_name="team_name", lookup_expr="iexact")
+
+    class Meta:
+        model = Player
+        fields = [
+            "height_cm",
+            "weight_kg",
+            "birth_date",
+            "jersey_no",
+            "position",
+            "nationality",
+        ]
@@ -3,7 +3,12 @@ import json
 from pathlib import Path
 from django.core.management.base import BaseCommand
 from django.conf import settings
-from players.models import Player
+from django.utils import timezone
+from ai_analysis import similarity
+from config import search, snapshots
+from players.attributes import parse_height_cm, parse_jersey_number, parse_weight_kg
+from players.models import Player, PlayerProfile
+from sync.changes import apply_rows
 
 
 class Command(BaseCommand):
@@ -62,9 +67,9 @@ class Command(BaseCommand):
             self.style.SUCCESS(f"Loaded {len(profiles_data)} player profiles")
         )
 
-        # 데이터베이스에 저장
-        created_count = 0
-        updated_count = 0
+        # 데이터베이스에 저장 (바뀐 선수만)
+        rows = []
+        profiles = {}
 
         for player_id, csv_data in players_data.items():
             profile_data = profiles_data.get(player_id, {})
@@ -78,6 +83,7 @@ class Command(BaseCommand):
                 birth_date = None
 
             player_defaults = {
+                "player_id": player_id,
                 "name": csv_data.get("name", ""),
                 "full_name": csv_data.get("full_name", ""),
                 "first_name": csv_data.get("first_name", ""),
@@ -86,9 +92,12 @@ class Command(BaseCommand):
                 "position": csv_data.get("position", ""),
                 "position_abbr": csv_data.get("position_abbr", ""),
                 "jersey_number": csv_data.get("jersey_number", ""),
+                "jersey_no": parse_jersey_number(csv_data.get("jersey_number")),
                 "age": int(csv_data["age"]) if csv_data.get("age") else None,
                 "height": csv_data.get("height", ""),
                 "weight": csv_data.get("weight", ""),
+                "height_cm": parse_height_cm(csv_data.get("height")),
+                "weight_kg": parse_weight_kg(csv_data.get("weight")),
                 "birth_place": csv_data.get("birth_place", ""),
                 "birth_date": birth_date,
                 "nationality": csv_data.get("nationality", ""),
@@ -96,25 +105,64 @@ class Command(BaseCommand):
                 "team_name": csv_data.get("team_name", ""),
                 "wiki_url": profile_data.get("wiki_url") or "",
                 "wiki_found": profile_data.get("wiki_found", False),
+            }
+
+            rows.append(player_defaults)
+            profiles[player_id] = {
                 "introduction": profile_data.get("introduction") or "",
                 "playing_style": profile_data.get("playing_style") or "",
                 "career_summary": profile_data.get("career_summary") or "",
             }
 
-            player, created = Player.objects.update_or_create(
-                player_id=player_id, defaults=player_defaults
-            )
-
-            if created:
-                created_count += 1
-            else:
-                updated_count += 1
+        created_count, updated_count, _ = apply_rows(Player, ("player_id",), rows)
+        profile_count = self.save_profiles(profiles)
 
         self.stdout.write(
             self.style.SUCCESS(
                 f"\nSuccessfully loaded players!\n"
                 f"Created: {created_count}\n"
                 f"Updated: {updated_count}\n"
+                f"Unchanged: {len(rows) - created_count - updated_count}\n"
+                f"Profiles saved: {profile_count}\n"
                 f"Total: {Player.objects.count()}"
             )
         )
+
+        # 검색 인덱스 재구성
+        if search.rebuild("players"):
+            self.stdout.write("Search index rebuilt: players")
+
+        # 비슷한 선수 인덱스 재구성
+        index = similarity.rebuild()
+        self.stdout.write(f"Similarity index rebuilt: {len(index.player_ids)} players")
+
+        # 공개 목록 API 스냅샷 갱신
+        snapshot = snapshots.publish("players")
+        if snapshot:
+            self.stdout.write(f"Snapshot published: players ({snapshot['version']})")
+
+    def save_profiles(self, profiles):
+        """선수 소개글(PlayerProfile) 저장 - 새 선수/바뀐 소개글만, 저장한 수 반환"""
+        fields = ["introduction", "playing_style", "career_summary"]
+        pks = dict(Player.objects.values_list("player_id", "pk"))
+        existing = {
+            row["player_id"]: row
+            for row in PlayerProfile.objects.values("player_id", *fields)
+        }
+
+        to_create = []
+        to_update = []
+        for player_id, values in profiles.items():
+            profile = PlayerProfile(player_id=pks[player_id], **values)
+            current = existing.get(profile.player_id)
+            if current is None:
+                to_create.append(profile)
+            elif any(current[field] != values[field] for field in fields):
+                profile.updated_at = timezone.now()
+                to_update.append(profile)
+
+        PlayerProfile.objects.bulk_create(to_create, batch_size=500)
+        PlayerProfile.objects.bulk_update(
+            to_update, [*fields, "updated_at"], batch_size=500
+        )
+        return len(to_create) + len(to_update)
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("players", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="player",
+            index=models.Index(fields=["name"], name="players_pla_name_f5b1bf_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="player",
+            index=models.Index(
+                fields=["team_name"], name="players_pla_team_na_d53168_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# 전문 검색 인덱스 (config/search.py) - SQLite FTS5 / PostgreSQL tsvector
+
+from django.db import migrations
+
+from config.search import INDEXES
+
+
+def create_index(apps, schema_editor):
+    INDEXES["players"].create(schema_editor)
+
+
+def drop_index(apps, schema_editor):
+    INDEXES["players"].drop(schema_editor)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("players", "0003_updated_at_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
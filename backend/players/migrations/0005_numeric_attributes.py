@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("players", "0004_player_search_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="player",
+            name="height_cm",
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="player",
+            name="jersey_no",
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="player",
+            name="weight_kg",
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="player",
+            index=models.Index(
+                fields=["height_cm"], name="players_pla_height__c4ae99_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="player",
+            index=models.Index(
+                fields=["weight_kg"], name="players_pla_weight__fb76a4_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="player",
+            index=models.Index(
+                fields=["jersey_no"], name="players_pla_jersey__b79120_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="player",
+            index=models.Index(
+                fields=["birth_date"], name="players_pla_birth_d_354cf8_idx"
+            ),
+        ),
+    ]
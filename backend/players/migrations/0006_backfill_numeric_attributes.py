@@ -0,0 +1,67 @@
+# 기존 선수 행의 height/weight/jersey_number 문자열 → 숫자 컬럼
+# 변환 함수는 players/attributes.py 의 마이그레이션 시점 사본 (앱 코드가 바뀌어도 그대로)
+
+import re
+
+from django.db import migrations
+
+FEET_INCHES = re.compile(r"(\d+)\s*'\s*(\d+(?:\.\d+)?)?")
+NUMBER = re.compile(r"\d+(?:\.\d+)?")
+
+
+def parse_height_cm(value):
+    value = (value or "").strip().lower()
+    match = FEET_INCHES.match(value)
+    if match:
+        inches = int(match.group(1)) * 12 + float(match.group(2) or 0)
+        return round(inches * 2.54)
+
+    number = NUMBER.match(value)
+    if number is None:
+        return None
+    amount = float(number.group())
+    if value.endswith("cm"):
+        return round(amount)
+    if value.endswith("m"):
+        return round(amount * 100)
+    return None
+
+
+def parse_weight_kg(value):
+    value = (value or "").strip().lower()
+    number = NUMBER.match(value)
+    if number is None:
+        return None
+    amount = float(number.group())
+    if value.endswith(("lbs", "lb")):
+        return round(amount * 0.45359237)
+    if value.endswith("kg"):
+        return round(amount)
+    return None
+
+
+def parse_jersey_number(value):
+    value = (value or "").strip()
+    return int(value) if value.isdigit() else None
+
+
+def backfill(apps, schema_editor):
+    Player = apps.get_model("players", "Player")
+    players = list(Player.objects.only("pk", "height", "weight", "jersey_number"))
+    for player in players:
+        player.height_cm = parse_height_cm(player.height)
+        player.weight_kg = parse_weight_kg(player.weight)
+        player.jersey_no = parse_jersey_number(player.jersey_number)
+    Player.objects.bulk_update(
+        players, ["height_cm", "weight_kg", "jersey_no"], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("players", "0005_numeric_attributes"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
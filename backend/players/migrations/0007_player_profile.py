@@ -0,0 +1,82 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:00
+# 긴 소개글 컬럼을 PlayerProfile 로 옮김 (컬럼 삭제는 0008)
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def copy_profiles(apps, schema_editor):
+    Player = apps.get_model("players", "Player")
+    PlayerProfile = apps.get_model("players", "PlayerProfile")
+    rows = Player.objects.values_list(
+        "pk", "introduction", "playing_style", "career_summary"
+    )
+    PlayerProfile.objects.bulk_create(
+        [
+            PlayerProfile(
+                player_id=pk,
+                introduction=introduction,
+                playing_style=playing_style,
+                career_summary=career_summary,
+            )
+            for pk, introduction, playing_style, career_summary in rows
+        ],
+        batch_size=500,
+    )
+
+
+def copy_back(apps, schema_editor):
+    Player = apps.get_model("players", "Player")
+    PlayerProfile = apps.get_model("players", "PlayerProfile")
+    players = []
+    for profile in PlayerProfile.objects.all():
+        players.append(
+            Player(
+                pk=profile.player_id,
+                introduction=profile.introduction,
+                playing_style=profile.playing_style,
+                career_summary=profile.career_summary,
+            )
+        )
+    Player.objects.bulk_update(
+        players, ["introduction", "playing_style", "career_summary"], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("players", "0006_backfill_numeric_attributes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PlayerProfile",
+            fields=[
+                (
+                    "player",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="profile",
+                        serialize=False,
+                        to="players.player",
+                    ),
+                ),
+                ("introduction", models.TextField(blank=True)),
+                ("playing_style", models.TextField(blank=True)),
+                ("career_summary", models.TextField(blank=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Player profile",
+                "verbose_name_plural": "Player profiles",
+                "indexes": [
+                    models.Index(
+                        fields=["updated_at"], name="players_pla_updated_9a97f4_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(copy_profiles, copy_back),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("players", "0007_player_profile"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="player",
+            name="career_summary",
+        ),
+        migrations.RemoveField(
+            model_name="player",
+            name="introduction",
+        ),
+        migrations.RemoveField(
+            model_name="player",
+            name="playing_style",
+        ),
+    ]
@@ -18,12 +18,17 @@ class Player(models.Model):
     position = models.CharField(max_length=50)
     position_abbr = models.CharField(max_length=10)
     jersey_number = models.CharField(max_length=10, blank=True)
+    jersey_no = models.PositiveSmallIntegerField(null=True, blank=True)  # 숫자 등번호
 
     # 신체 정보
     age = models.IntegerField(null=True, blank=True)
     height = models.CharField(max_length=20, blank=True)
     weight = models.CharField(max_length=20, blank=True)
 
+    # 신체 정보 (숫자, 범위 필터/정렬용 - players/attributes.py 로 변환)
+    height_cm = models.PositiveSmallIntegerField(null=True, blank=True)
+    weight_kg = models.PositiveSmallIntegerField(null=True, blank=True)
+
     # 출생 정보
     birth_place = models.CharField(max_length=200, blank=True)
     birth_date = models.DateTimeField(null=True, blank=True)
@@ -33,11 +38,6 @@ class Player(models.Model):
     team_id = models.CharField(max_length=50, blank=True)
     team_name = models.CharField(max_length=200, blank=True)
 
-    # 추가 정보 (JSON 데이터용)
-    introduction = models.TextField(blank=True)
-    playing_style = models.TextField(blank=True)
-    career_summary = models.TextField(blank=True)
-
     # 타임스탬프
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -46,6 +46,42 @@ class Player(models.Model):
         ordering = ["name"]
         verbose_name = "Player"
         verbose_name_plural = "Players"
+        indexes = [
+            models.Index(fields=["name"]),
+            models.Index(fields=["team_name"]),
+            models.Index(fields=["updated_at"]),
+            models.Index(fields=["height_cm"]),
+            models.Index(fields=["weight_kg"]),
+            models.Index(fields=["jersey_no"]),
+            models.Index(fields=["birth_date"]),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.team_name})"
+
+
+class PlayerProfile(models.Model):
+    """
+    선수 위키 소개글 (긴 텍스트라 Player 행과 분리 - 상세 조회에서만 읽음)
+    """
+
+    player = models.OneToOneField(
+        Player, on_delete=models.CASCADE, primary_key=True, related_name="profile"
+    )
+    introduction = models.TextField(blank=True)
+    playing_style = models.TextField(blank=True)
+    career_summary = models.TextField(blank=True)
+
+    # 타임스탬프
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Player profile"
+        verbose_name_plural = "Player profiles"
+        indexes = [
+            models.Index(fields=["updated_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.player.player_id} profile"
@@ -1,8 +1,9 @@
 from rest_framework import serializers
+from config.fieldsets import SparseFieldsetSerializerMixin
 from .models import Player
 
 
-class PlayerSerializer(serializers.ModelSerializer):
+class PlayerSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Player
         fields = [
@@ -16,6 +17,8 @@ class PlayerSerializer(serializers.ModelSerializer):
             "age",
             "height",
             "weight",
+            "height_cm",
+            "weight_kg",
             "nationality",
             "team_id",
             "team_name",
@@ -24,8 +27,45 @@ class PlayerSerializer(serializers.ModelSerializer):
 
 
 class PlayerDetailSerializer(serializers.ModelSerializer):
-    """선수 상세 정보용 시리얼라이저"""
+    """선수 상세 정보용 시리얼라이저 (소개글은 PlayerProfile 에서 - 응답 키는 그대로)"""
+
+    introduction = serializers.CharField(source="profile.introduction", read_only=True)
+    playing_style = serializers.CharField(
+        source="profile.playing_style", read_only=True
+    )
+    career_summary = serializers.CharField(
+        source="profile.career_summary", read_only=True
+    )
 
     class Meta:
         model = Player
-        fields = "__all__"
+        fields = [
+            "id",
+            "player_id",
+            "name",
+            "full_name",
+            "first_name",
+            "last_name",
+            "wiki_name",
+            "wiki_url",
+            "wiki_found",
+            "position",
+            "position_abbr",
+            "jersey_number",
+            "jersey_no",
+            "age",
+            "height",
+            "weight",
+            "height_cm",
+            "weight_kg",
+            "birth_place",
+            "birth_date",
+            "nationality",
+            "team_id",
+            "team_name",
+            "introduction",
+            "playing_style",
+            "career_summary",
+            "created_at",
+            "updated_at",
+        ]
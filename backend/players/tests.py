@@ -1 +1,514 @@
-# Create your tests here.
+import gzip
+from importlib import import_module
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from ai_analysis import similarity
+from config import search
+from config.autocomplete import PrefixIndex, autocomplete_index, normalize
+from config.middleware import choose_encoding, parse_accept_encoding
+from teams.models import Team
+
+from .attributes import parse_height_cm, parse_jersey_number, parse_weight_kg
+from .models import Player, PlayerProfile
+
+
+def make_player(player_id, name, **fields):
+    fields.setdefault("position", "Forward")
+    fields.setdefault("position_abbr", "F")
+    fields.setdefault("team_name", "Arsenal")
+    return Player.objects.create(player_id=player_id, name=name, **fields)
+
+
+class PlayerPaginationTests(TestCase):
+    """?cursor / ?page_size 커서 페이지네이션, ?fields 희소 필드셋"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(5):
+            make_player(f"p{i}", f"Player {i}", height_cm=180 + i if i else None)
+
+    def get(self, path, **params):
+        return self.client.get(path, params, HTTP_HOST="localhost")
+
+    def test_unpaginated_by_default(self):
+        response = self.get("/api/players/", ordering="name")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 5)
+
+    def test_cursor_walks_all_rows(self):
+        response = self.get("/api/players/", page_size=2)
+        data = response.json()
+        names = [row["name"] for row in data["results"]]
+        while data["next"]:
+            data = self.client.get(data["next"], HTTP_HOST="localhost").json()
+            names += [row["name"] for row in data["results"]]
+        self.assertEqual(names, [f"Player {i}" for i in range(5)])
+
+    def test_nullable_ordering_with_cursor_is_rejected(self):
+        response = self.get("/api/players/", page_size=2, ordering="height_cm")
+        self.assertEqual(response.status_code, 400)
+
+    def test_fields_limits_keys(self):
+        response = self.get("/api/players/", fields="name,team_name", ordering="name")
+        self.assertEqual(
+            response.json()[0], {"name": "Player 0", "team_name": "Arsenal"}
+        )
+
+    def test_unknown_field_is_rejected(self):
+        response = self.get("/api/players/", fields="name,salary")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("salary", response.json()["error"])
+
+
+class ConditionalGetTests(TestCase):
+    """ETag / Last-Modified → 304"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.player = make_player("p1", "Bukayo Saka")
+
+    def get(self, path, **headers):
+        return self.client.get(path, HTTP_HOST="localhost", **headers)
+
+    def test_list_not_modified(self):
+        response = self.get("/api/players/")
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        response = self.get("/api/players/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+        response = self.get(
+            "/api/players/", HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_etag_changes_with_data(self):
+        etag = self.get("/api/players/")["ETag"]
+        make_player("p2", "Declan Rice")
+        response = self.get("/api/players/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_etag_depends_on_url(self):
+        etag = self.get("/api/players/")["ETag"]
+        response = self.get("/api/players/?fields=name", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_retrieve_not_modified(self):
+        path = f"/api/players/{self.player.pk}/"
+        etag = self.get(path)["ETag"]
+        self.assertEqual(self.get(path, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_missing_object_is_404_not_304(self):
+        etag = self.get(f"/api/players/{self.player.pk}/")["ETag"]
+        response = self.get("/api/players/999999/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 404)
+
+
+class CompressionTests(TestCase):
+    """Accept-Encoding 협상 gzip 압축 (COMPRESSION_MIN_SIZE 이상 JSON 만)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(40):
+            make_player(f"p{i}", f"Player {i:02d}", nationality="England")
+
+    def get(self, path="/api/players/?ordering=name", **headers):
+        return self.client.get(path, HTTP_HOST="localhost", **headers)
+
+    def test_gzip_body_matches_plain(self):
+        plain = self.get()
+        response = self.get(HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+        self.assertTrue(response["ETag"].startswith("W/"))
+
+    def test_identity_without_accept_encoding(self):
+        response = self.get()
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+    def test_refused_encoding(self):
+        response = self.get(HTTP_ACCEPT_ENCODING="gzip;q=0, identity")
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    @override_settings(COMPRESSION_MIN_SIZE=10**6)
+    def test_small_response_not_compressed(self):
+        response = self.get(HTTP_ACCEPT_ENCODING="gzip")
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_parse_accept_encoding(self):
+        self.assertEqual(
+            parse_accept_encoding("gzip;q=0.5, br , *;q=bad"),
+            {"gzip": 0.5, "br": 1.0, "*": 0.0},
+        )
+        self.assertIsNone(choose_encoding("identity"))
+        self.assertEqual(choose_encoding("*"), choose_encoding("gzip, br"))
+
+
+class SearchTests(TestCase):
+    """선수 검색 인덱스 (?q 관련도순, 컬럼별 접두어 검색)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        make_player("1", "Bukayo Saka", nationality="England")
+        make_player("2", "Raúl Jiménez", team_name="Fulham", nationality="Mexico")
+        rice = make_player("3", "Declan Rice", position="Midfielder")
+        make_player("4", "Cole Palmer", team_name="Chelsea", nationality="England")
+        PlayerProfile.objects.create(player=rice, introduction="Saka's best friend")
+        search.rebuild("players")
+
+    def search(self, **params):
+        return self.client.get(
+            "/api/players/search/", params, HTTP_HOST="localhost"
+        ).json()
+
+    def names(self, rows):
+        return [row["name"] for row in rows]
+
+    def test_ranked_by_relevance(self):
+        # 이름 일치가 소개글 일치보다 앞
+        data = self.search(q="saka")
+        self.assertEqual(self.names(data["results"]), ["Bukayo Saka", "Declan Rice"])
+        self.assertEqual(data["count"], 2)
+
+    def test_prefix_and_accents(self):
+        self.assertEqual(self.names(self.search(q="buk")["results"]), ["Bukayo Saka"])
+        self.assertEqual(
+            self.names(self.search(q="jimenez")["results"]), ["Raúl Jiménez"]
+        )
+
+    def test_column_filters(self):
+        rows = self.search(team="arse", nationality="eng")
+        self.assertEqual(self.names(rows), ["Bukayo Saka"])
+        rows = self.search(q="england", team="chelsea")["results"]
+        self.assertEqual(self.names(rows), ["Cole Palmer"])
+
+    def test_ranked_pagination(self):
+        data = self.search(q="england", page_size=1)
+        self.assertEqual(data["count"], 2)
+        self.assertEqual(len(data["results"]), 1)
+        self.assertIsNotNone(data["next"])
+
+    def test_query_syntax_is_ignored(self):
+        self.assertEqual(self.search(q='"* OR (')["results"], [])
+        self.assertEqual(
+            self.names(self.search(q='saka*"')["results"])[0], "Bukayo Saka"
+        )
+
+    def test_list_search_param(self):
+        response = self.client.get(
+            "/api/players/", {"search": "rice"}, HTTP_HOST="localhost"
+        )
+        self.assertEqual(self.names(response.json()), ["Declan Rice"])
+
+
+class PrefixIndexTests(SimpleTestCase):
+    """자동완성 접두어 인덱스 (DB 조회 없음)"""
+
+    def setUp(self):
+        self.index = PrefixIndex(
+            [
+                ("player", {"id": "1", "name": "Bukayo Saka"}, ["Bukayo Saka"]),
+                ("player", {"id": "2", "name": "Martin Ødegaard"}, ["Martin Ødegaard"]),
+                ("player", {"id": "3", "name": "Sakura"}, ["Sakura", None]),
+                ("team", {"id": "359", "name": "Arsenal"}, ["Arsenal"]),
+            ]
+        )
+
+    def ids(self, query, **kwargs):
+        return [item["id"] for item in self.index.search(query, **kwargs)]
+
+    def test_normalize(self):
+        self.assertEqual(normalize("  Martin  ØDEGAARD-Jr. "), "martin odegaard jr")
+
+    def test_name_prefix_before_word_prefix(self):
+        self.assertEqual(self.ids("sak"), ["3", "1"])
+        self.assertEqual(self.ids("ode"), ["2"])
+
+    def test_limit_and_types(self):
+        self.assertEqual(self.ids("sak", limit=1), ["3"])
+        self.assertEqual(self.ids("a", types={"team"}), ["359"])
+        self.assertEqual(self.ids("!!"), [])
+
+
+class AutocompleteEndpointTests(TestCase):
+    """GET /api/autocomplete/"""
+
+    @classmethod
+    def setUpTestData(cls):
+        make_player("1", "Bukayo Saka")
+        Team.objects.create(team_id="359", team_name="Arsenal")
+
+    def setUp(self):
+        autocomplete_index.index = None
+
+    def get(self, **params):
+        return self.client.get("/api/autocomplete/", params, HTTP_HOST="localhost")
+
+    def test_results(self):
+        data = self.get(q="ars").json()
+        self.assertEqual(
+            data["results"], [{"type": "team", "id": "359", "name": "Arsenal"}]
+        )
+        self.assertEqual(
+            self.get(q="sa", types="player").json()["results"][0]["id"], "1"
+        )
+
+    @override_settings(AUTOCOMPLETE_CHECK_INTERVAL=0)
+    def test_rebuilt_when_data_changes(self):
+        self.assertEqual(self.get(q="rice").json()["results"], [])
+        make_player("2", "Declan Rice")
+        self.assertEqual(len(self.get(q="rice").json()["results"]), 1)
+
+    def test_invalid_parameters(self):
+        self.assertEqual(self.get(q="a", limit="ten").status_code, 400)
+        self.assertEqual(self.get(q="a", types="player,coach").status_code, 400)
+
+
+class AttributeParserTests(SimpleTestCase):
+    """신체 정보/등번호 문자열 → 숫자"""
+
+    def test_height(self):
+        for value, expected in [
+            ("6' 2\"", 188),
+            ("5'11\"", 180),
+            ("6'", 183),
+            ("1.88 m", 188),
+            ("188 cm", 188),
+            ("188", None),
+            ("", None),
+            (None, None),
+        ]:
+            with self.subTest(value=value):
+                self.assertEqual(parse_height_cm(value), expected)
+
+    def test_weight_and_jersey(self):
+        self.assertEqual(parse_weight_kg("194 lbs"), 88)
+        self.assertEqual(parse_weight_kg("88 kg"), 88)
+        self.assertIsNone(parse_weight_kg("heavy"))
+        self.assertEqual(parse_jersey_number(" 7 "), 7)
+        self.assertIsNone(parse_jersey_number("7a"))
+
+    def test_backfill_migration_copy(self):
+        # 0006 마이그레이션의 사본이 현재 변환 함수와 같은 결과인지
+        migration = import_module("players.migrations.0006_backfill_numeric_attributes")
+        for value in ["6' 2\"", "1.88 m", "194 lbs", "88 kg", "10", ""]:
+            with self.subTest(value=value):
+                self.assertEqual(
+                    migration.parse_height_cm(value), parse_height_cm(value)
+                )
+                self.assertEqual(
+                    migration.parse_weight_kg(value), parse_weight_kg(value)
+                )
+                self.assertEqual(
+                    migration.parse_jersey_number(value), parse_jersey_number(value)
+                )
+
+
+class RangeFilterTests(TestCase):
+    """?height_cm_min / ?weight_kg_max / ?birth_date_after 범위 필터와 숫자 정렬"""
+
+    @classmethod
+    def setUpTestData(cls):
+        make_player("1", "Tall", height_cm=195, weight_kg=90, jersey_no=4)
+        make_player("2", "Mid", height_cm=183, weight_kg=78, jersey_no=7)
+        make_player("3", "Short", height_cm=170, weight_kg=65, jersey_no=10)
+        make_player("4", "Unknown", position="Defender")
+
+    def names(self, **params):
+        response = self.client.get("/api/players/", params, HTTP_HOST="localhost")
+        self.assertEqual(response.status_code, 200, response.content)
+        return [row["name"] for row in response.json()]
+
+    def test_ranges(self):
+        self.assertEqual(self.names(height_cm_min=180), ["Mid", "Tall"])
+        self.assertEqual(self.names(weight_kg_min=70, weight_kg_max=80), ["Mid"])
+        self.assertEqual(self.names(jersey_no=10), ["Short"])
+        self.assertEqual(self.names(position="defender"), ["Unknown"])
+
+    def test_numeric_ordering(self):
+        self.assertEqual(
+            self.names(ordering="-height_cm", height_cm_min=1), ["Tall", "Mid", "Short"]
+        )
+
+    def test_invalid_range(self):
+        response = self.client.get(
+            "/api/players/", {"height_cm_min": "tall"}, HTTP_HOST="localhost"
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class FacetTests(TestCase):
+    """GET /api/players/facets/ - 목록과 같은 필터를 적용한 항목별 개수"""
+
+    @classmethod
+    def setUpTestData(cls):
+        make_player("1", "Saka", nationality="England")
+        make_player("2", "Rice", nationality="England", position="Midfielder")
+        make_player("3", "Ødegaard", nationality="Norway", position="Midfielder")
+        make_player("4", "Palmer", nationality="England", team_name="Chelsea")
+        make_player("5", "Nobody", nationality="")
+
+    def get(self, **params):
+        return self.client.get("/api/players/facets/", params, HTTP_HOST="localhost")
+
+    def test_counts(self):
+        data = self.get().json()
+        self.assertEqual(data["total"], 5)
+        self.assertEqual(
+            data["facets"]["nationality"],
+            [{"value": "England", "count": 3}, {"value": "Norway", "count": 1}],
+        )
+        self.assertEqual(data["facets"]["team"][0], {"value": "Arsenal", "count": 4})
+
+    def test_filters_apply(self):
+        data = self.get(position="Midfielder", facets="nationality").json()
+        self.assertEqual(data["total"], 2)
+        self.assertEqual(list(data["facets"]), ["nationality"])
+        self.assertEqual(len(data["facets"]["nationality"]), 2)
+
+    def test_cache_follows_data_version(self):
+        self.assertEqual(self.get(facets="team").json()["total"], 5)
+        make_player("6", "Havertz")
+        self.assertEqual(self.get(facets="team").json()["total"], 6)
+
+    def test_unknown_facet(self):
+        self.assertEqual(self.get(facets="salary").status_code, 400)
+
+
+class PlayerProfileTests(TestCase):
+    """소개글은 PlayerProfile 테이블 - 상세 조회에서만 JOIN"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.saka = make_player("p7", "Bukayo Saka")
+        cls.rice = make_player("p41", "Declan Rice")
+        PlayerProfile.objects.create(
+            player=cls.saka, introduction="Winger", playing_style="Direct"
+        )
+
+    def get(self, path):
+        return self.client.get(path, HTTP_HOST="localhost")
+
+    def test_detail_includes_profile(self):
+        data = self.get(f"/api/players/{self.saka.pk}/").json()
+        self.assertEqual(data["introduction"], "Winger")
+        self.assertEqual(data["playing_style"], "Direct")
+
+    def test_detail_without_profile(self):
+        response = self.get(f"/api/players/{self.rice.pk}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.json()["introduction"])
+
+    def test_list_does_not_read_profiles(self):
+        with CaptureQueriesContext(connection) as queries:
+            rows = self.get("/api/players/?ordering=name").json()
+        self.assertNotIn("introduction", rows[0])
+        self.assertFalse(
+            any("players_playerprofile" in query["sql"] for query in queries)
+        )
+
+    def test_str(self):
+        self.assertEqual(str(self.saka.profile), "p7 profile")
+
+
+class SimilarityTests(TestCase):
+    """비슷한 선수 - 숫자 속성 + 포지션/국적 + 소개글 TF-IDF 코사인 유사도"""
+
+    # 선수 ID: (포지션, 국적, 나이, 키, 몸무게, 소개글)
+    PLAYERS = {
+        "s1": ("Forward", "England", 25, 185, 80, "clinical striker poacher"),
+        "s2": ("Forward", "England", 26, 186, 81, "clinical striker poacher"),
+        "g1": ("Goalkeeper", "Brazil", 33, 195, 90, "shot stopper"),
+        "d1": ("Defender", "England", 30, 190, 85, "aerial tackling"),
+        "w1": ("Forward", "Spain", 22, 175, 70, "dribbling pace"),
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.players = {}
+        for player_id, row in cls.PLAYERS.items():
+            position, nationality, age, height, weight, introduction = row
+            player = make_player(
+                player_id,
+                player_id.upper(),
+                position=position,
+                nationality=nationality,
+                age=age,
+                height_cm=height,
+                weight_kg=weight,
+            )
+            PlayerProfile.objects.create(player=player, introduction=introduction)
+            cls.players[player_id] = player
+
+    def setUp(self):
+        similarity._loaded.clear()  # 테스트마다 인덱스 파일 경로가 다름
+
+    def get(self, player_id, **params):
+        path = f"/api/players/{self.players[player_id].pk}/similar/"
+        return self.client.get(path, params, HTTP_HOST="localhost")
+
+    def test_tfidf(self):
+        matrix, terms = similarity.tfidf(
+            ["the clinical striker", "clinical striker", "keeper", "winger"], 10
+        )
+        # 2개 이상, 절반 이하 문서에 나오는 단어만 (불용어 제외)
+        self.assertEqual(terms.tolist(), ["clinical", "striker"])
+        self.assertEqual(matrix.shape, (4, 2))
+        self.assertAlmostEqual(float(matrix[0] @ matrix[1]), 1.0, places=5)
+        self.assertFalse(matrix[2].any())
+
+    def test_nearest(self):
+        index = similarity.rebuild()
+        neighbours = similarity.nearest(index, "s1", k=10)
+        self.assertEqual(len(neighbours), 4)
+        self.assertEqual(neighbours[0][0], "s2")
+        scores = [score for _, score in neighbours]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+        forwards = similarity.nearest(index, "s1", k=1, position="Forward")
+        self.assertEqual([player_id for player_id, _ in forwards], ["s2"])
+        self.assertEqual(similarity.nearest(index, "g1", position="Goalkeeper"), [])
+        self.assertIsNone(similarity.nearest(index, "missing"))
+
+    def test_load_rebuilds_when_players_change(self):
+        index = similarity.load()
+        self.assertIs(similarity.load(), index)
+        self.assertTrue(similarity.index_path().exists())
+
+        make_player("s3", "Striker Three")
+        index = similarity.load()
+        self.assertIn("s3", index.rows)
+        self.assertEqual(index.version, similarity.data_version())
+
+    def test_endpoint(self):
+        response = self.get("s1", k=2)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["results"][0]["name"], "S2")
+        self.assertEqual(len(data["results"]), 2)
+
+        response = self.client.get(
+            f"/api/players/{self.players['s1'].pk}/similar/",
+            {"k": 2},
+            HTTP_HOST="localhost",
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_endpoint_errors(self):
+        self.assertEqual(self.get("s1", k="x").status_code, 400)
+        self.assertEqual(self.get("s1", k=0).status_code, 400)
+        self.assertEqual(self.get("s1", k=51).status_code, 400)
+        self.assertEqual(self.get("s1", position="Coach").status_code, 400)
+        response = self.client.get(
+            "/api/players/999999/similar/", HTTP_HOST="localhost"
+        )
+        self.assertEqual(response.status_code, 404)
@@ -1,63 +1,156 @@
+import time
+
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import viewsets, filters
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from .models import Player
+from ai_analysis import similarity
+from config.conditional import ConditionalGetMixin
+from config.facets import FacetsMixin
+from config.fieldsets import SparseFieldsetMixin
+from config.renderers import FAST_RENDERER_CLASSES
+from config.rows import RowSerializerMixin
+from config.search import FullTextSearchFilter, FullTextSearchMixin
+from config.snapshots import SnapshotListMixin
+from config.pagination import PlayerCursorPagination
+from .filters import PlayerFilter
+from .models import Player, PlayerProfile
 from .serializers import PlayerSerializer, PlayerDetailSerializer
 
 
-class PlayerViewSet(viewsets.ReadOnlyModelViewSet):
+class PlayerViewSet(
+    FacetsMixin,
+    FullTextSearchMixin,
+    SparseFieldsetMixin,
+    SnapshotListMixin,
+    ConditionalGetMixin,
+    RowSerializerMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """
     선수 정보 조회 API
-    - list: 선수 목록 조회
-    - retrieve: 선수 상세 조회
-    - search: 선수 검색
+    - list: 선수 목록 조회 (?cursor, ?page_size 커서 페이지네이션 / ?fields 필드 선택)
+      ?height_cm_min=190&ordering=-height_cm 등 범위 필터/정렬 (players/filters.py)
+    - retrieve: 선수 상세 조회 (소개글은 PlayerProfile 을 JOIN 해서 이때만 읽음)
+    - search: 선수 검색 (검색 인덱스, ?q= 는 관련도순)
+    - facets: 포지션/국적/팀별 선수 수 (목록과 같은 필터 적용)
+    - similar: 비슷한 선수 (?k=10&position=Forward, ai_analysis/similarity.py 인덱스)
     """
 
     queryset = Player.objects.all()
     serializer_class = PlayerSerializer
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    pagination_class = PlayerCursorPagination
+    renderer_classes = FAST_RENDERER_CLASSES
+    snapshot_name = "players"
+    filter_backends = [
+        DjangoFilterBackend,
+        FullTextSearchFilter,
+        filters.OrderingFilter,
+    ]
+    filterset_class = PlayerFilter
     search_fields = ["name", "full_name", "team_name", "nationality"]
-    ordering_fields = ["name", "age", "team_name"]
+    search_index = "players"
+    search_columns = ["name", "team", "nationality"]  # ?search= 대상 (search_fields)
+    search_params = {
+        "name": ("name", "name"),
+        "team": ("team", "team_name"),
+        "position": ("position", "position"),
+        "nationality": ("nationality", "nationality"),
+    }
+    ordering_fields = [
+        "name",
+        "age",
+        "team_name",
+        "height_cm",
+        "weight_kg",
+        "jersey_no",
+        "birth_date",
+    ]
     ordering = ["name"]
+    facet_fields = {
+        "position": "position",
+        "nationality": "nationality",
+        "team": "team_name",
+    }
 
     def get_serializer_class(self):
         if self.action == "retrieve":
             return PlayerDetailSerializer
         return PlayerSerializer
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "retrieve":
+            return queryset.select_related("profile")
+        return queryset
+
+    def filter_queryset(self, queryset):
+        # similar 의 ?position 은 비슷한 선수 필터 (기준 선수 조회에는 적용하지 않음)
+        if self.action == "similar":
+            return queryset
+        return super().filter_queryset(queryset)
+
+    def get_conditional_models(self):
+        if self.action in ("retrieve", "similar"):
+            return [Player, PlayerProfile]
+        return [Player]
+
     @action(detail=False, methods=["get"])
     def search(self, request):
         """
         선수 검색
-        query params: name, team, position, nationality
+        query params: q, name, team, position, nationality
+        - q: 이름/팀/국적/포지션/소개 전체 검색, 관련도순 (?page, ?page_size)
+        - name, team, position, nationality: 해당 항목 검색 (단어 앞부분 일치)
+        """
+        return self.search_response(request)
+
+    @action(detail=True, methods=["get"])
+    def similar(self, request, pk=None):
+        """
+        비슷한 선수 top-k (숫자 속성 + 포지션/국적 + 소개글 TF-IDF 코사인 유사도)
+        query params: k (1~50, 기본 10), position (해당 포지션 선수만)
         """
-        queryset = self.get_queryset()
-
-        # 이름 검색
-        name = request.query_params.get("name", None)
-        if name:
-            queryset = queryset.filter(name__icontains=name)
-
-        # 팀 검색
-        team = request.query_params.get("team", None)
-        if team:
-            queryset = queryset.filter(team_name__icontains=team)
-
-        # 포지션 검색
-        position = request.query_params.get("position", None)
-        if position:
-            queryset = queryset.filter(position__icontains=position)
-
-        # 국적 검색
-        nationality = request.query_params.get("nationality", None)
-        if nationality:
-            queryset = queryset.filter(nationality__icontains=nationality)
-
-        # 페이지네이션 적용
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        # 없는 선수는 If-None-Match 가 맞아도 304 가 아니라 404
+        self.get_object()
+        return self.conditional_response(request, self.similar_response)
+
+    def similar_response(self, request):
+        player = self.get_object()
+        try:
+            k = int(request.query_params.get("k", 10))
+        except ValueError:
+            raise ValidationError({"error": "k는 숫자여야 합니다."}) from None
+        if not 1 <= k <= 50:
+            raise ValidationError({"error": "k는 1~50 사이여야 합니다."})
+        position = request.query_params.get("position") or None
+
+        index = similarity.load()
+        if position and position not in set(index.positions.tolist()):
+            choices = ", ".join(sorted(set(index.positions.tolist())))
+            raise ValidationError(
+                {"error": f"position 은 {choices} 중에서 선택해주세요."}
+            )
+
+        start = time.perf_counter()
+        neighbours = similarity.nearest(index, player.player_id, k, position) or []
+        query_ms = (time.perf_counter() - start) * 1000
+
+        players = Player.objects.in_bulk(
+            [player_id for player_id, _ in neighbours], field_name="player_id"
+        )
+        results = []
+        for player_id, score in neighbours:
+            row = PlayerSerializer(players[player_id]).data
+            row["similarity"] = score
+            results.append(row)
+        return Response(
+            {
+                "player_id": player.player_id,
+                "name": player.name,
+                "position": position,
+                "query_ms": round(query_ms, 3),
+                "results": results,
+            }
+        )
@@ -0,0 +1,158 @@
+"""
+델타 동기화 - 적재(ingestion) 쪽
+- apply_rows(): 적재할 행을 기존 데이터와 비교해 바뀐 행만 저장하고 ChangeLog 에 기록
+- 변경이 없는 행은 쓰지 않으므로 updated_at / ETag / 스냅샷도 바뀌지 않음
+- 변경 로그는 lock_changelog() 로 잠근 뒤 기록 → 버전(자동 증가 id)이 커밋 순서와 같음
+"""
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+
+from .models import ChangeLog, ChangeLogLock
+
+# 동기화 대상: 이름 → (모델, 시리얼라이저, 키 필드)
+FEEDS = {
+    "matches": (
+        "matches.models.Match",
+        "matches.serializers.MatchSerializer",
+        ("match_id",),
+    ),
+    "standings": (
+        "teams.models.TeamStanding",
+        "teams.serializers.TeamStandingSerializer",
+        ("team_name",),
+    ),
+    "players": (
+        "players.models.Player",
+        "players.serializers.PlayerSerializer",
+        ("player_id",),
+    ),
+    "staff": (
+        "teams.models.Staff",
+        "teams.serializers.StaffSerializer",
+        ("team_name", "position", "name"),
+    ),
+}
+
+
+def feed_name(model):
+    """모델 → FEEDS 이름"""
+    label = f"{model.__module__}.{model.__name__}"
+    for name, (model_path, _, _) in FEEDS.items():
+        if model_path == label:
+            return name
+    raise KeyError(label)
+
+
+def normalize(field, value):
+    """적재 값 → DB 에서 읽은 값과 비교 가능한 형태"""
+    value = field.to_python(value)
+    if (
+        isinstance(field, models.DateTimeField)
+        and value is not None
+        and settings.USE_TZ
+        and timezone.is_naive(value)
+    ):
+        value = timezone.make_aware(value)
+    return value
+
+
+def lock_changelog():
+    """
+    변경 로그 쓰기 잠금 (트랜잭션 안에서 호출, 커밋/롤백 때 풀림)
+    - 자동 증가 id 는 INSERT 순서로 매겨지지만 커밋은 순서가 바뀔 수 있음 (PostgreSQL 등)
+      → 늦게 커밋된 작은 버전을 클라이언트가 건너뛰지 않도록 쓰는 쪽을 한 번에 하나로 제한
+    - SQLite 는 쓰기 트랜잭션이 원래 하나뿐이라 select_for_update 가 무시되어도 안전
+    """
+    ChangeLogLock.objects.get_or_create(pk=1)
+    ChangeLogLock.objects.select_for_update().get(pk=1)
+
+
+@transaction.atomic
+def apply_rows(model, key_fields, rows, delete_missing=False):
+    """
+    rows(dict 목록)를 key_fields 기준으로 반영 → (추가 수, 수정 수, 삭제 수)
+    - 값이 같은 행은 건너뜀
+    - delete_missing=True 면 rows 에 없는 기존 행 삭제
+    """
+    name = feed_name(model)
+    field_names = sorted({field for row in rows for field in row})
+    fields = {field: model._meta.get_field(field) for field in field_names}
+
+    existing = {}
+    for row in model.objects.values("pk", *field_names):
+        existing[tuple(row[field] for field in key_fields)] = row
+
+    now = timezone.now()
+    to_create = []
+    to_update = []
+    updated_fields = set()
+    seen = set()
+
+    for row in rows:
+        row = {field: normalize(fields[field], value) for field, value in row.items()}
+        key = tuple(row[field] for field in key_fields)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        current = existing.get(key)
+        if current is None:
+            to_create.append(model(**row))
+            continue
+
+        changed = [field for field, value in row.items() if current[field] != value]
+        if changed:
+            updated_fields.update(changed)
+            to_update.append({**current, **row})
+
+    if to_create:
+        created = model.objects.bulk_create(to_create)
+        if any(obj.pk is None for obj in created):
+            # RETURNING 을 지원하지 않는 DB
+            pks = {
+                tuple(row[field] for field in key_fields): row["pk"]
+                for row in model.objects.values("pk", *key_fields)
+            }
+            for obj in created:
+                obj.pk = pks[tuple(getattr(obj, field) for field in key_fields)]
+        to_create = created
+
+    if to_update:
+        objs = []
+        for row in to_update:
+            pk = row.pop("pk")
+            objs.append(model(pk=pk, updated_at=now, **row))
+        model.objects.bulk_update(objs, [*sorted(updated_fields), "updated_at"])
+        to_update = objs
+
+    to_delete = []
+    if delete_missing:
+        to_delete = [row for key, row in existing.items() if key not in seen]
+        if to_delete:
+            model.objects.filter(pk__in=[row["pk"] for row in to_delete]).delete()
+
+    log = [
+        ChangeLog(
+            model=name,
+            object_id=obj.pk,
+            key={field: getattr(obj, field) for field in key_fields},
+            action="upsert",
+        )
+        for obj in [*to_create, *to_update]
+    ]
+    log += [
+        ChangeLog(
+            model=name,
+            object_id=row["pk"],
+            key={field: row[field] for field in key_fields},
+            action="delete",
+        )
+        for row in to_delete
+    ]
+    if log:
+        lock_changelog()
+        ChangeLog.objects.bulk_create(log)
+
+    return len(to_create), len(to_update), len(to_delete)
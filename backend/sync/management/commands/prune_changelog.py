@@ -0,0 +1,43 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from sync.changes import FEEDS, lock_changelog
+from sync.models import ChangeLog
+
+
+class Command(BaseCommand):
+    help = "오래된 델타 동기화 변경 로그 정리"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="보관 기간 (일, 기본 30)",
+        )
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        lock_changelog()
+
+        for name in FEEDS:
+            old = ChangeLog.objects.filter(model=name, changed_at__lt=cutoff)
+            boundary = old.aggregate(version=Max("version"))["version"]
+            if boundary is None:
+                continue
+
+            deleted, _ = old.delete()
+            # 이 버전/시각 이전 토큰으로 요청하면 전체 동기화 필요 (410)
+            ChangeLog.objects.create(
+                model=name,
+                action="reset",
+                key={"version": boundary, "changed_at": cutoff.isoformat()},
+            )
+            self.stdout.write(f"  {name}: {deleted}개 정리 (version <= {boundary})")
+
+        self.stdout.write(self.style.SUCCESS("✅ 변경 로그 정리 완료"))
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="ChangeLog",
+            fields=[
+                ("version", models.BigAutoField(primary_key=True, serialize=False)),
+                ("model", models.CharField(max_length=50, verbose_name="데이터 종류")),
+                (
+                    "object_id",
+                    models.BigIntegerField(null=True, verbose_name="대상 ID"),
+                ),
+                ("key", models.JSONField(default=dict, verbose_name="대상 키")),
+                (
+                    "action",
+                    models.CharField(
+                        choices=[
+                            ("upsert", "추가/수정"),
+                            ("delete", "삭제"),
+                            ("reset", "로그 정리"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("changed_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name": "변경 로그",
+                "verbose_name_plural": "변경 로그",
+                "indexes": [
+                    models.Index(
+                        fields=["model", "version"], name="sync_change_model_126d87_idx"
+                    ),
+                    models.Index(
+                        fields=["model", "changed_at"],
+                        name="sync_change_model_a7f322_idx",
+                    ),
+                ],
+            },
+        ),
+    ]
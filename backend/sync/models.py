@@ -0,0 +1,38 @@
+from django.db import models
+
+
+class ChangeLog(models.Model):
+    """데이터 적재 시 기록되는 변경 로그 (델타 동기화용)"""
+
+    ACTION_CHOICES = [
+        ("upsert", "추가/수정"),
+        ("delete", "삭제"),
+        ("reset", "로그 정리"),  # 이 버전 이전 토큰은 전체 동기화 필요
+    ]
+
+    # 자동 증가 id 가 곧 버전 토큰
+    version = models.BigAutoField(primary_key=True)
+    model = models.CharField(max_length=50, verbose_name="데이터 종류")
+    object_id = models.BigIntegerField(null=True, verbose_name="대상 ID")
+    key = models.JSONField(default=dict, verbose_name="대상 키")
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    changed_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "변경 로그"
+        verbose_name_plural = "변경 로그"
+        indexes = [
+            models.Index(fields=["model", "version"]),
+            models.Index(fields=["model", "changed_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.version} {self.model} {self.action} {self.key}"
+
+
+class ChangeLogLock(models.Model):
+    """변경 로그 쓰기 잠금용 단일 행 (쓰는 쪽 직렬화 → 버전이 커밋 순서대로 증가)"""
+
+    class Meta:
+        verbose_name = "변경 로그 잠금"
+        verbose_name_plural = "변경 로그 잠금"
@@ -0,0 +1,122 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from teams.models import Staff
+
+from .changes import apply_rows
+from .models import ChangeLog, ChangeLogLock
+
+KEY = ("team_name", "position", "name")
+
+
+def staff_row(name, position="Manager", team_name="Arsenal", nationality="Spain"):
+    return {
+        "team_name": team_name,
+        "position": position,
+        "name": name,
+        "nationality": nationality,
+    }
+
+
+class ApplyRowsTests(TestCase):
+    """적재 시 바뀐 행만 저장하고 변경 로그에 기록"""
+
+    def setUp(self):
+        apply_rows(
+            Staff,
+            KEY,
+            [staff_row("Mikel Arteta"), staff_row("Albert Stuivenberg", "Assistant")],
+        )
+
+    def test_created_rows_are_logged(self):
+        self.assertEqual(Staff.objects.count(), 2)
+        self.assertEqual(
+            list(ChangeLog.objects.values_list("action", flat=True)),
+            ["upsert", "upsert"],
+        )
+        self.assertTrue(ChangeLogLock.objects.filter(pk=1).exists())
+
+    def test_unchanged_rows_are_skipped(self):
+        updated_at = Staff.objects.get(name="Mikel Arteta").updated_at
+        result = apply_rows(Staff, KEY, [staff_row("Mikel Arteta")])
+        self.assertEqual(result, (0, 0, 0))
+        self.assertEqual(ChangeLog.objects.count(), 2)
+        self.assertEqual(Staff.objects.get(name="Mikel Arteta").updated_at, updated_at)
+
+    def test_update_and_delete_missing(self):
+        result = apply_rows(
+            Staff,
+            KEY,
+            [
+                staff_row("Mikel Arteta", nationality="Basque"),
+                staff_row("New Coach", "Coach"),
+            ],
+            delete_missing=True,
+        )
+        self.assertEqual(result, (1, 1, 1))
+        self.assertFalse(Staff.objects.filter(name="Albert Stuivenberg").exists())
+        deleted = ChangeLog.objects.get(action="delete")
+        self.assertEqual(deleted.key["name"], "Albert Stuivenberg")
+
+    def test_duplicate_keys_use_first_row(self):
+        apply_rows(
+            Staff,
+            KEY,
+            [staff_row("Dup", nationality="A"), staff_row("Dup", nationality="B")],
+        )
+        self.assertEqual(Staff.objects.get(name="Dup").nationality, "A")
+
+
+class SyncEndpointTests(TestCase):
+    """GET /api/sync/?since= 델타 동기화"""
+
+    def setUp(self):
+        apply_rows(
+            Staff,
+            KEY,
+            [staff_row("Mikel Arteta"), staff_row("Albert Stuivenberg", "Assistant")],
+        )
+
+    def get(self, **params):
+        return self.client.get("/api/sync/", params, HTTP_HOST="localhost")
+
+    def test_full_then_delta(self):
+        full = self.get(models="staff").json()
+        self.assertEqual(len(full["staff"]["changes"]), 2)
+
+        apply_rows(
+            Staff,
+            KEY,
+            [staff_row("Mikel Arteta", nationality="Basque")],
+            delete_missing=True,
+        )
+        delta = self.get(since=full["version"], models="staff").json()
+        self.assertGreater(delta["version"], full["version"])
+        self.assertEqual(
+            [row["name"] for row in delta["staff"]["changes"]], ["Mikel Arteta"]
+        )
+        self.assertEqual(delta["staff"]["deleted"][0]["name"], "Albert Stuivenberg")
+
+        latest = self.get(since=delta["version"], models="staff").json()
+        self.assertEqual(latest["staff"], {"changes": [], "deleted": []})
+
+    def test_since_timestamp(self):
+        since = (timezone.now() + timedelta(minutes=1)).isoformat()
+        data = self.get(since=since, models="staff").json()
+        self.assertEqual(data["staff"]["changes"], [])
+
+    def test_invalid_parameters(self):
+        self.assertEqual(self.get(since="yesterday").status_code, 400)
+        self.assertEqual(self.get(models="staff,salaries").status_code, 400)
+
+    def test_pruned_log_is_gone(self):
+        version = self.get(models="staff").json()["version"]
+        ChangeLog.objects.update(changed_at=timezone.now() - timedelta(days=60))
+        call_command("prune_changelog", days=30, stdout=StringIO())
+        response = self.get(since=version - 1, models="staff")
+        self.assertEqual(response.status_code, 410)
+        self.assertEqual(self.get(since=0, models="staff").status_code, 200)
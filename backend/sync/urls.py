@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .views import sync_changes
+
+urlpatterns = [
+    path("", sync_changes, name="sync-changes"),
+]
@@ -0,0 +1,133 @@
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.module_loading import import_string
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from config.rows import RowSerializer
+
+from .changes import FEEDS
+from .models import ChangeLog
+
+
+def parse_since(value):
+    """?since= → ("version", int) / ("timestamp", datetime) / None (전체)"""
+    if not value or value == "0":
+        return None
+    if value.isdigit():
+        return "version", int(value)
+
+    since = parse_datetime(value.replace(" ", "+"))
+    if since is None:
+        raise ValueError(value)
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since)
+    return "timestamp", since
+
+
+def serialize(name, queryset):
+    """FEEDS 시리얼라이저로 직렬화 (키 필드가 응답에 없으면 앞에 추가)"""
+    _, serializer_path, key_fields = FEEDS[name]
+    serializer_class = import_string(serializer_path)
+    row_serializer = RowSerializer.for_serializer(serializer_class)
+
+    if row_serializer is None:
+        rows = serializer_class(queryset, many=True).data
+        keys = [
+            {field: getattr(obj, field) for field in key_fields} for obj in queryset
+        ]
+    else:
+        columns = [field for field in key_fields if field not in row_serializer.names]
+        values = list(row_serializer.values(queryset, columns))
+        rows = row_serializer.to_rows(values)
+        keys = [{field: value[field] for field in columns} for value in values]
+
+    return [{**key, **row} for key, row in zip(keys, rows, strict=True)]
+
+
+def changes_for(name, since, version):
+    """since 이후 ~ version 까지의 변경 → {"changes": [...], "deleted": [...]} 또는 None (전체 동기화 필요)"""
+    model_path, _, key_fields = FEEDS[name]
+    model = import_string(model_path)
+
+    if since is None:
+        return {"changes": serialize(name, model.objects.all()), "deleted": []}
+
+    # since 이전 로그가 정리(prune_changelog)되었으면 델타를 만들 수 없음
+    reset = (
+        ChangeLog.objects.filter(model=name, action="reset")
+        .order_by("-version")
+        .values_list("key", flat=True)
+        .first()
+    )
+    if reset is not None:
+        if since[0] == "version" and since[1] < reset["version"]:
+            return None
+        if since[0] == "timestamp" and since[1] < parse_datetime(reset["changed_at"]):
+            return None
+
+    log = ChangeLog.objects.filter(model=name, version__lte=version).exclude(
+        action="reset"
+    )
+    if since[0] == "version":
+        log = log.filter(version__gt=since[1])
+    else:
+        log = log.filter(changed_at__gt=since[1])
+
+    # 키별 마지막 변경만 (삭제 후 다시 추가된 행은 upsert 로)
+    latest = {}
+    for object_id, action, key in log.order_by("version").values_list(
+        "object_id", "action", "key"
+    ):
+        latest[tuple(key[field] for field in key_fields)] = (action, object_id, key)
+
+    upserted = [oid for action, oid, _ in latest.values() if action == "upsert"]
+    deleted = [key for action, _, key in latest.values() if action == "delete"]
+
+    queryset = model.objects.filter(pk__in=upserted)
+    return {"changes": serialize(name, queryset), "deleted": deleted}
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def sync_changes(request):
+    """
+    델타 동기화 (?since=<버전 또는 ISO 시각>&models=matches,standings)
+    응답의 version 을 다음 요청의 since 로 사용
+    """
+    names = request.query_params.get("models")
+    names = names.split(",") if names else list(FEEDS)
+    unknown = [name for name in names if name not in FEEDS]
+    if unknown:
+        return Response(
+            {"error": f"알 수 없는 데이터 종류입니다: {', '.join(unknown)}"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    try:
+        since = parse_since(request.query_params.get("since"))
+    except ValueError:
+        return Response(
+            {"error": "since 는 버전 번호 또는 ISO 8601 시각이어야 합니다."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    # 버전을 먼저 정해야 조회 중 추가된 변경을 다음 동기화에서 놓치지 않음
+    version = ChangeLog.objects.aggregate(version=Max("version"))["version"] or 0
+
+    result = {"version": version}
+    for name in names:
+        changes = changes_for(name, since, version)
+        if changes is None:
+            return Response(
+                {
+                    "error": "변경 로그가 정리되었습니다. since 없이 전체 데이터를 다시 받아주세요.",
+                    "version": version,
+                },
+                status=status.HTTP_410_GONE,
+            )
+        result[name] = changes
+    return Response(result)
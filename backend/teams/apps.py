@@ -1,6 +1,17 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class TeamsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "teams"
+
+    def ready(self):
+        from config import snapshots
+
+        from .models import Staff, Team, TeamStanding
+
+        # 관리자 화면 등 개별 저장/삭제 → 목록 스냅샷 무효화
+        for model in (Staff, Team, TeamStanding):
+            post_save.connect(snapshots.model_changed, sender=model)
+            post_delete.connect(snapshots.model_changed, sender=model)
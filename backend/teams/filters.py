@@ -0,0 +1,18 @@
+import django_filters
+
+from .models import Staff
+
+
+class StaffFilter(django_filters.FilterSet):
+    """
+    감독/코치 목록 필터 (대소문자 무시 일치)
+    ?position=Manager&nationality=Spain&team=Arsenal
+    """
+
+    position = django_filters.CharFilter(lookup_expr="iexact")
+    nationality = django_filters.CharFilter(lookup_expr="iexact")
+    team = django_filters.CharFilter(field_name="team_name", lookup_expr="iexact")
+
+    class Meta:
+        model = Staff
+        fields = ["position", "nationality"]
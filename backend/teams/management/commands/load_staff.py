@@ -2,6 +2,8 @@ import csv
 from pathlib import Path
 from django.core.management.base import BaseCommand
 from django.conf import settings
+from config import search, snapshots
+from sync.changes import apply_rows
 from teams.models import Staff
 
 
@@ -29,8 +31,7 @@ class Command(BaseCommand):
             )
 
         # CSV 파일 읽기
-        created_count = 0
-        updated_count = 0
+        rows = []
 
         with open(csv_file, "r", encoding="utf-8-sig") as f:
             reader = csv.DictReader(f)
@@ -48,26 +49,35 @@ class Command(BaseCommand):
                     )
                     continue
 
-                # 데이터베이스에 저장
-                staff, created = Staff.objects.update_or_create(
-                    team_name=team_name,
-                    position=position,
-                    name=name,
-                    defaults={
+                rows.append(
+                    {
+                        "team_name": team_name,
+                        "position": position,
+                        "name": name,
                         "nationality": nationality,
-                    },
+                    }
                 )
 
-                if created:
-                    created_count += 1
-                else:
-                    updated_count += 1
+        # 데이터베이스에 저장 (바뀐 행만)
+        created_count, updated_count, _ = apply_rows(
+            Staff, ("team_name", "position", "name"), rows
+        )
 
         self.stdout.write(
             self.style.SUCCESS(
                 f"\nSuccessfully loaded staff!\n"
                 f"Created: {created_count}\n"
                 f"Updated: {updated_count}\n"
+                f"Unchanged: {len(rows) - created_count - updated_count}\n"
                 f"Total: {Staff.objects.count()}"
             )
         )
+
+        # 검색 인덱스 재구성
+        if search.rebuild("staff"):
+            self.stdout.write("Search index rebuilt: staff")
+
+        # 공개 목록 API 스냅샷 갱신
+        snapshot = snapshots.publish("staff")
+        if snapshot:
+            self.stdout.write(f"Snapshot published: staff ({snapshot['version']})")
@@ -2,6 +2,7 @@ import csv
 from pathlib import Path
 from django.core.management.base import BaseCommand
 from django.conf import settings
+from config import snapshots
 from teams.models import Team
 
 
@@ -60,3 +61,8 @@ class Command(BaseCommand):
                 f"Total: {Team.objects.count()}"
             )
         )
+
+        # 공개 목록 API 스냅샷 갱신
+        snapshot = snapshots.publish("teams")
+        if snapshot:
+            self.stdout.write(f"Snapshot published: teams ({snapshot['version']})")
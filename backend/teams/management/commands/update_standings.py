@@ -14,6 +14,9 @@ from datetime import datetime, date
 from typing import Optional, Dict
 from django.core.management.base import BaseCommand
 from django.conf import settings
+from ai_analysis import previews
+from config import snapshots
+from sync.changes import apply_rows
 from teams.models import TeamStanding
 
 
@@ -94,6 +97,14 @@ class Command(BaseCommand):
 
             # 업데이트 결과 출력
             self.print_standings_summary(df)
+
+            # 공개 목록 API 스냅샷 갱신
+            snapshot = snapshots.publish("standings")
+            if snapshot:
+                self.stdout.write(f"  ✓ 스냅샷 갱신: {snapshot['version']}")
+
+            # 프리뷰의 순위 정보 갱신 (예정 경기 라운드)
+            self.stdout.write(f"  ✓ 경기 프리뷰 갱신: {previews.refresh()}개")
         else:
             self.stdout.write(self.style.ERROR("  ✗ 데이터베이스 업데이트 실패!"))
 
@@ -226,34 +237,36 @@ class Command(BaseCommand):
             return None
 
     def update_database(self, df: pd.DataFrame) -> int:
-        """DataFrame의 데이터를 DB에 저장 (팀 로고 포함)"""
+        """DataFrame의 데이터를 DB에 저장 (팀 로고 포함, 바뀐 팀만)"""
         try:
-            # 기존 데이터 모두 삭제
-            deleted_count = TeamStanding.objects.all().count()
-            TeamStanding.objects.all().delete()
-            self.stdout.write(f"  → 기존 {deleted_count}개 데이터 삭제")
-
-            # 새 데이터 삽입
-            created_count = 0
-            for _, row in df.iterrows():
-                TeamStanding.objects.create(
-                    rank=row["순위"],
-                    team_name=row["팀명"],
-                    team_logo=row["팀로고"] if row["팀로고"] else None,
-                    points=row["승점"],
-                    matches_played=row["경기수"],
-                    wins=row["승"],
-                    draws=row["무"],
-                    losses=row["패"],
-                    goals_for=row["득점"],
-                    goals_against=row["실점"],
-                    goal_difference=row["득실차"],
-                )
-                created_count += 1
-
-            self.stdout.write(f"  → {created_count}개 새 데이터 생성")
+            rows = [
+                {
+                    "rank": row["순위"],
+                    "team_name": row["팀명"],
+                    "team_logo": row["팀로고"] if row["팀로고"] else None,
+                    "points": row["승점"],
+                    "matches_played": row["경기수"],
+                    "wins": row["승"],
+                    "draws": row["무"],
+                    "losses": row["패"],
+                    "goals_for": row["득점"],
+                    "goals_against": row["실점"],
+                    "goal_difference": row["득실차"],
+                }
+                for _, row in df.iterrows()
+            ]
+
+            # 순위표에 없는 팀(강등 등)은 삭제
+            created_count, updated_count, deleted_count = apply_rows(
+                TeamStanding, ("team_name",), rows, delete_missing=True
+            )
+            self.stdout.write(
+                f"  → 추가 {created_count}개, 변경 {updated_count}개, "
+                f"삭제 {deleted_count}개, 변경 없음 "
+                f"{len(rows) - created_count - updated_count}개"
+            )
 
-            return created_count
+            return len(rows)
 
         except Exception as e:
             self.stdout.write(self.style.ERROR(f"  ✗ DB 업데이트 오류: {e}"))
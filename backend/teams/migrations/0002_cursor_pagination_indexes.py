@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("teams", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="staff",
+            index=models.Index(
+                fields=["team_name", "position", "name"],
+                name="teams_staff_team_na_1df600_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("teams", "0002_cursor_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="staff",
+            index=models.Index(
+                fields=["updated_at"], name="teams_staff_updated_bde010_idx"
+            ),
+        ),
+    ]
@@ -41,6 +41,8 @@ class Staff(models.Model):
             models.Index(fields=["team_name"]),
             models.Index(fields=["position"]),
             models.Index(fields=["name"]),
+            models.Index(fields=["team_name", "position", "name"]),
+            models.Index(fields=["updated_at"]),
         ]
 
     def __str__(self):
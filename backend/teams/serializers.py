@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from config.fieldsets import SparseFieldsetSerializerMixin
 from .models import Team, Staff, TeamStanding
 
 
@@ -21,7 +22,7 @@ class TeamDetailSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class StaffSerializer(serializers.ModelSerializer):
+class StaffSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """감독/코치 시리얼라이저"""
 
     class Meta:
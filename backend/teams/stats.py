@@ -0,0 +1,186 @@
+"""
+팀 시즌 통계 - 종료 경기(Match)를 SQL 1번으로 집계 (전체 팀)
+- 경기를 홈/원정 2행으로 펼쳐(UNION ALL) 팀별 조건부 SUM: 승/무/패, 홈/원정, 클린시트, 전/후반 득실점
+- 연속 기록은 윈도 함수 ROW_NUMBER 의 차이(gaps and islands)로 계산
+  최근 경기부터 같은 결과가 이어지는 구간 = 전체 순번과 결과별 순번이 같은 행
+- 결과는 경기 테이블 버전별로 캐시 → 다음 적재 전까지 재사용 (Python 에서 경기를 돌지 않음)
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+from config.conditional import dataset_validators
+from matches.models import Match
+
+CACHE_PREFIX = "team-stats"
+
+SQL = """
+WITH sides AS (
+    SELECT id AS match_pk, match_date, home_team_id AS team_id,
+           home_team_name AS team_name, 1 AS is_home,
+           home_score AS goals_for, away_score AS goals_against,
+           home_half_score AS half_for, away_half_score AS half_against
+    FROM {table}
+    WHERE status = %s AND home_score IS NOT NULL AND away_score IS NOT NULL
+    UNION ALL
+    SELECT id, match_date, away_team_id, away_team_name, 0,
+           away_score, home_score, away_half_score, home_half_score
+    FROM {table}
+    WHERE status = %s AND home_score IS NOT NULL AND away_score IS NOT NULL
+),
+results AS (
+    SELECT sides.*,
+           CASE WHEN goals_for > goals_against THEN 'W'
+                WHEN goals_for = goals_against THEN 'D' ELSE 'L' END AS result,
+           CASE WHEN goals_for > 0 THEN 1 ELSE 0 END AS scored,
+           CASE WHEN goals_for >= goals_against THEN 1 ELSE 0 END AS unbeaten,
+           ROW_NUMBER() OVER (
+               PARTITION BY team_id ORDER BY match_date DESC, match_pk DESC
+           ) AS recent
+    FROM sides
+),
+runs AS (
+    SELECT results.*,
+           recent - ROW_NUMBER() OVER (
+               PARTITION BY team_id, result ORDER BY match_date DESC, match_pk DESC
+           ) AS result_run,
+           recent - ROW_NUMBER() OVER (
+               PARTITION BY team_id, scored ORDER BY match_date DESC, match_pk DESC
+           ) AS scored_run,
+           recent - ROW_NUMBER() OVER (
+               PARTITION BY team_id, unbeaten ORDER BY match_date DESC, match_pk DESC
+           ) AS unbeaten_run
+    FROM results
+),
+win_runs AS (
+    SELECT team_id, MAX(length) AS longest_win_streak
+    FROM (
+        SELECT team_id, COUNT(*) AS length
+        FROM runs
+        WHERE result = 'W'
+        GROUP BY team_id, result_run
+    ) AS islands
+    GROUP BY team_id
+)
+SELECT
+    runs.team_id,
+    MAX(CASE WHEN recent = 1 THEN team_name END) AS team_name,
+    COUNT(*) AS played,
+    SUM(CASE WHEN result = 'W' THEN 1 ELSE 0 END) AS wins,
+    SUM(CASE WHEN result = 'D' THEN 1 ELSE 0 END) AS draws,
+    SUM(CASE WHEN result = 'L' THEN 1 ELSE 0 END) AS losses,
+    SUM(goals_for) AS goals_for,
+    SUM(goals_against) AS goals_against,
+    SUM(CASE WHEN goals_against = 0 THEN 1 ELSE 0 END) AS clean_sheets,
+    SUM(CASE WHEN goals_for = 0 THEN 1 ELSE 0 END) AS failed_to_score,
+
+    SUM(is_home) AS home_played,
+    SUM(CASE WHEN is_home = 1 AND result = 'W' THEN 1 ELSE 0 END) AS home_wins,
+    SUM(CASE WHEN is_home = 1 AND result = 'D' THEN 1 ELSE 0 END) AS home_draws,
+    SUM(CASE WHEN is_home = 1 AND result = 'L' THEN 1 ELSE 0 END) AS home_losses,
+    SUM(CASE WHEN is_home = 1 THEN goals_for ELSE 0 END) AS home_goals_for,
+    SUM(CASE WHEN is_home = 1 THEN goals_against ELSE 0 END) AS home_goals_against,
+    SUM(CASE WHEN is_home = 1 AND goals_against = 0 THEN 1 ELSE 0 END)
+        AS home_clean_sheets,
+    SUM(1 - is_home) AS away_played,
+    SUM(CASE WHEN is_home = 0 AND result = 'W' THEN 1 ELSE 0 END) AS away_wins,
+    SUM(CASE WHEN is_home = 0 AND result = 'D' THEN 1 ELSE 0 END) AS away_draws,
+    SUM(CASE WHEN is_home = 0 AND result = 'L' THEN 1 ELSE 0 END) AS away_losses,
+    SUM(CASE WHEN is_home = 0 THEN goals_for ELSE 0 END) AS away_goals_for,
+    SUM(CASE WHEN is_home = 0 THEN goals_against ELSE 0 END) AS away_goals_against,
+    SUM(CASE WHEN is_home = 0 AND goals_against = 0 THEN 1 ELSE 0 END)
+        AS away_clean_sheets,
+
+    COALESCE(SUM(half_for), 0) AS first_half_goals_for,
+    COALESCE(SUM(half_against), 0) AS first_half_goals_against,
+    COALESCE(SUM(goals_for - half_for), 0) AS second_half_goals_for,
+    COALESCE(SUM(goals_against - half_against), 0) AS second_half_goals_against,
+    SUM(CASE WHEN half_for > half_against THEN 1 ELSE 0 END) AS half_time_leads,
+    SUM(CASE WHEN half_for > half_against AND result <> 'W' THEN 1 ELSE 0 END)
+        AS leads_dropped,
+    SUM(CASE WHEN half_for < half_against AND result <> 'L' THEN 1 ELSE 0 END)
+        AS comebacks,
+
+    MAX(CASE WHEN recent = 1 THEN result END) AS streak_result,
+    SUM(CASE WHEN result_run = 0 THEN 1 ELSE 0 END) AS streak_length,
+    SUM(CASE WHEN scored = 1 AND scored_run = 0 THEN 1 ELSE 0 END) AS scoring_streak,
+    SUM(CASE WHEN unbeaten = 1 AND unbeaten_run = 0 THEN 1 ELSE 0 END)
+        AS unbeaten_streak,
+    COALESCE(MAX(win_runs.longest_win_streak), 0) AS longest_win_streak
+FROM runs
+LEFT JOIN win_runs ON win_runs.team_id = runs.team_id
+GROUP BY runs.team_id
+"""
+
+SPLITS = ["played", "wins", "draws", "losses", "goals_for", "goals_against"]
+
+
+def data_version():
+    """경기 테이블 버전"""
+    tables, _ = dataset_validators(Match)
+    return hashlib.md5(tables.encode()).hexdigest()
+
+
+def shape(row):
+    """SQL 결과 행 → 팀 통계 dict"""
+    stats = {
+        "team_id": row["team_id"],
+        "team_name": row["team_name"],
+        **{name: row[name] for name in SPLITS},
+        "points": row["wins"] * 3 + row["draws"],
+        "goal_difference": row["goals_for"] - row["goals_against"],
+        "clean_sheets": row["clean_sheets"],
+        "failed_to_score": row["failed_to_score"],
+    }
+    for side in ("home", "away"):
+        split = {name: row[f"{side}_{name}"] for name in SPLITS}
+        split["points"] = split["wins"] * 3 + split["draws"]
+        split["clean_sheets"] = row[f"{side}_clean_sheets"]
+        stats[side] = split
+    stats["halves"] = {
+        name: row[name]
+        for name in (
+            "first_half_goals_for",
+            "first_half_goals_against",
+            "second_half_goals_for",
+            "second_half_goals_against",
+            "half_time_leads",
+            "leads_dropped",
+            "comebacks",
+        )
+    }
+    stats["streaks"] = {
+        "current": f"{row['streak_result']}{row['streak_length']}",
+        "scoring": row["scoring_streak"],
+        "unbeaten": row["unbeaten_streak"],
+        "longest_win": row["longest_win_streak"],
+    }
+    return stats
+
+
+def compute():
+    """전체 팀 통계 (SQL 1번) → 승점/득실차/득점순 목록"""
+    status = "finished"
+    with connection.cursor() as cursor:
+        cursor.execute(SQL.format(table=Match._meta.db_table), [status, status])
+        columns = [column[0] for column in cursor.description]
+        rows = [dict(zip(columns, row, strict=True)) for row in cursor.fetchall()]
+    teams = [shape(row) for row in rows]
+    teams.sort(
+        key=lambda team: (-team["points"], -team["goal_difference"], -team["goals_for"])
+    )
+    return teams
+
+
+def get_stats():
+    """데이터 버전별 캐시 → {"data_version", "teams"}"""
+    version = data_version()
+    key = f"{CACHE_PREFIX}:{version}"
+    result = cache.get(key)
+    if result is None:
+        result = {"data_version": version, "teams": compute()}
+        cache.set(key, result, settings.TEAM_STATS_CACHE_TIMEOUT)
+    return result
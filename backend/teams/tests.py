@@ -1 +1,243 @@
-# Create your tests here.
+import gzip
+import json
+from datetime import UTC, datetime, timedelta
+
+from django.test import TestCase, override_settings
+
+from config import snapshots
+from matches.models import Match
+
+from . import stats
+from .models import Team
+
+
+class SnapshotTests(TestCase):
+    """파라미터 없는 목록 요청 → 미리 압축해 둔 스냅샷 파일 응답"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for team_id, name in [("359", "Arsenal"), ("363", "Chelsea")]:
+            Team.objects.create(team_id=team_id, team_name=name, league="EPL")
+
+    def get(self, path="/api/teams/", **headers):
+        return self.client.get(path, HTTP_HOST="localhost", **headers)
+
+    def test_list_served_from_snapshot(self):
+        pointer = snapshots.publish("teams")
+        response = self.get()
+        self.assertEqual(response["ETag"], f'W/"{pointer["version"]}"')
+        self.assertEqual(
+            response.content, self.get("/api/teams/?ordering=team_name").content
+        )
+
+        response = self.get(HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+    def test_precompressed_variant(self):
+        snapshots.publish("teams")
+        response = self.get(HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(
+            json.loads(gzip.decompress(response.content))[0]["team_name"], "Arsenal"
+        )
+
+    def test_model_save_invalidates_snapshot(self):
+        snapshots.publish("teams")
+        Team.objects.create(team_id="364", team_name="Liverpool")
+        self.assertIsNone(snapshots.current("teams"))
+        response = self.get()
+        self.assertEqual(len(response.json()), 3)
+
+    def test_schema_mismatch_falls_back_to_database(self):
+        pointer = snapshots.publish("teams")
+        path = snapshots.snapshot_dir("teams") / "current.json"
+        path.write_text(json.dumps({**pointer, "schema": "old"}))
+        response = self.get()
+        self.assertNotEqual(response["ETag"], f'W/"{pointer["version"]}"')
+
+    def test_publish_same_data_keeps_version(self):
+        self.assertEqual(
+            snapshots.publish("teams")["version"], snapshots.publish("teams")["version"]
+        )
+
+    @override_settings(SNAPSHOT_ENABLED=False)
+    def test_disabled(self):
+        self.assertIsNone(snapshots.publish("teams"))
+        self.assertIsNone(snapshots.current("teams"))
+
+
+class BatchTests(TestCase):
+    """여러 GET 요청을 /api/batch/ 한 번으로"""
+
+    @classmethod
+    def setUpTestData(cls):
+        Team.objects.create(team_id="359", team_name="Arsenal", league="EPL")
+
+    def get(self, path, **headers):
+        return self.client.get(path, HTTP_HOST="localhost", **headers)
+
+    def post(self, data):
+        return self.client.post(
+            "/api/batch/", data, content_type="application/json", HTTP_HOST="localhost"
+        )
+
+    def test_get_runs_each_subrequest(self):
+        response = self.get("/api/batch/?teams=/api/teams/&missing=/api/teams/999/")
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["teams"]["status"], 200)
+        self.assertEqual(data["teams"]["body"], self.get("/api/teams/").json())
+        self.assertEqual(data["missing"]["status"], 404)
+
+    def test_post_with_ids(self):
+        response = self.post(
+            {"requests": [{"id": "all", "url": "/api/teams/"}, "/api/nothing/"]}
+        )
+        data = response.json()
+        self.assertEqual(data["all"]["body"][0]["team_name"], "Arsenal")
+        self.assertEqual(data["/api/nothing/"]["status"], 404)
+
+    def test_not_modified(self):
+        response = self.get("/api/batch/?teams=/api/teams/")
+        etag = response["ETag"]
+        response = self.get("/api/batch/?teams=/api/teams/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_async_view_is_not_run(self):
+        response = self.get("/api/batch/?live=/api/matches/stream/")
+        self.assertEqual(response.json()["live"]["status"], 501)
+
+    def test_invalid_requests(self):
+        too_many = "&".join(f"r{i}=/api/teams/" for i in range(11))
+        for path in [
+            "/api/batch/",
+            "/api/batch/?x=/admin/",
+            "/api/batch/?x=/api/batch/",
+            f"/api/batch/?{too_many}",
+        ]:
+            with self.subTest(path=path):
+                self.assertEqual(self.get(path).status_code, 400)
+        self.assertEqual(self.post({"requests": [1]}).status_code, 400)
+
+
+KICKOFF = datetime(2025, 8, 16, 14, 0, tzinfo=UTC)
+
+ARSENAL = ("359", "Arsenal")
+CHELSEA = ("363", "Chelsea")
+LIVERPOOL = ("364", "Liverpool")
+
+
+def make_match(number, home, away, score=None, half=None):
+    """종료 경기 (score 가 없으면 예정 경기) - number 주차"""
+    home_score, away_score = score or (None, None)
+    home_half, away_half = half or (None, None)
+    return Match.objects.create(
+        match_id=str(number),
+        season="2025",
+        match_date=KICKOFF + timedelta(days=7 * number),
+        home_team_id=home[0],
+        home_team_name=home[1],
+        away_team_id=away[0],
+        away_team_name=away[1],
+        home_score=home_score,
+        away_score=away_score,
+        home_half_score=home_half,
+        away_half_score=away_half,
+        status="finished" if score else "scheduled",
+    )
+
+
+class TeamStatsTests(TestCase):
+    """팀 시즌 통계 - 종료 경기 SQL 집계 1번"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.teams = {
+            team_id: Team.objects.create(team_id=team_id, team_name=name)
+            for team_id, name in (ARSENAL, CHELSEA, LIVERPOOL, ("331", "Everton"))
+        }
+        make_match(0, ARSENAL, CHELSEA, (2, 0), (1, 0))
+        make_match(1, CHELSEA, ARSENAL, (1, 1), (1, 0))
+        make_match(2, ARSENAL, LIVERPOOL, (3, 1), (0, 1))
+        make_match(3, LIVERPOOL, ARSENAL, (0, 1), (0, 0))
+        make_match(4, ARSENAL, CHELSEA)
+
+    def get(self, path, **headers):
+        return self.client.get(path, HTTP_HOST="localhost", **headers)
+
+    def stats_by_team(self):
+        return {row["team_id"]: row for row in stats.get_stats()["teams"]}
+
+    def test_totals_and_splits(self):
+        teams = stats.get_stats()["teams"]
+        self.assertEqual(
+            [row["team_id"] for row in teams], [ARSENAL[0], CHELSEA[0], LIVERPOOL[0]]
+        )
+        arsenal = teams[0]
+        self.assertEqual(
+            [arsenal[name] for name in ("played", "wins", "draws", "losses")],
+            [4, 3, 1, 0],
+        )
+        self.assertEqual((arsenal["points"], arsenal["goal_difference"]), (10, 5))
+        self.assertEqual(arsenal["clean_sheets"], 2)
+        self.assertEqual(arsenal["home"]["points"], 6)
+        self.assertEqual(
+            (arsenal["away"]["goals_for"], arsenal["away"]["clean_sheets"]), (2, 1)
+        )
+
+    def test_halves(self):
+        teams = self.stats_by_team()
+        self.assertEqual(
+            teams[ARSENAL[0]]["halves"],
+            {
+                "first_half_goals_for": 1,
+                "first_half_goals_against": 2,
+                "second_half_goals_for": 6,
+                "second_half_goals_against": 0,
+                "half_time_leads": 1,
+                "leads_dropped": 0,
+                "comebacks": 2,
+            },
+        )
+        self.assertEqual(teams[LIVERPOOL[0]]["halves"]["leads_dropped"], 1)
+
+    def test_streaks(self):
+        teams = self.stats_by_team()
+        self.assertEqual(
+            teams[ARSENAL[0]]["streaks"],
+            {"current": "W2", "scoring": 4, "unbeaten": 4, "longest_win": 2},
+        )
+        self.assertEqual(teams[CHELSEA[0]]["streaks"]["current"], "D1")
+        liverpool = teams[LIVERPOOL[0]]
+        self.assertEqual(liverpool["streaks"]["current"], "L2")
+        self.assertEqual(liverpool["streaks"]["scoring"], 0)
+        self.assertEqual(liverpool["failed_to_score"], 1)
+
+    def test_cached_per_data_version(self):
+        version = stats.get_stats()["data_version"]
+        with self.assertNumQueries(1):  # 버전 확인만
+            stats.get_stats()
+
+        make_match(5, CHELSEA, LIVERPOOL, (2, 2))
+        result = stats.get_stats()
+        self.assertNotEqual(result["data_version"], version)
+        self.assertEqual(len(result["teams"]), 3)
+        self.assertEqual(self.stats_by_team()[CHELSEA[0]]["played"], 3)
+
+    def test_endpoints(self):
+        response = self.get("/api/teams/stats/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["teams"]), 3)
+        response = self.get("/api/teams/stats/", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+        path = f"/api/teams/{self.teams[ARSENAL[0]].pk}/stats/"
+        data = self.get(path).json()
+        self.assertEqual((data["team_name"], data["points"]), ("Arsenal", 10))
+        self.assertIn("data_version", data)
+
+    def test_team_endpoint_errors(self):
+        # 종료 경기가 없는 팀, 없는 팀
+        path = f"/api/teams/{self.teams['331'].pk}/stats/"
+        self.assertEqual(self.get(path).status_code, 404)
+        self.assertEqual(self.get("/api/teams/999999/stats/").status_code, 404)
@@ -2,9 +2,20 @@ import os
 from datetime import date
 from django.conf import settings
 from django.core.management import call_command
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import viewsets, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework import status
+from config.conditional import ConditionalGetMixin
+from config.facets import FacetsMixin
+from config.fieldsets import SparseFieldsetMixin
+from config.renderers import FAST_RENDERER_CLASSES
+from config.rows import RowSerializerMixin
+from config.search import FullTextSearchFilter, FullTextSearchMixin
+from config.snapshots import SnapshotListMixin
+from config.pagination import StaffCursorPagination
+from .filters import StaffFilter
 from .models import Team, Staff, TeamStanding
 from .serializers import (
     TeamSerializer,
@@ -13,16 +24,21 @@ from .serializers import (
     StaffDetailSerializer,
     TeamStandingSerializer,
 )
+from .stats import get_stats
+from matches.models import Match
 from players.models import Player
 from players.serializers import PlayerSerializer
 
 
-class TeamViewSet(viewsets.ReadOnlyModelViewSet):
+class TeamViewSet(
+    SnapshotListMixin, ConditionalGetMixin, viewsets.ReadOnlyModelViewSet
+):
     """
     팀 정보 조회 API
     - list: 팀 목록 조회
     - retrieve: 팀 상세 조회
     - players: 팀 소속 선수 목록
+    - stats: 전체 팀 시즌 통계 (홈/원정, 클린시트, 전/후반 득실점, 연속 기록)
     """
 
     queryset = Team.objects.all()
@@ -31,19 +47,27 @@ class TeamViewSet(viewsets.ReadOnlyModelViewSet):
     search_fields = ["team_name", "league"]
     ordering_fields = ["team_name"]
     ordering = ["team_name"]
+    snapshot_name = "teams"
 
     def get_serializer_class(self):
         if self.action == "retrieve":
             return TeamDetailSerializer
         return TeamSerializer
 
+    def get_conditional_models(self):
+        if self.action in ("stats", "team_stats"):
+            return [Match]
+        return super().get_conditional_models()
+
     @action(detail=True, methods=["get"])
     def players(self, request, pk=None):
         """
         팀 소속 선수 목록 조회
         """
         team = self.get_object()
-        players = Player.objects.filter(team_id=team.team_id)
+        players = Player.objects.filter(team_id=team.team_id).only(
+            *PlayerSerializer.Meta.fields
+        )
 
         # 포지션별 필터
         position = request.query_params.get("position", None)
@@ -53,6 +77,27 @@ class TeamViewSet(viewsets.ReadOnlyModelViewSet):
         serializer = PlayerSerializer(players, many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=["get"])
+    def stats(self, request):
+        """전체 팀 시즌 통계 (종료 경기 SQL 집계 1번, 경기 데이터 버전별 캐시)"""
+        return self.conditional_response(request, lambda request: Response(get_stats()))
+
+    @action(detail=True, methods=["get"], url_path="stats")
+    def team_stats(self, request, pk=None):
+        """팀 1개 시즌 통계 (전체 팀 통계 캐시에서 찾음)"""
+        # 없는 팀은 If-None-Match 가 맞아도 304 가 아니라 404
+        team = self.get_object()
+        return self.conditional_response(request, self.team_stats_response, team)
+
+    def team_stats_response(self, request, team):
+        result = get_stats()
+        for row in result["teams"]:
+            if row["team_id"] == team.team_id:
+                return Response({"data_version": result["data_version"], **row})
+        return Response(
+            {"error": "종료된 경기 기록이 없습니다."}, status=status.HTTP_404_NOT_FOUND
+        )
+
     @action(detail=False, methods=["get"])
     def search(self, request):
         """
@@ -75,20 +120,50 @@ class TeamViewSet(viewsets.ReadOnlyModelViewSet):
         return Response(serializer.data)
 
 
-class StaffViewSet(viewsets.ReadOnlyModelViewSet):
+class StaffViewSet(
+    FacetsMixin,
+    FullTextSearchMixin,
+    SparseFieldsetMixin,
+    SnapshotListMixin,
+    ConditionalGetMixin,
+    RowSerializerMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """
     감독/코치 정보 조회 API
-    - list: 감독/코치 목록 조회
+    - list: 감독/코치 목록 조회 (?cursor, ?page_size 커서 페이지네이션 / ?fields 필드 선택)
+      ?position=Manager&team=Arsenal 등 필터 (teams/filters.py)
     - retrieve: 감독/코치 상세 조회
-    - search: 감독/코치 검색
+    - search: 감독/코치 검색 (검색 인덱스, ?q= 는 관련도순)
+    - facets: 포지션/국적/팀별 인원 수 (목록과 같은 필터 적용)
     """
 
     queryset = Staff.objects.all()
     serializer_class = StaffSerializer
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    pagination_class = StaffCursorPagination
+    renderer_classes = FAST_RENDERER_CLASSES
+    snapshot_name = "staff"
+    filter_backends = [
+        DjangoFilterBackend,
+        FullTextSearchFilter,
+        filters.OrderingFilter,
+    ]
+    filterset_class = StaffFilter
     search_fields = ["name", "team_name", "position", "nationality"]
+    search_index = "staff"
+    search_params = {
+        "name": ("name", "name"),
+        "team": ("team", "team_name"),
+        "position": ("position", "position"),
+        "nationality": ("nationality", "nationality"),
+    }
     ordering_fields = ["name", "team_name", "position"]
     ordering = ["team_name", "position"]
+    facet_fields = {
+        "position": "position",
+        "nationality": "nationality",
+        "team": "team_name",
+    }
 
     def get_serializer_class(self):
         if self.action == "retrieve":
@@ -99,41 +174,19 @@ class StaffViewSet(viewsets.ReadOnlyModelViewSet):
     def search(self, request):
         """
         감독/코치 검색
-        query params: name, team, position, nationality
+        query params: q, name, team, position, nationality
+        - q: 이름/팀/포지션/국적 전체 검색, 관련도순 (?page, ?page_size)
+        - name, team, position, nationality: 해당 항목 검색 (단어 앞부분 일치)
         """
-        queryset = self.get_queryset()
-
-        # 이름 검색
-        name = request.query_params.get("name", None)
-        if name:
-            queryset = queryset.filter(name__icontains=name)
-
-        # 팀 검색
-        team = request.query_params.get("team", None)
-        if team:
-            queryset = queryset.filter(team_name__icontains=team)
-
-        # 포지션 검색
-        position = request.query_params.get("position", None)
-        if position:
-            queryset = queryset.filter(position__icontains=position)
-
-        # 국적 검색
-        nationality = request.query_params.get("nationality", None)
-        if nationality:
-            queryset = queryset.filter(nationality__icontains=nationality)
-
-        # 페이지네이션 적용
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return self.search_response(request)
 
 
-class TeamStandingViewSet(viewsets.ReadOnlyModelViewSet):
+class TeamStandingViewSet(
+    SnapshotListMixin,
+    ConditionalGetMixin,
+    RowSerializerMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """
     팀 순위표 조회 API
     - list: 순위표 전체 조회
@@ -143,6 +196,8 @@ class TeamStandingViewSet(viewsets.ReadOnlyModelViewSet):
 
     queryset = TeamStanding.objects.all()
     serializer_class = TeamStandingSerializer
+    renderer_classes = FAST_RENDERER_CLASSES
+    snapshot_name = "standings"
 
     def list(self, request, *args, **kwargs):
         """
@@ -158,7 +213,7 @@ class TeamStandingViewSet(viewsets.ReadOnlyModelViewSet):
         csv_dir = os.path.join(settings.BASE_DIR, "data", "standings")
         today = date.today()
         csv_filename = os.path.join(
-            csv_dir, f'epl_standings_{today.strftime("%Y_%m_%d")}.csv'
+            csv_dir, f"epl_standings_{today.strftime('%Y_%m_%d')}.csv"
         )
 
         # 오늘 날짜 CSV 파일이 없으면 업데이트 실행
@@ -165,21 +165,22 @@ const TeamSearch = {
       loading.value = true;
       error.value = null;
       try {
-        // 팀 데이터와 순위표(로고 정보) 동시 요청
-        const [teamsRes, standingsRes] = await Promise.all([
-          fetch(`${API_BASE_URL}/teams/`),
-          fetch(`${API_BASE_URL}/standings/`)
-        ]);
-        
-        if (!teamsRes.ok) throw new Error('데이터를 불러오는데 실패했습니다.');
-        
-        const teamsData = await teamsRes.json();
-        teams.value = parseApiResponse(teamsData);
+        // 팀 데이터와 순위표(로고 정보)를 배치 API 한 번으로 요청
+        const params = new URLSearchParams({
+          teams: '/api/teams/',
+          standings: '/api/standings/'
+        });
+        const response = await fetch(`${API_BASE_URL}/batch/?${params}`);
+        if (!response.ok) throw new Error('데이터를 불러오는데 실패했습니다.');
+
+        const batch = await response.json();
+        if (batch.teams.status !== 200) throw new Error('데이터를 불러오는데 실패했습니다.');
+
+        teams.value = parseApiResponse(batch.teams.body);
         
         // 순위표에서 팀 로고 매핑
-        if (standingsRes.ok) {
-          const standingsData = await standingsRes.json();
-          const standings = parseApiResponse(standingsData);
+        if (batch.standings.status === 200) {
+          const standings = parseApiResponse(batch.standings.body);
           standings.forEach(s => {
             if (s.team_logo) {
               teamLogos.value[s.team_name] = s.team_logo;